@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Benchmark : coût de chaque backend numérique (float, decimal, fraction, int)
+
+Usage : python benchmarks/bench_backends.py [nombre_de_séquences]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from calculator import BACKEND_NAMES, Calculator
+from bench_feed import make_sequences
+
+
+WORKLOADS = {
+    "saisie mixte": None,  # Séquences aléatoires de bench_feed
+    "entiers * +": ["12*34+56*7-89="],
+    "racines": ["144√+2√="],
+    "carrés": ["123456789²²²"],
+}
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    mixed = make_sequences(count)
+
+    print(f"{'':<14}" + "".join(f"{name:>12}" for name in BACKEND_NAMES) + "   (µs par séquence)")
+    for label, sequences in WORKLOADS.items():
+        sequences = mixed if sequences is None else sequences * count
+        row = []
+        for backend in BACKEND_NAMES:
+            calculator = Calculator(backend)
+            start = time.perf_counter()
+            for keys in sequences:
+                calculator.reset()
+                calculator.feed(keys)
+            row.append((time.perf_counter() - start) / len(sequences) * 1e6)
+        print(f"{label:<14}" + "".join(f"{us:12.2f}" for us in row))
+
+
+if __name__ == "__main__":
+    main()
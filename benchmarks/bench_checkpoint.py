@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark : point de reprise binaire face à pickle et JSON
+
+N calculatrices dans des états variés (saisie en cours, opération en
+attente, résultat) sont sauvegardées puis recréées. On compare le temps
+d'écriture, le temps de chargement (fichier -> liste de Calculator) et la
+taille du fichier. pickle et JSON sauvegardent (backend, précision,
+snapshot()) : un objet Calculator ne se picklise pas (opérations en lambda).
+
+On mesure aussi la lecture d'une seule calculatrice (mmap, sans tout
+décoder), puis un point de reprise limité aux calculatrices modifiées (1 %) est
+comparé à une réécriture complète.
+
+Le ramasse-miettes est coupé pendant les mesures pour les trois formats
+(comme timeit), pour comparer les formats et non les passes du GC.
+
+Usage : python benchmarks/bench_checkpoint.py [nombre_de_calculatrices]   (10^6 par défaut)
+"""
+
+import gc
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from calculator import Calculator, calculator_from_snapshot
+from checkpoint import CheckpointReader, CheckpointWriter, load_calculators, save_calculators
+
+
+def make_calculators(count: int):
+    keys = ("12.5+3", "7*", "42", "9√=", "1/4", "3.14159")
+    calculators = [Calculator() for _ in range(count)]
+    for i, calc in enumerate(calculators):
+        calc.feed(keys[i % len(keys)] + str(i % 1000))
+    return calculators
+
+
+def states(calculators):
+    return [(calc.backend, calc._backend.precision, calc.snapshot()) for calc in calculators]
+
+
+def rebuild(saved):
+    """Même construction que le format binaire (calculator_from_snapshot)"""
+    return [calculator_from_snapshot(tuple(snapshot), backend, precision) for backend, precision, snapshot in saved]
+
+
+def save_pickle(path, calculators):
+    with open(path, "wb") as f:
+        pickle.dump(states(calculators), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_pickle(path):
+    with open(path, "rb") as f:
+        return rebuild(pickle.load(f))
+
+
+def save_json(path, calculators):
+    with open(path, "w") as f:
+        json.dump(states(calculators), f)
+
+
+def load_json(path):
+    with open(path) as f:
+        return rebuild(json.load(f))
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    count = int(float(sys.argv[1])) if len(sys.argv) > 1 else 1_000_000
+    calculators = make_calculators(count)
+    expected = [calc.snapshot() for calc in calculators]
+    formats = {
+        "binaire (checkpoint)": (save_calculators, load_calculators),
+        "pickle": (save_pickle, load_pickle),
+        "JSON": (save_json, load_json),
+    }
+    print(f"{count:,} calculatrices")
+    print(f"{'':<22}{'écriture s':>12}{'chargement s':>14}{'taille':>12}{'octets/calc':>13}")
+    gc.disable()
+    with tempfile.TemporaryDirectory() as directory:
+        for label, (save, load) in formats.items():
+            path = os.path.join(directory, "etat")
+            _, save_time = timed(save, path, calculators)
+            loaded, load_time = timed(load, path)
+            assert [calc.snapshot() for calc in loaded] == expected, label
+            del loaded
+            size = os.path.getsize(path)
+            print(f"{label:<22}{save_time:12.3f}{load_time:14.3f}{size / 2 ** 20:9.1f} Mio{size / count:13.1f}")
+            if label.startswith("binaire"):
+                # Une seule calculatrice : mmap, sans décoder le reste du fichier
+                start = time.perf_counter()
+                with CheckpointReader(path) as reader:
+                    assert reader[count // 2].snapshot() == expected[count // 2]
+                single = time.perf_counter() - start
+
+        # Point de reprise limité aux calculatrices modifiées
+        path = os.path.join(directory, "incremental")
+        writer = CheckpointWriter(path)
+        writer.checkpoint(calculators)
+        full_size = os.path.getsize(path)
+        for calc in calculators[::100]:
+            calc.feed("5")
+        written, delta_time = timed(writer.checkpoint, calculators)
+        delta_size = os.path.getsize(path) - full_size
+        _, full_time = timed(save_calculators, os.path.join(directory, "complet"), calculators)
+        print(f"\nUne calculatrice lue dans le fichier binaire : {single * 1e3:.2f} ms")
+        print(f"1 % modifiées : delta de {written:,} enregistrements en {delta_time:.3f} s "
+              f"({delta_size / 1024:.0f} Kio), réécriture complète en {full_time:.3f} s ({full_size / 2 ** 20:.1f} Mio)")
+    gc.enable()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark : coût de dispatch par opération, chaîne if/elif contre registre
+
+Usage : python benchmarks/bench_dispatch.py [itérations]
+"""
+
+import math
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from calculator import Calculator, register_operator, unregister_operator
+
+
+def legacy_perform_calculation(prev, current, operation):
+    """Ancienne version de Calculator._perform_calculation (chaîne if/elif)"""
+    try:
+        if operation == "+":
+            return prev + current
+        elif operation == "-":
+            return prev - current
+        elif operation == "*":
+            return prev * current
+        elif operation == "/":
+            if current == 0:
+                return None
+            return prev / current
+        elif operation == "√":
+            if current < 0:
+                return None
+            return math.sqrt(current)
+        elif operation == "x²":
+            return current ** 2
+        return None
+    except (ValueError, OverflowError, ArithmeticError):
+        return None
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    registry = Calculator()._perform_calculation
+
+    def measure(function, operation):
+        seconds = min(timeit.repeat(lambda: function(12.5, 3.0, operation), number=number, repeat=3))
+        return seconds / number * 1e9
+
+    operations = ("+", "-", "*", "/", "√", "x²")
+    before = {op: measure(legacy_perform_calculation, op) for op in operations}
+    after = {op: measure(registry, op) for op in operations}
+
+    # Le coût du registre ne dépend pas du nombre d'opérations enregistrées
+    extra = [f"f{i}" for i in range(50)]
+    for symbol in extra:
+        register_operator(symbol, 1, 3, math.sin)
+    crowded = {op: measure(registry, op) for op in operations}
+    for symbol in extra:
+        unregister_operator(symbol)
+
+    print(f"{'op':>3}  {'if/elif':>10}  {'registre':>10}  {'+50 ops':>10}   (ns par appel)")
+    for op in operations:
+        print(f"{op:>3}  {before[op]:10.1f}  {after[op]:10.1f}  {crowded[op]:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Benchmark : réévaluation d'expressions compilées (cache LRU) contre recompilation
+
+Usage : python benchmarks/bench_expression.py [nombre_d_évaluations]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from expression import CompiledExpression, ExpressionCache
+
+
+FORMULAS = [
+    "prix * qte",
+    "prix * qte * (1 + tva)",
+    "(a - b) / b",
+    "√(a² + b²)",
+    "a * 1.2 + b / 3 - 7",
+]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(42)
+    workload = []
+    for _ in range(count):
+        source = rng.choice(FORMULAS)
+        values = {"prix": rng.uniform(1, 100), "qte": rng.randint(1, 50), "tva": 0.2,
+                  "a": rng.uniform(1, 100), "b": rng.uniform(1, 100)}
+        workload.append((source, values))
+
+    start = time.perf_counter()
+    for source, values in workload:
+        CompiledExpression(source).evaluate(values)
+    uncached = time.perf_counter() - start
+
+    cache = ExpressionCache()
+    start = time.perf_counter()
+    for source, values in workload:
+        cache.get(source).evaluate(values)
+    cached = time.perf_counter() - start
+
+    print(f"{count} évaluations, {len(FORMULAS)} formules")
+    print(f"  sans cache : {uncached:.3f} s  ({count / uncached:,.0f} éval/s)")
+    print(f"  avec cache : {cached:.3f} s  ({count / cached:,.0f} éval/s)  {cache.info()}")
+    print(f"Accélération : x{uncached / cached:.1f}")
+
+
+if __name__ == "__main__":
+    main()
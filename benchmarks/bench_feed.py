@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark : Calculator.feed() contre la saisie touche par touche
+
+Usage : python benchmarks/bench_feed.py [nombre_de_séquences]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from calculator import Calculator
+
+
+def make_sequences(count: int, seed: int = 42) -> list:
+    """Génère des séquences de touches aléatoires du type "12.5*3-7/2=" """
+    rng = random.Random(seed)
+    sequences = []
+    for _ in range(count):
+        keys = []
+        for i in range(rng.randint(2, 6)):
+            if i:
+                keys.append(rng.choice("+-*/"))
+            keys.extend(str(rng.randint(0, 999)))
+            if rng.random() < 0.3:
+                keys.append(".")
+                keys.extend(str(rng.randint(0, 99)))
+        keys.append("=")
+        sequences.append("".join(keys))
+    return sequences
+
+
+def run_key_by_key(sequences: list) -> None:
+    """Chemin historique : un appel de méthode par touche"""
+    for keys in sequences:
+        calc = Calculator()
+        for key in keys:
+            if key.isdigit():
+                calc.input_number(key)
+            elif key == ".":
+                calc.input_decimal()
+            elif key == "=":
+                calc.calculate_result()
+            else:
+                calc.input_operation(key)
+
+
+def run_feed(sequences: list) -> None:
+    """Chemin en lot : une boucle par séquence"""
+    for keys in sequences:
+        Calculator().feed(keys)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    sequences = make_sequences(count)
+    total_keys = sum(len(keys) for keys in sequences)
+    print(f"{count} séquences, {total_keys} touches")
+
+    timings = {}
+    for name, runner in (("touche par touche", run_key_by_key), ("feed()", run_feed)):
+        start = time.perf_counter()
+        runner(sequences)
+        timings[name] = time.perf_counter() - start
+        print(f"{name:>18} : {timings[name]:.3f} s  ({total_keys / timings[name]:,.0f} touches/s)")
+
+    print(f"Accélération : x{timings['touche par touche'] / timings['feed()']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Benchmark : construction de CalculatorGUI, phase par phase
+
+Construit la fenêtre plusieurs fois et affiche la médiane de chaque phase
+(thème, _setup_window, _create_widgets, contenu différé de la barre de
+statut, première inactivité). Avec un écran (ou xvfb-run) la vraie
+CustomTkinter est utilisée, sinon le faux module de benchmarks/fake_ctk.py
+(on ne mesure alors que le coût Python de la construction).
+
+Usage :
+    python benchmarks/bench_gui_startup.py [répétitions]
+    xvfb-run python benchmarks/bench_gui_startup.py 20
+    python src/main.py --profile-startup     # Un seul démarrage réel, imports compris
+"""
+
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from suite import _make_gui
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    phases = {}
+    backend = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        gui, backend = _make_gui("auto")
+        constructed = time.perf_counter()
+        gui.root.update()  # Premier passage de la boucle : rendu et contenu différé
+        times = dict(gui.startup_times)
+        times["first idle"] = time.perf_counter() - gui.constructed_at
+        times["total"] = time.perf_counter() - start
+        times["construction"] = constructed - start
+        for name, seconds in times.items():
+            phases.setdefault(name, []).append(seconds)
+        gui.root.destroy()
+
+    print(f"CalculatorGUI ({backend}), médiane sur {repeat} constructions :")
+    for name, samples in phases.items():
+        print(f"  {name:<30} {statistics.median(samples) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
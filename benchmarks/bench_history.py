@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark : mémoire et latence de l'historique sur une session de 10^6 touches
+
+Usage : python benchmarks/bench_history.py [nombre_de_touches]
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from calculator import Calculator
+from history import UndoHistory
+
+
+def make_keys(count: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    keys = []
+    while len(keys) < count:
+        keys.extend(str(rng.randint(1, 9999)))
+        keys.append(rng.choice("+-*/="))
+    return keys[:count]
+
+
+def replay(keys: list, capacity: int):
+    calculator = Calculator()
+    history = UndoHistory(calculator, capacity)
+    feed = calculator.feed
+    for key in keys:
+        feed(key)
+        history.checkpoint()
+    return history
+
+
+def run(keys: list, capacity: int) -> None:
+    # Mémoire (sous tracemalloc), puis temps (sans)
+    tracemalloc.start()
+    history = replay(keys, capacity)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del history
+
+    start = time.perf_counter()
+    history = replay(keys, capacity)
+    elapsed = time.perf_counter() - start
+
+    steps = min(len(history) - 1, 10_000)
+    start = time.perf_counter()
+    for _ in range(steps):
+        history.undo()
+    undo = (time.perf_counter() - start) / steps
+    start = time.perf_counter()
+    for _ in range(steps):
+        history.redo()
+    redo = (time.perf_counter() - start) / steps
+
+    print(f"  capacité {capacity:>9,} : {len(history):>9,} états  {memory / 1e6:8.2f} Mo   "
+          f"touche+checkpoint {elapsed / len(keys) * 1e6:5.2f} µs   "
+          f"undo {undo * 1e9:6.0f} ns   redo {redo * 1e9:6.0f} ns")
+
+
+def main():
+    count = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 6
+    keys = make_keys(count)
+    print(f"Session de {count:,} touches")
+    for capacity in (100, 10_000, count):
+        run(keys, capacity)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Benchmark : surcoût de l'instrumentation, désactivée puis activée
+
+Usage : python benchmarks/bench_instrumentation.py [nombre_de_séquences]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import instrumentation
+from bench_feed import make_sequences, run_key_by_key
+
+
+def timed(sequences: list) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        run_key_by_key(sequences)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    sequences = make_sequences(count)
+
+    never = timed(sequences)
+    instrumentation.enable()
+    enabled = timed(sequences)
+    instrumentation.disable()
+    disabled = timed(sequences)
+
+    print(f"{count} séquences touche par touche")
+    print(f"  jamais activée      : {never:.3f} s")
+    print(f"  activée             : {enabled:.3f} s  ({(enabled / never - 1) * 100:+.1f} %)")
+    print(f"  activée puis coupée : {disabled:.3f} s  ({(disabled / never - 1) * 100:+.1f} %)")
+    print(f"  appels mesurés      : {sum(instrumentation.metrics.calls.values()):,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark : coût du cache des calculs selon le taux de succès
+
+Compare Calculator, MemoizedCalculator avec CalculationCache (LRU) et avec
+SharedCalculationCache, sur des calculs dont une part connue se répète.
+
+Usage : python benchmarks/bench_memo.py [nombre_de_calculs]
+"""
+
+import gc
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from calculator import Calculator
+from memo import CalculationCache, MemoizedCalculator, SharedCalculationCache
+
+
+HIT_RATIOS = (0.0, 0.5, 0.9, 0.99)
+# (backend, précision, opérations) : du calcul le moins cher au plus cher
+WORKLOADS = (
+    ("float", 28, "+-*/"),
+    ("decimal", 28, "+-*/"),
+    ("fraction", 28, "+-*/"),
+    ("decimal", 200, "/√"),
+)
+
+
+def make_calls(count: int, hit_ratio: float, operations: str, seed: int = 42) -> list:
+    """Calculs (précédent, actuel, opération) dont environ hit_ratio sont des répétitions"""
+    rng = random.Random(seed)
+    calls = []
+    for _ in range(count):
+        if calls and rng.random() < hit_ratio:
+            calls.append(rng.choice(calls[:1000]))  # Taux de change, TVA... déjà vus
+        else:
+            calls.append((round(rng.uniform(1, 1e4), 2), round(rng.uniform(1, 10), 4), rng.choice(operations)))
+    return calls
+
+
+def timed(make_calculator, calls: list):
+    """ns par calcul sur un calculateur neuf (après un tour de chauffe sur un autre)"""
+    for calculator in (make_calculator(), make_calculator()):
+        elapsed = _run(calculator, calls)
+    return elapsed, calculator
+
+
+def _run(calculator, calls: list) -> float:
+    calculate = calculator._perform_calculation
+    gc.disable()  # Comme timeit : le ramasse-miettes fausserait la comparaison
+    try:
+        start = time.perf_counter()
+        for prev, current, operation in calls:
+            calculate(prev, current, operation)
+        return (time.perf_counter() - start) / len(calls) * 1e9
+    finally:
+        gc.enable()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    for backend, precision, operations in WORKLOADS:
+        parse = Calculator(backend, precision)._parse
+        print(f"Backend {backend}, précision {precision}, opérations {operations} (ns par calcul)")
+        print(f"  {'succès':>8} {'sans cache':>12} {'LRU':>10} {'partagé':>10} {'taux LRU':>10}")
+        for ratio in HIT_RATIOS:
+            calls = [(parse(repr(p)), parse(repr(c)), op) for p, c, op in make_calls(count, ratio, operations)]
+            plain, _ = timed(lambda: Calculator(backend, precision), calls)
+            lru_time, lru = timed(lambda: MemoizedCalculator(CalculationCache(count), backend, precision), calls)
+            row = f"  {ratio:>8.0%} {plain:>12.0f} {lru_time:>10.0f}"
+            if backend == "float":
+                shared_caches = []
+
+                def make_shared():
+                    shared_caches.append(SharedCalculationCache(slots=2 * count))
+                    return MemoizedCalculator(shared_caches[-1])
+
+                row += f" {timed(make_shared, calls)[0]:>10.0f}"
+                for shared in shared_caches:
+                    shared.close()
+            else:
+                row += f" {'-':>10}"
+            print(row + f" {lru.cache.info()['hit_rate']:>10.1%}")
+
+
+if __name__ == "__main__":
+    main()
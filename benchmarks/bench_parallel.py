@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Benchmark : débit de l'évaluation parallèle à 1, 2, 4 et N processus
+
+Usage : python benchmarks/bench_parallel.py [nombre_de_lignes]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from parallel import run_parallel
+
+
+def write_workload(path: str, count: int, seed: int = 42) -> None:
+    """Écrit un fichier d'expressions aléatoires"""
+    rng = random.Random(seed)
+    templates = ["{a}+{b}*{c}", "({a}-{b})/{c}", "√{a}+{b}²", "{a}*{b}*{c}-{a}/{b}"]
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(count):
+            template = rng.choice(templates)
+            f.write(template.format(a=rng.randint(0, 999), b=rng.randint(0, 99), c=rng.randint(0, 9)) + "\n")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, cores})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "calculs.txt")
+        write_workload(path, count)
+        size = os.path.getsize(path)
+        print(f"{count:,} lignes ({size / 1e6:.1f} Mo), {cores} coeur(s)")
+
+        baseline = None
+        for workers in worker_counts:
+            with open(os.devnull, "wb") as output:
+                start = time.perf_counter()
+                run_parallel(path, output, workers=workers, chunk_size=max(size // (workers * 8), 1))
+                elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"  {workers:>3} worker(s) : {elapsed:7.3f} s  {count / elapsed:12,.0f} lignes/s  x{baseline / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark : planificateur de lots (préfixes partagés) face à l'évaluation ligne par ligne
+
+Charges synthétiques de N séquences de touches en chaîne ("12.5+3*7-...=") :
+une part (0 %, 50 %, 90 %) des touches de chaque ligne est un préfixe pris
+dans un petit groupe de préfixes communs, le reste est propre à la ligne.
+Même principe pour les expressions : une part des lignes répète une
+expression déjà vue.
+
+On compare iter_results (une ligne après l'autre) et BatchPlanner : meilleur
+temps sur trois passes, accélération et part du travail évitée
+(info()["saved"]). Les résultats doivent être identiques.
+
+Usage : python benchmarks/bench_planner.py [nombre_de_lignes]   (10^5 par défaut)
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from batch import iter_results
+from planner import BatchPlanner
+
+
+OVERLAPS = (0.0, 0.5, 0.9)
+OPERATIONS = 12      # Opérations par séquence
+PREFIX_POOL = 64     # Préfixes communs distincts
+
+
+def random_chain(rng: random.Random, operations: int) -> str:
+    """Suite "nombre opération nombre..." sans "=" final"""
+    parts = []
+    for _ in range(operations):
+        parts.append(f"{rng.randrange(1, 1000)}.{rng.randrange(10)}")
+        parts.append(rng.choice("+-*/"))
+    return "".join(parts)
+
+
+def key_workload(count: int, overlap: float, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    shared = round(OPERATIONS * overlap)
+    prefixes = [random_chain(rng, shared) for _ in range(PREFIX_POOL)]
+    return [rng.choice(prefixes) + random_chain(rng, OPERATIONS - shared) + "1=" for _ in range(count)]
+
+
+def expression_workload(count: int, overlap: float, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        if lines and rng.random() < overlap:
+            lines.append(rng.choice(lines))
+        else:
+            a, b, c = (rng.randrange(1, 1000) for _ in range(3))
+            lines.append(f"({a}+{b})*{c}/7-{a}")
+    return lines
+
+
+def timed(function, lines, repeat: int = 3):
+    """Meilleur temps sur repeat passes (machine partagée : on écarte le bruit)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = function(lines)
+        best = min(best, time.perf_counter() - start)
+    return results, best
+
+
+def main():
+    count = int(float(sys.argv[1])) if len(sys.argv) > 1 else 100_000
+    print(f"{count:,} lignes ; séquences de {OPERATIONS} opérations, {PREFIX_POOL} préfixes communs")
+    print(f"{'':<12}{'recouvrement':>13}{'ligne à ligne s':>17}{'planifié s':>12}{'accélération':>14}{'évité':>8}")
+    for label, workload, keys in (("touches", key_workload, True), ("expressions", expression_workload, False)):
+        for overlap in OVERLAPS:
+            lines = workload(count, overlap)
+            expected, naive_time = timed(lambda lines: list(iter_results(lines, keys=keys)), lines)
+            planner = BatchPlanner(keys=keys)
+            results, planned_time = timed(planner.evaluate, lines)
+            assert results == expected, (label, overlap)
+            print(f"{label:<12}{overlap:>12.0%}{naive_time:17.3f}{planned_time:12.3f}"
+                  f"{naive_time / planned_time:13.2f}x{planner.info()['saved']:8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark : mode programmeur (entiers) face au chemin float de Calculator
+
+Les mêmes séquences de touches (grands entiers, proches de 2^60) passent par
+Calculator (float), Calculator("int") et ProgrammerCalculator en 64 bits et
+en entiers illimités. On mesure le temps par séquence et on compte les
+résultats faux du chemin float (arrondis au-delà de 2^53).
+
+Usage : python benchmarks/bench_programmer.py [nombre_de_séquences]
+"""
+
+import os
+import random
+import sys
+import time
+from decimal import Decimal, InvalidOperation
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from calculator import Calculator
+from programmer import ProgrammerCalculator
+
+
+def make_sequences(count: int, seed: int = 42):
+    """Séquences "a+b-c*d=" sur des entiers de 15 à 19 chiffres"""
+    rng = random.Random(seed)
+    sequences = []
+    for _ in range(count):
+        a, b, c = (str(rng.randrange(10 ** 15, 10 ** 18)) for _ in range(3))
+        sequences.append(list(f"{a}+{b}-{c}*3="))
+    return sequences
+
+
+def exact(keys) -> int:
+    """Résultat attendu (calcul de gauche à droite, comme la calculatrice)"""
+    a, rest = "".join(keys[:-1]).split("+")
+    b, rest = rest.split("-")
+    c, d = rest.split("*")
+    return (int(a) + int(b) - int(c)) * int(d)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    sequences = make_sequences(count)
+    expected = [exact(keys) for keys in sequences]
+    contenders = {
+        "float": Calculator(),
+        "int (Calculator)": Calculator("int"),
+        "programmeur 64 bits": ProgrammerCalculator(word_size=64),
+        "programmeur illimité": ProgrammerCalculator(word_size=None),
+    }
+
+    print(f"{count} séquences de {len(sequences[0])} touches environ")
+    print(f"{'':<22}{'µs/séquence':>12}{'résultats faux':>16}")
+    for label, calculator in contenders.items():
+        results = []
+        start = time.perf_counter()
+        for keys in sequences:
+            calculator.reset()
+            results.append(calculator.feed(keys))
+        elapsed = time.perf_counter() - start
+        wrong = 0
+        for result, value in zip(results, expected):
+            if label == "programmeur 64 bits":
+                value = (value + (1 << 63)) % (1 << 64) - (1 << 63)  # Débordement 64 bits voulu
+            try:
+                wrong += Decimal(result) != value  # "1.23e+18" (float) comme "1230..." (int)
+            except InvalidOperation:
+                wrong += 1  # "Erreur"
+        print(f"{label:<22}{elapsed / count * 1e6:12.2f}{wrong:16}")
+
+    # Opérations bit à bit seules (sans équivalent float)
+    calculator = ProgrammerCalculator(word_size=64, base=16)
+    keys = list("FFFF0000FFFF0000") + ["AND"] + list("0F0F0F0F0F0F0F0F") + ["XOR"] + list("1234") + ["<<", "4", "="]
+    start = time.perf_counter()
+    for _ in range(count):
+        calculator.reset()
+        calculator.feed(keys)
+    print(f"{'AND / XOR / << (HEX)':<22}{(time.perf_counter() - start) / count * 1e6:12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark : évaluation RPN de programmes d'un million de mots
+
+Deux programmes :
+- profond : N/2 nombres empilés puis N/2 - 1 additions (pile de N/2 niveaux)
+- plat : "a b + c *" répété (pile de 2 niveaux au plus)
+
+evaluate_rpn (pile array('d') préallouée) est comparé à un évaluateur de
+référence sur une liste Python (append / pop d'objets float) : temps, mots/s
+et pic de mémoire de la pile (tracemalloc).
+
+Usage : python benchmarks/bench_rpn.py [nombre_de_mots]
+"""
+
+import operator
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from rpn import RPNStack, evaluate_rpn
+
+
+def list_evaluate(tokens):
+    """Référence naïve : pile dans une liste Python"""
+    binary = {"+": operator.add, "-": operator.sub, "*": operator.mul}
+    stack = []
+    push, pop = stack.append, stack.pop
+    for token in tokens:
+        function = binary.get(token)
+        if function is None:
+            push(float(token))
+        else:
+            right = pop()
+            push(function(pop(), right))
+    return stack[-1]
+
+
+def programs(count: int) -> dict:
+    half = count // 2
+    deep = [str(i % 97) for i in range(half)] + ["+"] * (half - 1)
+    flat = (["3", "4", "+", "2", "*"] + ["5", "-"] * 2) * (count // 9)
+    return {"profond": deep, "plat": flat}
+
+
+def measure(function, tokens):
+    """Temps sans tracemalloc (qui ralentit chaque allocation), puis pic mémoire dans une seconde passe"""
+    start = time.perf_counter()
+    result = function(tokens)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    function(tokens)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    count = int(float(sys.argv[1])) if len(sys.argv) > 1 else 1_000_000
+    contenders = {
+        "array('d') préallouée": lambda tokens: evaluate_rpn(tokens, RPNStack(len(tokens) // 2 + 1)),
+        "array('d') sans préallocation": evaluate_rpn,
+        "liste Python": list_evaluate,
+    }
+    print(f"{'':<10}{'évaluateur':<32}{'s':>8}{'mots/s':>14}{'pic mémoire':>14}")
+    for name, tokens in programs(count).items():
+        expected = None
+        for label, function in contenders.items():
+            # Une passe à vide (chauffe) puis la mesure
+            function(tokens)
+            result, elapsed, peak = measure(function, tokens)
+            if expected is None:
+                expected = result
+            assert result == expected, (label, result, expected)
+            print(f"{name:<10}{label:<32}{elapsed:8.3f}{len(tokens) / elapsed:14,.0f}{peak / 1024:11.0f} Kio")
+
+
+if __name__ == "__main__":
+    main()
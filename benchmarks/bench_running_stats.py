@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark : statistiques au fil de l'eau sur un très long flot de nombres
+
+Les valeurs (montants log-normaux, un sur dix négatif) sont générées par
+paquets et poussées dans RunningStats sans jamais être gardées. À chaque
+puissance de dix, on affiche le débit et la mémoire résidente maximale du
+processus : elle doit rester plate, quel que soit le nombre de valeurs.
+
+Usage : python benchmarks/bench_running_stats.py [nombre_de_valeurs]   (défaut : 10^8)
+"""
+
+import os
+import random
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from running_stats import RunningStats
+
+
+BATCH = 100_000  # Valeurs générées à la fois (seule mémoire proportionnelle)
+
+
+def max_rss_mib() -> float:
+    """Mémoire résidente maximale du processus (Mio)"""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+def main() -> None:
+    total = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 8
+    rng = random.Random(42)
+    lognormvariate = rng.lognormvariate
+    stats = RunningStats()
+    checkpoint = 10 ** 4
+    start = time.perf_counter()
+    print(f"{'valeurs':>12} {'s':>9} {'valeurs/s':>12} {'RSS max (Mio)':>14} {'cases':>6}")
+    while stats.count < total:
+        size = min(BATCH, total - stats.count)
+        batch = [lognormvariate(3, 1) for _ in range(size)]
+        batch[::10] = [-value for value in batch[::10]]
+        stats.extend(batch)
+        del batch
+        if stats.count >= checkpoint or stats.count == total:
+            elapsed = time.perf_counter() - start
+            buckets = len(stats._positive) + len(stats._negative)
+            print(f"{stats.count:>12,} {elapsed:>9.2f} {stats.count / elapsed:>12,.0f} "
+                  f"{max_rss_mib():>14.1f} {buckets:>6}")
+            while checkpoint <= stats.count:
+                checkpoint *= 10
+    print()
+    print(f"somme {stats.sum:.12g}  moyenne {stats.mean:.6g}  écart-type {stats.stdev():.6g}")
+    print(f"p50 {stats.percentile(50):.6g}  p90 {stats.percentile(90):.6g}  p99 {stats.percentile(99):.6g}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test de charge : requêtes/s et latences p50/p99 du serveur de calcul en local
+
+Usage : python benchmarks/bench_server.py [clients] [requêtes_par_client] [profondeur_pipeline]
+    Sans serveur lancé à part, un serveur est démarré dans le même processus.
+"""
+
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from server import CalculatorServer
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    index = min(int(len(sorted_values) * fraction), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+async def client(port: int, client_id: int, count: int, depth: int, latencies: list) -> None:
+    """Un client qui garde jusqu'à `depth` requêtes en vol"""
+    rng = random.Random(client_id)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    sent = []
+    for i in range(count):
+        keys = f"{rng.randint(1, 999)}{rng.choice('+-*/')}{rng.randint(1, 99)}="
+        request = {"session": f"client-{client_id}-{i % 50}", "keys": keys}
+        writer.write(json.dumps(request).encode() + b"\n")
+        sent.append(time.perf_counter())
+        if len(sent) >= depth:
+            await writer.drain()
+            for start in sent:
+                await reader.readline()
+                latencies.append(time.perf_counter() - start)
+            sent.clear()
+    await writer.drain()
+    for start in sent:
+        await reader.readline()
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+async def run(clients: int, count: int, depth: int) -> None:
+    server = CalculatorServer()
+    port = await server.start(port=0)
+    latencies = []
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, i, count, depth, latencies) for i in range(clients)))
+    elapsed = time.perf_counter() - start
+    await server.stop()
+
+    latencies.sort()
+    total = clients * count
+    print(f"{clients} clients x {count} requêtes, pipeline {depth}")
+    print(f"  débit   : {total / elapsed:,.0f} requêtes/s")
+    print(f"  latence : p50 {percentile(latencies, 0.50) * 1000:.3f} ms   p99 {percentile(latencies, 0.99) * 1000:.3f} ms")
+    print(f"  pool    : {server.pool.stats()}")
+
+
+def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    depth = int(sys.argv[3]) if len(sys.argv) > 3 else 16
+    asyncio.run(run(clients, count, depth))
+
+
+if __name__ == "__main__":
+    main()
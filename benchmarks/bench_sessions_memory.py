@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark mémoire : N objets Calculator contre une SessionTable de N sessions
+
+Usage : python benchmarks/bench_sessions_memory.py [nombre_de_sessions]   (10^6 par défaut)
+    Chaque mesure tourne dans un processus séparé pour que le RSS soit comparable.
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from calculator import Calculator
+from sessions import SessionTable
+
+
+def build_calculators(count: int):
+    calculators = [Calculator() for _ in range(count)]
+    for i, calc in enumerate(calculators):
+        calc.feed(f"{i}.5+")
+    return calculators
+
+
+def build_table(count: int):
+    table = SessionTable(count)
+    for i in range(count):
+        table.feed(i, f"{i}.5+")
+    return table
+
+
+def measure(kind: str, count: int) -> None:
+    """Mesure dans le processus courant (appelé dans un sous-processus)"""
+    builder = build_calculators if kind == "calculator" else build_table
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    start = time.perf_counter()
+    store = builder(count)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss est en Kio sous Linux
+    print(f"{kind:>12} : {current / count:7.1f} o/session (tracemalloc)   "
+          f"RSS +{(rss_after - rss_before) / 1024:7.1f} Mio   construction {elapsed:.2f} s")
+    del store
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        measure(sys.argv[2], int(sys.argv[3]))
+        return
+
+    count = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 6
+    print(f"{count:,} sessions avec une saisie en cours")
+    for kind in ("calculator", "table"):
+        subprocess.run([sys.executable, __file__, "--child", kind, str(count)], check=True)
+
+
+if __name__ == "__main__":
+    main()
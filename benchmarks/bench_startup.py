@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark : coût de démarrage du mode sans interface (python -X importtime)
+
+Usage : python benchmarks/bench_startup.py [répétitions]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+MAIN = os.path.join(os.path.dirname(__file__), '..', 'src', 'main.py')
+
+
+def import_times(args: list) -> dict:
+    """Lance main.py avec -X importtime et renvoie {module: temps cumulé en µs}"""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", MAIN] + args,
+        input="1+1\n", capture_output=True, text=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.rstrip()] = int(cumulative)
+    return times
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    wall = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, MAIN, "--stdin"], input="1+1\n", capture_output=True, text=True, check=True)
+        wall.append(time.perf_counter() - start)
+
+    times = import_times(["--stdin"])
+    # Un seul espace devant le nom = module de premier niveau
+    top_level = {name.strip(): us for name, us in times.items() if not name.startswith("  ")}
+    heaviest = sorted(top_level.items(), key=lambda item: item[1], reverse=True)[:8]
+
+    print(f"Démarrage --stdin : médiane {statistics.median(wall) * 1000:.1f} ms sur {repeat} lancements")
+    print(f"Imports (cumul des modules de premier niveau) : {sum(top_level.values()) / 1000:.1f} ms")
+    for name, us in heaviest:
+        print(f"  {name:<24} {us / 1000:7.2f} ms")
+
+    gui_modules = [name for name in times if "tkinter" in name]
+    if gui_modules:
+        print(f"❌ Modules graphiques importés : {', '.join(gui_modules)}")
+        sys.exit(1)
+    print("✅ Aucun module graphique importé")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark : écriture de la bande et recherches par l'index face à un parcours complet
+
+Usage : python benchmarks/bench_tape.py [nombre_de_calculs]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tape import RECORD, TapeReader, TapeWriter
+
+
+def write_tape(path: str, count: int, seed: int = 42) -> float:
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    with TapeWriter(path) as writer:
+        append = writer.append
+        for i in range(count):
+            prev, current = rng.randint(0, 9999), rng.randint(1, 9999)
+            append(prev, current, "+", prev + current, timestamp=1e9 + i * 0.01)
+    return time.perf_counter() - start
+
+
+def timed(function) -> tuple:
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bande.bin")
+        elapsed = write_tape(path, count)
+        print(f"Écriture : {count} calculs en {elapsed:.2f} s "
+              f"({count / elapsed:,.0f} calculs/s, {os.path.getsize(path) / 1e6:.1f} Mo, "
+              f"{RECORD.size} octets/calcul)")
+
+        with TapeReader(path) as reader:
+            window_start = 1e9 + count * 0.005
+            cases = [
+                ("plage horaire (100 calculs)", lambda: len(list(reader.find_time_range(window_start, window_start + 0.99)))),
+                ("résultat absent (> max)", lambda: len(list(reader.find_result(1e6)))),
+                ("parcours complet", lambda: sum(1 for _ in reader.iter_records())),
+                ("page 0 (50 récents)", lambda: len(reader.page(0))),
+            ]
+            for label, function in cases:
+                found, elapsed = timed(function)
+                print(f"  {label:<30} {elapsed * 1000:9.3f} ms  ({found} enregistrements)")
+
+
+if __name__ == "__main__":
+    main()
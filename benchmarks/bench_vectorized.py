@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Benchmark : calcul vectorisé NumPy contre la boucle scalaire
+
+Usage : python benchmarks/bench_vectorized.py [taille_max]   (10^4 à 10^7 par défaut)
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from calculator import Calculator
+from vectorized import perform_calculation_array
+
+
+def run_scalar(prev: list, current: list, operation: str) -> list:
+    """Boucle Python historique, une paire à la fois"""
+    calculate = Calculator()._perform_calculation
+    return [calculate(p, c, operation) for p, c in zip(prev, current)]
+
+
+def main():
+    max_size = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 7
+    rng = np.random.default_rng(42)
+
+    size = 10 ** 4
+    while size <= max_size:
+        prev = rng.uniform(-1000, 1000, size)
+        current = rng.integers(-5, 5, size).astype(np.float64)
+        prev_list, current_list = prev.tolist(), current.tolist()
+        print(f"--- {size:,} éléments ---")
+        for operation in ("*", "/", "√"):
+            start = time.perf_counter()
+            run_scalar(prev_list, current_list, operation)
+            scalar = time.perf_counter() - start
+
+            start = time.perf_counter()
+            perform_calculation_array(prev, current, operation)
+            vector = time.perf_counter() - start
+
+            print(f"  {operation:>2}  scalaire {scalar:8.4f} s   vectorisé {vector:8.4f} s   x{scalar / vector:,.0f}")
+        size *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark : mise à jour incrémentale d'une feuille de formules face au recalcul complet
+
+Deux graphes de 10^5 formules :
+- factures : par ligne, sous_total = qte * prix, tva = sous_total * taux,
+  total = sous_total + tva (une quantité change, ou le taux commun)
+- couches : chaque formule lit deux registres au hasard de la couche
+  précédente (cas défavorable : une entrée touche presque tout)
+
+On change une entrée et on compare le temps de propagation avec recompute_all().
+
+Usage : python benchmarks/bench_worksheet.py [nombre_de_formules]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from worksheet import Worksheet
+
+
+def build_invoices(formulas: int) -> Worksheet:
+    """Feuille de formulas // 3 lignes de facture partageant le registre taux"""
+    sheet = Worksheet()
+    lines = formulas // 3
+    sheet.set("taux", 0.2)
+    sheet.update({f"qte{i}": float(i % 7 + 1) for i in range(lines)})
+    sheet.update({f"prix{i}": 9.99 for i in range(lines)})
+    for i in range(lines):
+        sheet.define(f"st{i}", f"qte{i} * prix{i}")
+        sheet.define(f"tva{i}", f"st{i} * taux")
+        sheet.define(f"total{i}", f"st{i} + tva{i}")
+    return sheet
+
+
+def build_layers(formulas: int, width: int = 1000, seed: int = 42) -> Worksheet:
+    """Feuille de width entrées puis formulas formules en couches de width"""
+    rng = random.Random(seed)
+    sheet = Worksheet()
+    sheet.update({f"e{i}": float(i) for i in range(width)})
+    previous = [f"e{i}" for i in range(width)]
+    defined = 0
+    layer = 0
+    while defined < formulas:
+        layer += 1
+        current = []
+        for i in range(min(width, formulas - defined)):
+            name = f"c{layer}_{i}"
+            a, b = rng.sample(previous, 2)
+            sheet.define(name, f"{a} * 1.01 + {b}")
+            current.append(name)
+        defined += len(current)
+        previous = current
+    return sheet
+
+
+def median_update(sheet: Worksheet, pick, runs: int = 20) -> tuple:
+    """(durée médiane d'un set(), formules recalculées en moyenne)"""
+    rng = random.Random(1)
+    timings = []
+    counts = []
+    for _ in range(runs):
+        name = pick(rng)
+        start = time.perf_counter()
+        counts.append(sheet.set(name, rng.uniform(1, 100)))
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings[len(timings) // 2], sum(counts) // len(counts)
+
+
+def main():
+    formulas = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    lines = formulas // 3
+    cases = [
+        ("factures", build_invoices, [
+            ("une quantité", lambda rng: f"qte{rng.randrange(lines)}"),
+            ("le taux commun", lambda rng: "taux"),
+        ]),
+        ("couches", build_layers, [
+            ("une entrée", lambda rng: f"e{rng.randrange(1000)}"),
+        ]),
+    ]
+    for label, build, updates in cases:
+        start = time.perf_counter()
+        sheet = build(formulas)
+        print(f"{label} : {len(sheet)} formules construites en {time.perf_counter() - start:.2f} s")
+
+        start = time.perf_counter()
+        sheet.recompute_all()
+        full = time.perf_counter() - start
+        print(f"  recalcul complet            {full * 1000:10.3f} ms")
+        for update_label, pick in updates:
+            elapsed, count = median_update(sheet, pick)
+            print(f"  incrémental, {update_label:<15}{elapsed * 1000:10.3f} ms "
+                  f"({count} formules recalculées, x{full / elapsed:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Faux module customtkinter pour mesurer gui.py sans écran
+
+Les widgets acceptent tous les arguments et ignorent les appels de mise en
+page ; StringVar garde sa valeur. install() le place dans sys.modules avant
+l'import de gui.
+"""
+
+import sys
+import types
+
+
+class _Widget:
+    """Widget factice : chaque méthode est un no-op"""
+
+    def __init__(self, *args, **kwargs):
+        self._options = kwargs
+        self._scheduled = []
+
+    def __getattr__(self, name):
+        return _noop
+
+    def configure(self, **kwargs):
+        self._options.update(kwargs)
+
+    def cget(self, name):
+        return self._options.get(name)
+
+    def after(self, delay, callback=None, *args):
+        if callback is not None:
+            self._scheduled.append((callback, args))
+        return f"after#{len(self._scheduled)}"
+
+    def after_idle(self, callback, *args):
+        return self.after(0, callback, *args)
+
+    def update(self):
+        """Exécute les rappels programmés (comme un tour de boucle Tk)"""
+        scheduled, self._scheduled = self._scheduled, []
+        for callback, args in scheduled:
+            callback(*args)
+
+    update_idletasks = update
+
+
+def _noop(*args, **kwargs):
+    return None
+
+
+class StringVar:
+    def __init__(self, master=None, value=""):
+        self._value = value
+
+    def set(self, value):
+        self._value = value
+
+    def get(self):
+        return self._value
+
+
+def install() -> types.ModuleType:
+    """Installe le faux module sous le nom customtkinter"""
+    module = types.ModuleType("customtkinter")
+    for name in ("CTk", "CTkFrame", "CTkLabel", "CTkButton", "CTkFont", "CTkTextbox",
+                 "CTkScrollableFrame", "CTkToplevel", "CTkEntry", "CTkSegmentedButton"):
+        setattr(module, name, type(name, (_Widget,), {}))
+    module.StringVar = StringVar
+    module.set_appearance_mode = _noop
+    module.set_default_color_theme = _noop
+    sys.modules["customtkinter"] = module
+    return module
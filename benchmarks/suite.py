@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Suite de benchmarks reproductible : moteur, chemins en lot et GUI
+
+Usage :
+    python benchmarks/suite.py                          # Affiche les résultats
+    python benchmarks/suite.py --save base.json         # Sauvegarde en JSON
+    python benchmarks/suite.py --compare base.json      # Compare à une référence
+    xvfb-run python benchmarks/suite.py --gui real      # GUI réelle sous écran virtuel
+
+Avec --compare, le code de sortie vaut 1 si un cas est plus lent que la
+référence de plus de --threshold (10 % par défaut).
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from calculator import Calculator
+from bench_feed import make_sequences
+
+
+# --- Cas mesurés : chacun renvoie (fonction à chronométrer, nombre d'opérations par appel) ---
+
+def case_key_by_key():
+    keys = "".join(make_sequences(200))
+    def run():
+        calc = Calculator()
+        for key in keys:
+            if key.isdigit():
+                calc.input_number(key)
+            elif key == ".":
+                calc.input_decimal()
+            elif key == "=":
+                calc.calculate_result()
+            else:
+                calc.input_operation(key)
+    return run, len(keys)
+
+
+def case_feed():
+    sequences = make_sequences(200)
+    def run():
+        calc = Calculator()
+        for keys in sequences:
+            calc.feed(keys)
+    return run, sum(map(len, sequences))
+
+
+def case_chained_operations():
+    def run():
+        calc = Calculator()
+        calc.input_number("1")
+        for _ in range(1000):
+            calc.input_operation("+")
+            calc.input_number("3")
+            calc.input_operation("*")
+            calc.input_number("1")
+    return run, 2000
+
+
+def case_calculate_result():
+    def run():
+        calc = Calculator()
+        for _ in range(1000):
+            calc.input_number("7")
+            calc.input_operation("*")
+            calc.input_number("6")
+            calc.calculate_result()
+    return run, 1000
+
+
+def case_error_paths():
+    def run():
+        calc = Calculator()
+        for _ in range(1000):
+            calc.reset()
+            calc.input_number("5")
+            calc.input_operation("/")
+            calc.input_number("0")
+            calc.calculate_result()
+            calc.apply_unary("±")
+            calc.apply_unary("√")
+    return run, 1000
+
+
+def case_expressions():
+    from expression import ExpressionCache
+    cache = ExpressionCache()
+    sources = ["3+4*2", "(a-b)/b", "√(a²+b²)"]
+    def run():
+        for _ in range(300):
+            for source in sources:
+                cache.get(source).evaluate(a=3.0, b=4.0)
+    return run, 900
+
+
+def _make_gui(mode: str):
+    """Construit une CalculatorGUI réelle (si possible) ou sur un faux CTk"""
+    if mode in ("auto", "real"):
+        try:
+            import customtkinter  # noqa: F401
+            if mode == "real" or os.environ.get("DISPLAY"):
+                from gui import CalculatorGUI
+                return CalculatorGUI(), "real"
+        except Exception:
+            if mode == "real":
+                raise
+    import fake_ctk
+    fake_ctk.install()
+    sys.modules.pop("gui", None)
+    from gui import CalculatorGUI
+    return CalculatorGUI(), "mock"
+
+
+def case_update_display_long(gui):
+    values = ["12345678901234.5", "0.000000000012345", "3.141592653589793", "42.0"] * 250
+    def run():
+        for value in values:
+            gui._update_display(value)
+            gui.root.update()  # Un rendu par valeur : on mesure aussi le formatage
+    return run, len(values)
+
+
+def case_button_click(gui):
+    clicks = list("12+34*5=") + ["√", "x²", "±", "AC"]
+    clicks *= 100
+    def run():
+        for text in clicks:
+            gui._on_button_click(text)
+        gui.root.update()
+    return run, len(clicks)
+
+
+ENGINE_CASES = {
+    "key_by_key": case_key_by_key,
+    "feed": case_feed,
+    "chained_operations": case_chained_operations,
+    "calculate_result": case_calculate_result,
+    "error_paths": case_error_paths,
+    "expressions": case_expressions,
+}
+GUI_CASES = {
+    "gui_update_display_long": case_update_display_long,
+    "gui_button_click": case_button_click,
+}
+
+
+def measure(run, ops: int, repeat: int, min_time: float = 0.05) -> dict:
+    """Chronomètre run() et renvoie des statistiques en ns par opération"""
+    run()  # Échauffement
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        if time.perf_counter() - start >= min_time:
+            break
+        loops *= 2
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        samples.append((time.perf_counter() - start) / (loops * ops) * 1e9)
+    return {
+        "ns_per_op": min(samples),
+        "median_ns_per_op": statistics.median(samples),
+        "stdev_ns_per_op": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "repeat": repeat,
+    }
+
+
+def run_suite(repeat: int, gui_mode: str, only=None) -> dict:
+    results = {}
+    for name, factory in ENGINE_CASES.items():
+        if only and name not in only:
+            continue
+        results[name] = measure(*factory(), repeat)
+
+    gui_backend = None
+    if gui_mode != "off":
+        gui, gui_backend = _make_gui(gui_mode)
+        for name, factory in GUI_CASES.items():
+            if only and name not in only:
+                continue
+            results[name] = measure(*factory(gui), repeat)
+
+    return {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "gui": gui_backend,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """Renvoie la liste des cas plus lents que la référence au-delà du seuil"""
+    regressions = []
+    print(f"\n{'cas':<26} {'réf (ns)':>10} {'actuel':>10} {'écart':>8}")
+    for name, result in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            print(f"{name:<26} {'-':>10} {result['ns_per_op']:10.1f}")
+            continue
+        ratio = result["ns_per_op"] / reference["ns_per_op"] - 1
+        flag = "  ❌" if ratio > threshold else ""
+        print(f"{name:<26} {reference['ns_per_op']:10.1f} {result['ns_per_op']:10.1f} {ratio * 100:+7.1f}%{flag}")
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Suite de benchmarks PyCalc")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--save", metavar="FICHIER", help="enregistre les résultats en JSON")
+    parser.add_argument("--compare", metavar="FICHIER", help="compare à des résultats JSON de référence")
+    parser.add_argument("--threshold", type=float, default=0.10, help="ralentissement toléré (0.10 = 10 %%)")
+    parser.add_argument("--gui", choices=("auto", "real", "mock", "off"), default="auto",
+                        help="GUI réelle (écran requis, ex. xvfb-run), faux CTk, ou pas de GUI")
+    parser.add_argument("--only", nargs="*", help="ne lance que ces cas")
+    args = parser.parse_args(argv)
+
+    data = run_suite(args.repeat, args.gui, args.only)
+    print(f"Python {data['meta']['python']} ({data['meta']['implementation']}), GUI : {data['meta']['gui']}")
+    for name, result in data["results"].items():
+        print(f"  {name:<26} {result['ns_per_op']:10.1f} ns/op  (médiane {result['median_ns_per_op']:.1f})")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        print(f"💾 Résultats enregistrés dans {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(data, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ Régression au-delà de {args.threshold:.0%} : {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"\n✅ Aucune régression au-delà de {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
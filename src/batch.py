@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Évaluation de lots ligne par ligne (expressions, séquences de touches, RPN)
+
+Utilisé par la ligne de commande (main.py) et par les workers de
+parallel.py ; les modules de calcul ne sont importés qu'à la demande.
+"""
+
+import math
+from typing import Iterable, Iterator
+
+
+def iter_results(lines: Iterable[str], keys: bool = False, backend: str = "float",
+                 precision: int = 28, cache=None, calculator=None, rpn: bool = False) -> Iterator[str]:
+    """
+    Évalue des lignes une par une (générateur, mémoire constante)
+
+    Args:
+        lines: Lignes à évaluer (expressions, ou séquences de touches si keys)
+        keys: True pour rejouer des séquences de touches via Calculator.feed
+        backend: Backend numérique de la calculatrice (séquences de touches)
+        precision: Précision du backend "decimal"
+        cache: Cache des calculs (module memo) pour les séquences de touches
+        calculator: Calculatrice déjà construite pour les séquences de touches
+                    (ex : ProgrammerCalculator) ; remplace backend, precision et cache
+        rpn: True pour des programmes en notation polonaise inverse ("3 4 + 2 *")
+
+    Yields:
+        Le résultat de chaque ligne ("11.0", "Erreur"...), ligne vide pour une ligne vide
+    """
+    if rpn:
+        from rpn import RPNStack, evaluate_rpn
+        stack = RPNStack()  # Une seule pile, vidée à chaque ligne
+        for line in lines:
+            line = line.strip()
+            if not line:
+                yield ""
+                continue
+            stack.clear()
+            result = evaluate_rpn(line, stack)
+            yield "Erreur" if result is None else str(result)
+    elif keys:
+        if calculator is None and cache is None:
+            from calculator import Calculator
+            calculator = Calculator(backend, precision)
+        elif calculator is None:
+            from memo import MemoizedCalculator
+            calculator = MemoizedCalculator(cache, backend, precision)
+        for line in lines:
+            line = line.strip()
+            if not line:
+                yield ""
+                continue
+            calculator.reset(registers=True)  # Chaque ligne est indépendante
+            try:
+                yield calculator.feed(line)
+            except ValueError:
+                yield "Erreur"
+    else:
+        from expression import compile_expression
+        for line in lines:
+            line = line.strip()
+            if not line:
+                yield ""
+                continue
+            try:
+                result = compile_expression(line).evaluate()
+            except (ValueError, KeyError):
+                result = None
+            yield "Erreur" if result is None else str(result)
+
+
+
+def collect_stats(lines: Iterable[str], stats=None):
+    """
+    Résume une colonne de nombres (un nombre ou une expression par ligne)
+
+    Les lignes vides sont sautées ; celles qui ne donnent pas de nombre fini
+    ("Erreur", texte) sont comptées à part sans interrompre la lecture.
+
+    Returns:
+        (stats, nombre de lignes ignorées)
+    """
+    from running_stats import RunningStats
+    from expression import compile_expression
+    if stats is None:
+        stats = RunningStats()
+    ignored = 0
+
+    def numbers():
+        nonlocal ignored
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                value = float(line)  # Cas courant : un nombre seul
+            except ValueError:
+                try:
+                    value = compile_expression(line).evaluate()
+                except (ValueError, KeyError):
+                    value = None
+            if value is None or not math.isfinite(value):
+                ignored += 1
+                continue
+            yield value
+
+    stats.extend(numbers())
+    return stats, ignored
@@ -4,8 +4,189 @@ Logique métier de la calculatrice
 Sépare la logique des calculs de l'interface utilisateur
 """
 
+import decimal
 import math
-from typing import Optional
+import operator
+from collections import ChainMap
+from fractions import Fraction
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Mapping, NamedTuple, Optional
+
+
+class Operator(NamedTuple):
+    """Une opération de la calculatrice et ses métadonnées"""
+    symbol: str         # Texte du bouton ("+", "√"...)
+    arity: int          # 2 = entre deux nombres, 1 = immédiate sur la valeur affichée
+    precedence: int     # Priorité dans les expressions (plus grand = plus prioritaire)
+    function: Callable  # Calcul brut : f(prev, current) ou f(current)
+    calculate: Callable[[float, float], Optional[float]]  # Calcul précalculé : f(prev, current)
+
+
+# Registre des opérations : symbole -> Operator (dispatch en O(1))
+OPERATORS: Dict[str, Operator] = {}
+_CALCULATIONS: Dict[str, Callable[[float, float], Optional[float]]] = {}
+
+# Erreurs de calcul transformées en "Erreur" (None)
+CALCULATION_ERRORS = (ValueError, OverflowError, ArithmeticError)
+_DISPATCH_ERRORS = (KeyError,) + CALCULATION_ERRORS
+
+# Touches reconnues par Calculator.feed()
+DIGITS = frozenset("0123456789")
+OPERATIONS = set()        # Opérations binaires (+, -, *, /...)
+UNARY_OPERATIONS = set()  # Opérations immédiates (√, x², ±...)
+KEY_ALIASES = {"²": "x²"} # Raccourcis d'une lettre pour feed("9²")
+# Touches mémoire -> méthode de Calculator (registre "M")
+MEMORY_KEYS = {"M+": "memory_add", "M-": "memory_subtract", "MR": "recall", "MC": "clear_register"}
+MEMORY_REGISTER = "M"
+
+
+def register_operator(symbol: str, arity: int, precedence: int, function: Callable) -> Operator:
+    """
+    Ajoute (ou remplace) une opération dans le registre
+
+    Args:
+        symbol: Texte du bouton
+        arity: 2 pour une opération binaire, 1 pour une opération immédiate
+        precedence: Priorité dans les expressions
+        function: f(prev, current) si binaire, f(current) si unaire ;
+                  renvoie None ou lève une des CALCULATION_ERRORS en cas d'erreur
+
+    Returns:
+        L'opération enregistrée
+    """
+    if arity == 2:
+        calculate = function
+    elif arity == 1:
+        calculate = lambda prev, current: function(current)
+    else:
+        raise ValueError("arity doit valoir 1 ou 2")
+
+    entry = Operator(symbol, arity, precedence, function, calculate)
+    OPERATORS[symbol] = entry
+    _CALCULATIONS[symbol] = calculate
+    OPERATIONS.discard(symbol)
+    UNARY_OPERATIONS.discard(symbol)
+    (OPERATIONS if arity == 2 else UNARY_OPERATIONS).add(symbol)
+    return entry
+
+
+def unregister_operator(symbol: str) -> None:
+    """Retire une opération du registre"""
+    OPERATORS.pop(symbol, None)
+    _CALCULATIONS.pop(symbol, None)
+    OPERATIONS.discard(symbol)
+    UNARY_OPERATIONS.discard(symbol)
+
+
+def _divide(prev: float, current: float) -> Optional[float]:
+    if current == 0:
+        return None  # Division par zéro
+    return prev / current
+
+
+def _square_root(current: float) -> Optional[float]:
+    if current < 0:
+        return None  # Racine de nombre négatif
+    return math.sqrt(current)
+
+
+register_operator("+", 2, 1, operator.add)
+register_operator("-", 2, 1, operator.sub)
+register_operator("*", 2, 2, operator.mul)
+register_operator("/", 2, 2, _divide)
+register_operator("√", 1, 3, _square_root)
+register_operator("x²", 1, 4, lambda current: current ** 2)
+register_operator("±", 1, 3, operator.neg)
+
+
+class NumericBackend(NamedTuple):
+    """Représentation des nombres utilisée par une Calculator"""
+    name: str
+    parse: Callable[[str], object]    # Texte saisi -> nombre
+    calculations: Mapping[str, Callable]  # Symbole -> f(prev, current), comme le registre
+    precision: int = 28                   # Précision du contexte decimal (et des racines exactes)
+
+
+def _exact_square_root(current, context: decimal.Context):
+    """
+    Racine carrée exacte d'un entier ou d'une fraction quand elle existe
+    (math.isqrt), sinon approximation rationnelle à la précision du contexte
+    """
+    if current < 0:
+        return None  # Racine de nombre négatif
+    value = Fraction(current)
+    numerator, denominator = value.numerator, value.denominator
+    root_num, root_den = math.isqrt(numerator), math.isqrt(denominator)
+    if root_num * root_num == numerator and root_den * root_den == denominator:
+        if root_den == 1:
+            return root_num
+        return Fraction(root_num, root_den)
+    return Fraction(context.sqrt(context.divide(decimal.Decimal(numerator), decimal.Decimal(denominator))))
+
+
+def _exact_divide(prev, current):
+    """Division exacte : reste un int quand le résultat est entier"""
+    if current == 0:
+        return None  # Division par zéro
+    result = Fraction(prev) / Fraction(current)
+    return result.numerator if result.denominator == 1 else result
+
+
+def _parse_exact_int(text: str):
+    """Entier exact, ou fraction si la saisie comporte des décimales"""
+    if "." in text or "/" in text:
+        value = Fraction(text)
+        return value.numerator if value.denominator == 1 else value
+    return int(text)
+
+
+_EXACT_CONTEXT = decimal.Context(prec=28)
+
+BACKEND_NAMES = ("float", "decimal", "fraction", "int")
+
+
+@lru_cache(maxsize=None)
+def get_backend(name: str = "float", precision: int = 28) -> NumericBackend:
+    """
+    Renvoie un backend numérique
+
+    Args:
+        name: "float" (par défaut, le plus rapide), "decimal" (décimal exact à
+              `precision` chiffres significatifs), "fraction" (rationnels exacts)
+              ou "int" (entiers exacts, promus en fraction si besoin)
+        precision: Précision du contexte decimal (et des racines irrationnelles)
+
+    Raises:
+        ValueError: Si le backend est inconnu
+    """
+    if name == "float":
+        # Le registre lui-même : aucun surcoût
+        return NumericBackend("float", float, _CALCULATIONS)
+
+    context = decimal.Context(prec=precision) if precision != 28 else _EXACT_CONTEXT
+    if name == "decimal":
+        def square(prev, current):
+            return context.multiply(current, current)
+        overrides = {
+            "+": context.add,
+            "-": context.subtract,
+            "*": context.multiply,
+            "/": lambda prev, current: None if current == 0 else context.divide(prev, current),
+            "√": lambda prev, current: None if current < 0 else context.sqrt(current),
+            "x²": square,
+            "±": lambda prev, current: context.minus(current),
+        }
+        return NumericBackend("decimal", decimal.Decimal, ChainMap(overrides, _CALCULATIONS), precision)
+    if name == "fraction":
+        overrides = {"√": lambda prev, current: _exact_square_root(current, context)}
+        return NumericBackend("fraction", Fraction, ChainMap(overrides, _CALCULATIONS), precision)
+    if name == "int":
+        overrides = {
+            "/": _exact_divide,
+            "√": lambda prev, current: _exact_square_root(current, context),
+        }
+        return NumericBackend("int", _parse_exact_int, ChainMap(overrides, _CALCULATIONS), precision)
+    raise ValueError(f"Backend inconnu : {name!r} (attendu : {', '.join(BACKEND_NAMES)})")
 
 
 class Calculator:
@@ -16,17 +197,78 @@ class Calculator:
     Elle peut être utilisée en ligne de commande, dans une app web, etc.
     """
     
-    def __init__(self):
-        """Initialise une calculatrice vierge"""
+    # Pas de __dict__ par instance : une calculatrice reste légère en mémoire
+    __slots__ = ("_entry", "_value", "_accumulator", "operation", "wait_for_operand",
+                 "_backend", "_parse", "_calculations", "_registers", "worksheet")
+    
+    def __init__(self, backend: str = "float", precision: int = 28):
+        """
+        Initialise une calculatrice vierge
+        
+        Args:
+            backend: Représentation des nombres ("float", "decimal", "fraction", "int"),
+                     voir get_backend
+            precision: Précision du backend "decimal"
+        """
+        self._backend = get_backend(backend, precision)
+        self._parse = self._backend.parse
+        self._calculations = self._backend.calculations
+        self._registers = None  # Créés au premier usage (la mémoire survit à AC)
+        self.worksheet = None   # Feuille de formules branchée sur les registres (worksheet.py)
         self.reset()
     
-    def reset(self) -> None:
-        """Remet la calculatrice à zéro"""
-        self.current_value = "0"      # Ce qui s'affiche
-        self.previous_value = ""      # Valeur précédente pour les calculs
+    @property
+    def backend(self) -> str:
+        """Nom du backend numérique"""
+        return self._backend.name
+    
+    def reset(self, registers: bool = False) -> None:
+        """
+        Remet la calculatrice à zéro
+        
+        Args:
+            registers: True pour vider aussi les registres (calculatrice
+                       recyclée pour un autre utilisateur) ; AC les garde
+        """
+        if registers and self._registers:
+            if self.worksheet is not None:
+                raise ValueError("registres liés à une feuille de formules")
+            self._registers.clear()
+        # État typé : le texte affiché n'est construit qu'à la demande
+        self._entry = "0"             # Chiffres en cours de saisie (None = résultat calculé)
+        self._value = 0.0             # Dernier résultat calculé (si _entry est None)
+        self._accumulator = None      # Valeur précédente pour les calculs (None = aucune)
         self.operation = None         # +, -, *, /
         self.wait_for_operand = False # En attente d'un nouveau nombre ?
     
+    @property
+    def current_value(self) -> str:
+        """Ce qui s'affiche (rendu paresseusement depuis l'état typé)"""
+        if self._entry is not None:
+            return self._entry
+        return str(self._value)
+    
+    @current_value.setter
+    def current_value(self, value: str) -> None:
+        self._entry = value
+    
+    @property
+    def previous_value(self):
+        """Valeur précédente : "" si aucune, sinon un nombre du backend"""
+        if self._accumulator is None:
+            return ""
+        return self._accumulator
+    
+    @previous_value.setter
+    def previous_value(self, value) -> None:
+        self._accumulator = None if value == "" else self._parse(str(value))
+    
+    def _current_number(self):
+        """Valeur numérique de ce qui s'affiche"""
+        if self._entry is not None:
+            return self._parse(self._entry)
+        return self._value
+    
     def input_number(self, number: str) -> str:
         """
         Ajoute un chiffre à la valeur actuelle
@@ -39,16 +281,19 @@ class Calculator:
         """
         if self.wait_for_operand:
             # Après une opération, on commence un nouveau nombre
-            self.current_value = number
+            self._entry = number
             self.wait_for_operand = False
         else:
             # On ajoute le chiffre (sauf si on a juste "0")
-            if self.current_value == "0":
-                self.current_value = number
+            entry = self._entry
+            if entry is None:
+                entry = str(self._value)
+            if entry == "0":
+                self._entry = number
             else:
-                self.current_value += number
+                self._entry = entry + number
         
-        return self.current_value
+        return self._entry
     
     def input_decimal(self) -> str:
         """
@@ -59,13 +304,18 @@ class Calculator:
         """
         if self.wait_for_operand:
             # Nouveau nombre décimal
-            self.current_value = "0."
+            self._entry = "0."
             self.wait_for_operand = False
-        elif "." not in self.current_value:
-            # Ajoute le point seulement s'il n'y en a pas déjà
-            self.current_value += "."
+        else:
+            entry = self._entry
+            if entry is None:
+                entry = str(self._value)
+            if "." not in entry:
+                # Ajoute le point seulement s'il n'y en a pas déjà
+                entry += "."
+            self._entry = entry
         
-        return self.current_value
+        return self._entry
     
     def input_operation(self, next_operation: str) -> str:
         """
@@ -77,23 +327,23 @@ class Calculator:
         Returns:
             La valeur à afficher (peut être un résultat intermédiaire)
         """
-        current_float = float(self.current_value)
+        current = self._current_number()
         
-        if self.previous_value == "":
+        if self._accumulator is None:
             # Premier nombre : on le stocke
-            self.previous_value = current_float
+            self._accumulator = current
         elif self.operation:
             # Il y a déjà une opération en cours : on calcule
-            previous_float = float(self.previous_value)
-            result = self._perform_calculation(previous_float, current_float, self.operation)
+            result = self._perform_calculation(self._accumulator, current, self.operation)
             
             if result is None:
                 return "Erreur"
             
-            self.current_value = str(result)
-            self.previous_value = result
+            self._entry = None
+            self._value = result
+            self._accumulator = result
         else:
-            self.previous_value = current_float
+            self._accumulator = current
         
         self.wait_for_operand = True
         self.operation = next_operation
@@ -101,7 +351,8 @@ class Calculator:
     
     def _perform_calculation(self, prev: float, current: float, operation: str) -> Optional[float]:
         """
-        Effectue le calcul selon l'opération
+        Effectue le calcul selon l'opération (via le registre OPERATORS,
+        ou les versions exactes du backend numérique)
         
         Args:
             prev: Valeur précédente
@@ -112,25 +363,27 @@ class Calculator:
             Le résultat du calcul, ou None si erreur
         """
         try:
-            if operation == "+":
-                return prev + current
-            elif operation == "-":
-                return prev - current
-            elif operation == "*":
-                return prev * current
-            elif operation == "/":
-                if current == 0:
-                    return None  # Division par zéro
-                return prev / current
-            elif operation == "√":
-                if current < 0:
-                    return None  # Racine de nombre négatif
-                return math.sqrt(current)
-            elif operation == "x²":
-                return current ** 2
-            return None
-        except (ValueError, OverflowError, ArithmeticError):
-            return None
+            return self._calculations[operation](prev, current)
+        except _DISPATCH_ERRORS:
+            return None  # Opération inconnue ou erreur de calcul
+    
+    def apply_unary(self, operation: str) -> str:
+        """
+        Applique une opération immédiate (√, x², ±) à la valeur affichée
+        
+        Args:
+            operation: Symbole d'une opération unaire du registre
+        
+        Returns:
+            La nouvelle valeur à afficher, ou "Erreur"
+        """
+        result = self._perform_calculation(0.0, self._current_number(), operation)
+        if result is None:
+            return "Erreur"
+        
+        self._entry = None
+        self._value = result
+        return self.current_value
     
     def calculate_result(self) -> str:
         """
@@ -139,21 +392,259 @@ class Calculator:
         Returns:
             Le résultat final en string, ou "Erreur"
         """
-        if self.operation and self.previous_value != "":
-            current_float = float(self.current_value)
-            previous_float = float(self.previous_value)
-            
-            result = self._perform_calculation(previous_float, current_float, self.operation)
+        if self.operation and self._accumulator is not None:
+            result = self._perform_calculation(self._accumulator, self._current_number(), self.operation)
             if result is None:
                 return "Erreur"
             
-            self.current_value = str(result)
-            self.previous_value = ""
+            self._entry = None
+            self._value = result
+            self._accumulator = None
             self.operation = None
             self.wait_for_operand = True
         
         return self.current_value
     
+    def feed(self, keys: Iterable[str]) -> str:
+        """
+        Rejoue une séquence complète de touches en une seule boucle
+
+        Équivalent à appeler input_number / input_decimal / input_operation /
+        apply_unary / calculate_result pour chaque touche, sans le coût d'un appel de
+        méthode par touche ni la construction d'une chaîne à chaque étape.
+
+        Args:
+            keys: Une chaîne ("12+3=", "9²", un caractère par touche, espaces ignorés)
+                  ou un itérable de touches ("1", "+", "=", "x²", "AC", "M+", "MR"...)
+
+        Returns:
+            La valeur affichée après la dernière touche (comme la GUI)
+
+        Raises:
+            ValueError: Si une touche est inconnue, ou si une touche mémoire vise
+                        une formule (worksheet) ; l'état et les registres sont
+                        alors remis comme avant l'appel
+        """
+        # État local : on ne relit/écrit les attributs qu'une seule fois
+        entry = self._entry
+        value = self._value
+        accumulator = self._accumulator
+        operation = self.operation
+        wait = self.wait_for_operand
+        error = False
+        calculate = self._perform_calculation
+        parse = self._parse
+        aliases = KEY_ALIASES
+        saved = None  # État d'avant l'appel, gardé à la première touche mémoire
+
+        for key in keys:
+            key = aliases.get(key, key)
+            if key in DIGITS:
+                if wait:
+                    entry = key
+                    wait = False
+                elif entry is None:
+                    entry = str(value) + key
+                elif entry == "0":
+                    entry = key
+                else:
+                    entry += key
+                error = False
+            elif key in OPERATIONS:
+                current = parse(entry) if entry is not None else value
+                if accumulator is None:
+                    accumulator = current
+                elif operation:
+                    result = calculate(accumulator, current, operation)
+                    if result is None:
+                        error = True
+                        continue
+                    entry = None
+                    value = accumulator = result
+                else:
+                    accumulator = current
+                wait = True
+                operation = key
+                error = False
+            elif key == "=":
+                if operation and accumulator is not None:
+                    current = parse(entry) if entry is not None else value
+                    result = calculate(accumulator, current, operation)
+                    if result is None:
+                        error = True
+                        continue
+                    entry = None
+                    value = result
+                    accumulator = None
+                    operation = None
+                    wait = True
+                error = False
+            elif key == ".":
+                if wait:
+                    entry = "0."
+                    wait = False
+                else:
+                    if entry is None:
+                        entry = str(value)
+                    if "." not in entry:
+                        entry += "."
+                error = False
+            elif key in UNARY_OPERATIONS:
+                result = calculate(0.0, parse(entry) if entry is not None else value, key)
+                if result is None:
+                    error = True
+                    continue
+                entry = None
+                value = result
+                error = False
+            elif key == "AC":
+                entry = "0"
+                value = 0.0
+                accumulator = None
+                operation = None
+                wait = False
+                error = False
+            elif key in MEMORY_KEYS:
+                # Touches mémoire (rares) : on passe par les méthodes, qui écrivent
+                # l'état et les registres ; on garde de quoi les annuler
+                if saved is None:
+                    saved = self._save_for_rollback()
+                self._entry, self._value, self._accumulator = entry, value, accumulator
+                self.operation, self.wait_for_operand = operation, wait
+                try:
+                    error = getattr(self, MEMORY_KEYS[key])() == "Erreur"
+                except ValueError:
+                    self._rollback(saved)
+                    raise
+                entry, value, accumulator = self._entry, self._value, self._accumulator
+                operation, wait = self.operation, self.wait_for_operand
+            elif not key.isspace():
+                if saved is not None:
+                    self._rollback(saved)
+                raise ValueError(f"Touche inconnue : {key!r}")
+
+        self._entry = entry
+        self._value = value
+        self._accumulator = accumulator
+        self.operation = operation
+        self.wait_for_operand = wait
+        return "Erreur" if error else self.current_value
+
+    def _save_for_rollback(self) -> tuple:
+        """État et copie des registres, pour annuler un feed() interrompu"""
+        return self.snapshot(), dict(self.registers)
+
+    def _rollback(self, saved: tuple) -> None:
+        """Remet l'état et les registres de _save_for_rollback()"""
+        state, registers = saved
+        self.restore(state)
+        current = self.registers  # Même dict (la feuille de formules le partage)
+        current.clear()
+        current.update(registers)
+
+    @property
+    def registers(self) -> dict:
+        """Registres nommés (mémoire "M" et variables) : nom -> nombre du backend"""
+        if self._registers is None:
+            self._registers = {}
+        return self._registers
+    
+    def store(self, name: str) -> str:
+        """
+        Range la valeur affichée dans un registre (STO)
+        
+        Returns:
+            La valeur affichée (inchangée)
+        
+        Raises:
+            ValueError: Si le registre est le résultat d'une formule (worksheet)
+        """
+        self._set_register(name, self._current_number())
+        self.wait_for_operand = True
+        return self.current_value
+    
+    def recall(self, name: str = MEMORY_REGISTER) -> str:
+        """
+        Rappelle un registre (MR) comme s'il avait été tapé (registre vide = 0)
+        
+        Returns:
+            La nouvelle valeur à afficher, ou "Erreur" si le registre
+            contient une erreur (formule en erreur)
+        """
+        value = self.registers.get(name, 0)
+        if value is None:
+            return "Erreur"
+        self._entry = None
+        self._value = self._parse(str(value)) if isinstance(value, int) else value
+        self.wait_for_operand = True
+        return self.current_value
+    
+    def memory_add(self, name: str = MEMORY_REGISTER) -> str:
+        """M+ : ajoute la valeur affichée au registre"""
+        return self._accumulate(name, "+")
+    
+    def memory_subtract(self, name: str = MEMORY_REGISTER) -> str:
+        """M- : retranche la valeur affichée du registre"""
+        return self._accumulate(name, "-")
+    
+    def clear_register(self, name: str = MEMORY_REGISTER) -> str:
+        """MC : vide le registre"""
+        if self.worksheet is not None:
+            self.worksheet.discard(name)
+        else:
+            self.registers.pop(name, None)
+        return self.current_value
+    
+    def _accumulate(self, name: str, operation: str) -> str:
+        registers = self.registers
+        stored = registers[name] if name in registers else self._parse("0")
+        if stored is None:
+            return "Erreur"
+        result = self._perform_calculation(stored, self._current_number(), operation)
+        if result is None:
+            return "Erreur"
+        self._set_register(name, result)
+        self.wait_for_operand = True
+        return self.current_value
+    
+    def _set_register(self, name: str, value) -> None:
+        if self.worksheet is not None:
+            self.worksheet.set(name, value)  # Recalcule les formules qui en dépendent
+        else:
+            self.registers[name] = value
+    
+    def snapshot(self) -> tuple:
+        """
+        Copie immuable de l'état (pour annuler/rétablir)
+        
+        Les valeurs (chaînes, nombres) sont partagées, pas copiées.
+        Les registres n'en font pas partie : annuler ne défait pas un M+.
+        """
+        return (self._entry, self._value, self._accumulator, self.operation, self.wait_for_operand)
+    
+    def restore(self, snapshot: tuple) -> None:
+        """Remet l'état d'un snapshot()"""
+        (self._entry, self._value, self._accumulator,
+         self.operation, self.wait_for_operand) = snapshot
+    
     def get_display_value(self) -> str:
         """Retourne la valeur à afficher (utile pour l'interface)"""
-        return self.current_value
\ No newline at end of file
+        return self.current_value
+
+def calculator_from_snapshot(snapshot: tuple, backend: str = "float", precision: int = 28) -> Calculator:
+    """
+    Recrée une Calculator depuis un snapshot(), sans passer par reset()
+
+    Pour les chargements en masse (checkpoint.py) : environ 30 % de moins
+    que Calculator(backend, precision) suivi de restore(). Registres vides.
+    """
+    calc = Calculator.__new__(Calculator)
+    numeric = get_backend(backend, precision)
+    calc._backend = numeric
+    calc._parse = numeric.parse
+    calc._calculations = numeric.calculations
+    calc._registers = None
+    calc.worksheet = None
+    (calc._entry, calc._value, calc._accumulator,
+     calc.operation, calc.wait_for_operand) = snapshot
+    return calc
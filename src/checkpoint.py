@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""
+Points de reprise binaires : l'état de très nombreuses calculatrices sur disque
+
+Format (version 1, petit-boutiste) :
+- en-tête : signature, version, taille d'un enregistrement ;
+- puis des segments, chacun écrit d'un seul write() :
+  SEGMENT, longueurs des nouvelles chaînes, chaînes (UTF-8), [indices si
+  delta], enregistrements.
+
+Un enregistrement a une taille fixe (RECORD) : valeur, valeur précédente,
+puis des indices dans la table de chaînes pour la saisie en cours,
+l'opération et le backend. Des saisies identiques ("0", "12."...) ne sont
+donc écrites qu'une fois. Un nombre qui n'est pas un float (int, Fraction,
+Decimal) est rangé en texte dans la table, et son champ double contient
+l'indice de ce texte.
+
+Un segment FULL contient toutes les calculatrices et ouvre un nouveau
+fichier. Un segment DELTA, ajouté en fin de fichier, ne contient que celles
+qui ont changé. À la lecture, un segment tronqué (arrêt brutal) est ignoré.
+Les registres (mémoire, variables) ne font pas partie de l'état sauvegardé,
+comme pour snapshot().
+"""
+
+import gc
+import mmap
+import os
+import struct
+import sys
+from array import array
+from decimal import Decimal
+from fractions import Fraction
+from typing import Iterable, List, Optional, Sequence
+
+from calculator import BACKEND_NAMES, Calculator, calculator_from_snapshot
+
+
+MAGIC = b"PCCK"
+VERSION = 1
+
+# En-tête du fichier : signature, version, taille d'un enregistrement
+HEADER = struct.Struct("<4sHH")
+# Segment : type, nombre d'enregistrements, nombre et taille (octets) des nouvelles chaînes
+SEGMENT = struct.Struct("<B3xIII")
+# Enregistrement : valeur, valeur précédente, saisie, opération, backend, drapeaux
+RECORD = struct.Struct("<ddIIIB3x")
+
+FULL = 1
+DELTA = 2
+
+NO_STRING = 0xFFFFFFFF  # Saisie ou opération absente (None)
+
+# Drapeaux
+WAIT = 1            # En attente d'un nouveau nombre
+HAS_PREVIOUS = 2    # Une valeur précédente est stockée
+# Type de la valeur (bits 2-3) et de la valeur précédente (bits 4-5)
+VALUE_SHIFT = 2
+PREVIOUS_SHIFT = 4
+NUMBER_TYPES = (float, int, Fraction, Decimal)  # Code -> type (0 = double en clair)
+_TYPE_CODES = {number_type: code for code, number_type in enumerate(NUMBER_TYPES)}
+_TEXT_NUMBERS = (3 << VALUE_SHIFT) | (3 << PREVIOUS_SHIFT)
+
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+def _uint32_bytes(values: Iterable[int]) -> bytes:
+    data = array("I", values)
+    if _BIG_ENDIAN:
+        data.byteswap()
+    return data.tobytes()
+
+
+def _uint32_array(data) -> array:
+    values = array("I")
+    values.frombytes(data)
+    if _BIG_ENDIAN:
+        values.byteswap()
+    return values
+
+
+class CheckpointWriter:
+    """
+    Écrit des points de reprise, complets ou limités aux calculatrices modifiées
+
+    Le writer garde le snapshot() de ce qu'il a écrit pour chaque
+    calculatrice : checkpoint() n'écrit que celles dont l'état a changé (ou
+    les nouvelles). Le fichier est réécrit en entier quand la liste
+    raccourcit, ou quand les deltas accumulés atteignent compact_ratio fois
+    le nombre de calculatrices.
+
+    Exemple :
+        writer = CheckpointWriter("etat.ckpt")
+        calculators = writer.load() if os.path.exists("etat.ckpt") else []
+        ...
+        writer.checkpoint(calculators)   # Seules les calculatrices modifiées
+    """
+
+    def __init__(self, path: str, compact_ratio: float = 1.0):
+        self.path = path
+        self.compact_ratio = compact_ratio
+        self._strings = {}        # Texte -> indice dans la table du fichier
+        self._written = []        # (snapshot(), backend) écrit pour chaque calculatrice
+        self._delta_records = 0   # Enregistrements dans les deltas depuis le dernier FULL
+
+    def load(self) -> List[Calculator]:
+        """
+        Recrée les calculatrices du fichier et reprend l'écriture à sa suite
+
+        Un segment tronqué en fin de fichier est retiré : le prochain delta
+        sera lisible.
+        """
+        with CheckpointReader(self.path) as reader:
+            calculators = reader.calculators()
+            strings = reader.strings
+            valid_size = reader.valid_size
+            self._delta_records = reader.delta_records
+        if valid_size < os.path.getsize(self.path):
+            with open(self.path, "r+b") as f:
+                f.truncate(valid_size)
+        self._strings = {text: index for index, text in enumerate(strings)}
+        self._written = [(calc.snapshot(), calc._backend) for calc in calculators]
+        return calculators
+
+    def checkpoint(self, calculators: Sequence[Calculator], dirty: Optional[Iterable[int]] = None) -> int:
+        """
+        Sauvegarde l'état des calculatrices
+
+        Args:
+            calculators: Toutes les calculatrices (l'indice identifie chacune)
+            dirty: Indices à examiner s'ils sont connus (les nouvelles
+                   calculatrices le sont toujours) ; None = toutes
+
+        Returns:
+            Le nombre d'enregistrements écrits
+
+        Raises:
+            ValueError: Si une calculatrice n'a pas un backend de get_backend
+        """
+        count = len(calculators)
+        written = self._written
+        known = len(written)
+        if not known or count < known or self._delta_records + count - known >= self.compact_ratio * count:
+            return self._write_full(calculators)
+
+        candidates = range(known) if dirty is None else sorted(index for index in set(dirty) if index < known)
+        changed, states = [], []
+        for index in candidates:
+            calc = calculators[index]
+            state = (calc.snapshot(), calc._backend)
+            if written[index] != state:
+                changed.append(index)
+                states.append(state)
+        for index in range(known, count):
+            calc = calculators[index]
+            changed.append(index)
+            states.append((calc.snapshot(), calc._backend))
+        if not changed:
+            return 0
+
+        # Rien n'est retenu avant que le delta soit écrit : après une erreur,
+        # le prochain point de reprise repart de l'état du fichier
+        new_strings = []
+        with open(self.path, "ab") as f:
+            size = f.tell()
+            try:
+                records = self._encode(states, new_strings)
+                f.write(self._segment(DELTA, changed, new_strings, records))
+                f.flush()
+            except BaseException:
+                for text in new_strings:
+                    del self._strings[text]
+                f.truncate(size)  # Pas de segment à moitié écrit
+                raise
+        for index, state in zip(changed, states):
+            if index < known:
+                written[index] = state
+            else:
+                written.append(state)
+        self._delta_records += len(changed)
+        return len(changed)
+
+    def _write_full(self, calculators: Sequence[Calculator]) -> int:
+        """Réécrit tout le fichier (fichier temporaire puis remplacement atomique)"""
+        strings, self._strings = self._strings, {}
+        new_strings = []
+        states = [(calc.snapshot(), calc._backend) for calc in calculators]
+        temporary = self.path + ".tmp"
+        try:
+            records = self._encode(states, new_strings)
+            with open(temporary, "wb") as f:
+                f.write(HEADER.pack(MAGIC, VERSION, RECORD.size)
+                        + self._segment(FULL, (), new_strings, records))
+            os.replace(temporary, self.path)
+        except BaseException:
+            self._strings = strings  # Le fichier en place n'a pas changé
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+        self._written = states
+        self._delta_records = 0
+        return len(calculators)
+
+    @staticmethod
+    def _segment(kind: int, indices: Sequence[int], new_strings: List[str], records: bytearray) -> bytes:
+        encoded = [text.encode() for text in new_strings]
+        count = len(records) // RECORD.size
+        parts = [
+            SEGMENT.pack(kind, count, len(encoded), sum(map(len, encoded))),
+            _uint32_bytes(map(len, encoded)),
+            b"".join(encoded),
+        ]
+        if kind == DELTA:
+            parts.append(_uint32_bytes(indices))
+        parts.append(records)
+        return b"".join(parts)  # Un seul write() par segment
+
+    def _encode(self, states: List[tuple], new_strings: List[str]) -> bytearray:
+        """Enregistrements de (snapshot(), backend) ; les chaînes inconnues vont dans new_strings"""
+        strings = self._strings
+
+        def intern(text: str) -> int:
+            index = strings.get(text)
+            if index is None:
+                index = strings[text] = len(strings)
+                new_strings.append(text)
+            return index
+
+        def number(value):
+            """(champ double, code de type)"""
+            if type(value) is float:
+                return value, 0
+            code = _TYPE_CODES.get(type(value))
+            if code is None:
+                raise ValueError(f"Nombre non sauvegardable : {value!r}")
+            return float(intern(str(value))), code
+
+        backend_keys = {}  # id(backend) -> indice de "nom:précision"
+        records = bytearray(RECORD.size * len(states))
+        pack_into = RECORD.pack_into
+        offset = 0
+        for (entry, value, accumulator, operation, wait), backend in states:
+            backend_key = backend_keys.get(id(backend))
+            if backend_key is None:
+                if backend.name not in BACKEND_NAMES:
+                    raise ValueError(f"Backend non sauvegardable : {backend.name!r}")
+                backend_key = backend_keys[id(backend)] = intern(f"{backend.name}:{backend.precision}")
+
+            flags = WAIT if wait else 0
+            if type(value) is not float:
+                value, code = number(value)
+                flags |= code << VALUE_SHIFT
+            if accumulator is None:
+                accumulator = 0.0
+            else:
+                flags |= HAS_PREVIOUS
+                if type(accumulator) is not float:
+                    accumulator, code = number(accumulator)
+                    flags |= code << PREVIOUS_SHIFT
+            pack_into(records, offset, value, accumulator,
+                      NO_STRING if entry is None else intern(entry),
+                      NO_STRING if operation is None else intern(operation),
+                      backend_key, flags)
+            offset += RECORD.size
+        return records
+
+
+class CheckpointReader:
+    """
+    Lecture d'un point de reprise par projection mémoire (mmap)
+
+    Les enregistrements ne sont décodés qu'à la demande ; seule la table de
+    chaînes est lue à l'ouverture.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.strings = []         # Table de chaînes (indices globaux au fichier)
+        self.delta_records = 0    # Enregistrements dans les deltas
+        self._records = {}        # Indice -> position de son dernier enregistrement (deltas)
+        self._base = 0            # Position des enregistrements du segment FULL
+        self._base_count = 0
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError(f"Point de reprise vide ou tronqué : {path}")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        magic, version, record_size = HEADER.unpack_from(self._view)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self.close()
+            raise ValueError(f"Format de point de reprise inconnu : {path}")
+        self.valid_size = self._scan()
+        self._count = max(self._base_count, max(self._records, default=-1) + 1)
+        self._backends = {}  # Indice de chaîne -> (nom, précision)
+
+    def _scan(self) -> int:
+        """Lit les en-têtes de segments ; renvoie la taille utile (sans segment tronqué)"""
+        view = self._view
+        size = len(view)
+        offset = HEADER.size
+        while offset + SEGMENT.size <= size:
+            kind, count, string_count, string_bytes = SEGMENT.unpack_from(view, offset)
+            lengths_at = offset + SEGMENT.size
+            strings_at = lengths_at + 4 * string_count
+            records_at = strings_at + string_bytes + (4 * count if kind == DELTA else 0)
+            end = records_at + count * RECORD.size
+            if kind not in (FULL, DELTA) or end > size:
+                break
+            if kind == FULL:
+                self.strings = []
+                self._records = {}
+                self._base, self._base_count = records_at, count
+                self.delta_records = 0
+            else:
+                indices = _uint32_array(view[strings_at + string_bytes:records_at])
+                for position, index in enumerate(indices):
+                    self._records[index] = records_at + position * RECORD.size
+                self.delta_records += count
+            position = strings_at
+            for length in _uint32_array(view[lengths_at:strings_at]):
+                self.strings.append(str(view[position:position + length], "utf-8"))
+                position += length
+            offset = end
+        return offset
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _backend(self, key: int) -> tuple:
+        """(nom, précision) du backend rangé dans la chaîne key"""
+        backend = self._backends.get(key)
+        if backend is None:
+            name, _, precision = self.strings[key].rpartition(":")
+            backend = self._backends[key] = (name, int(precision))
+        return backend
+
+    def _decode(self, fields: tuple) -> tuple:
+        """Champs d'un enregistrement -> (backend, précision, snapshot)"""
+        value, accumulator, entry, operation, backend, flags = fields
+        strings = self.strings
+        code = (flags >> VALUE_SHIFT) & 3
+        if code:
+            value = NUMBER_TYPES[code](strings[int(value)])
+        if flags & HAS_PREVIOUS:
+            code = (flags >> PREVIOUS_SHIFT) & 3
+            if code:
+                accumulator = NUMBER_TYPES[code](strings[int(accumulator)])
+        else:
+            accumulator = None
+        name, precision = self._backend(backend)
+        return name, precision, (
+            None if entry == NO_STRING else strings[entry],
+            value,
+            accumulator,
+            None if operation == NO_STRING else strings[operation],
+            bool(flags & WAIT),
+        )
+
+    def _position(self, index: int) -> int:
+        position = self._records.get(index)
+        if position is None:
+            if not 0 <= index < self._base_count:
+                raise IndexError("calculatrice absente du point de reprise")
+            position = self._base + index * RECORD.size
+        return position
+
+    def state(self, index: int) -> tuple:
+        """(backend, précision, snapshot) de la calculatrice index"""
+        return self._decode(RECORD.unpack_from(self._view, self._position(index)))
+
+    def __getitem__(self, index: int) -> Calculator:
+        name, precision, snapshot = self.state(index)
+        return calculator_from_snapshot(snapshot, name, precision)
+
+    def calculators(self) -> List[Calculator]:
+        """Recrée toutes les calculatrices (dans l'ordre des indices)"""
+        strings = self.strings
+        backends, backend_of = self._backends, self._backend
+        decode = self._decode
+        from_snapshot = calculator_from_snapshot
+        calculators = []
+        append = calculators.append
+        base = self._base
+        # Des millions d'objets sans cycle : le ramasse-miettes ne ferait que des passes inutiles
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            # Boucle chaude : décodage en ligne tant que les nombres sont des doubles en clair
+            for fields in RECORD.iter_unpack(self._view[base:base + self._base_count * RECORD.size]):
+                value, accumulator, entry, operation, backend, flags = fields
+                if flags & _TEXT_NUMBERS:
+                    name, precision, snapshot = decode(fields)
+                else:
+                    name, precision = backends[backend] if backend in backends else backend_of(backend)
+                    snapshot = (
+                        None if entry == NO_STRING else strings[entry],
+                        value,
+                        accumulator if flags & HAS_PREVIOUS else None,
+                        None if operation == NO_STRING else strings[operation],
+                        flags & WAIT == WAIT,
+                    )
+                append(from_snapshot(snapshot, name, precision))
+        finally:
+            if gc_enabled:
+                gc.enable()
+        calculators.extend([None] * (self._count - self._base_count))
+        for index in self._records:
+            calculators[index] = self[index]
+        if None in calculators:
+            raise ValueError(f"Point de reprise incohérent (calculatrice manquante) : {self.path}")
+        return calculators
+
+    def restore_into(self, calculators: Sequence[Calculator]) -> None:
+        """
+        Remet l'état sauvegardé dans des calculatrices existantes
+
+        Raises:
+            ValueError: Si le nombre de calculatrices ou un backend diffère
+        """
+        if len(calculators) != self._count:
+            raise ValueError(f"{self._count} calculatrices sauvegardées, {len(calculators)} fournies")
+        for index, calc in enumerate(calculators):
+            name, _, snapshot = self.state(index)
+            if calc.backend != name:
+                raise ValueError(f"Calculatrice {index} : backend {calc.backend!r}, sauvegardé {name!r}")
+            calc.restore(snapshot)
+
+    def close(self) -> None:
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def save_calculators(path: str, calculators: Sequence[Calculator]) -> int:
+    """Point de reprise complet ; renvoie le nombre d'enregistrements écrits"""
+    return CheckpointWriter(path).checkpoint(calculators)
+
+
+def load_calculators(path: str) -> List[Calculator]:
+    """Recrée les calculatrices d'un point de reprise"""
+    with CheckpointReader(path) as reader:
+        return reader.calculators()
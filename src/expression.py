@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Compilation d'expressions infixes ("3+4*2", "prix*qte")
+Une expression est analysée une seule fois puis réévaluée autant que nécessaire
+"""
+
+import re
+from collections import OrderedDict
+from typing import Callable, Dict, Mapping, Optional
+
+from calculator import CALCULATION_ERRORS, OPERATORS
+
+_TOKEN_RE = re.compile(r"\s*(?:([0-9]+\.?[0-9]*|\.[0-9]+)|([A-Za-z_][A-Za-z0-9_]*)|([-+*/()√²]))")
+
+# Un noeud compilé : environnement des variables -> résultat (None = "Erreur")
+Node = Callable[[Mapping[str, float]], Optional[float]]
+
+
+def _tokenize(source: str) -> list:
+    """Découpe la source en jetons (nombre, nom, symbole)"""
+    tokens = []
+    pos = 0
+    source = source.rstrip()
+    while pos < len(source):
+        match = _TOKEN_RE.match(source, pos)
+        if not match:
+            raise ValueError(f"Caractère inattendu en position {pos} : {source[pos:pos + 1]!r}")
+        number, name, symbol = match.groups()
+        if number is not None:
+            tokens.append(("num", float(number)))
+        elif name is not None:
+            tokens.append(("name", name))
+        else:
+            tokens.append(("op", symbol))
+        pos = match.end()
+    return tokens
+
+
+def _constant(value: Optional[float]) -> Node:
+    return lambda env: value
+
+
+def _variable(name: str) -> Node:
+    return lambda env: env[name]
+
+
+# Les calculs passent par les fonctions précalculées du registre de la
+# calculatrice : mêmes règles (et mêmes erreurs) que _perform_calculation
+
+def _binary(left: Node, right: Node, calculate) -> Node:
+    def node(env):
+        a = left(env)
+        if a is None:
+            return None
+        b = right(env)
+        if b is None:
+            return None
+        try:
+            return calculate(a, b)
+        except CALCULATION_ERRORS:
+            return None
+    return node
+
+
+def _unary(operand: Node, calculate) -> Node:
+    def node(env):
+        a = operand(env)
+        if a is None:
+            return None
+        try:
+            return calculate(0.0, a)
+        except CALCULATION_ERRORS:
+            return None
+    return node
+
+
+# Opérateurs préfixes et suffixes des expressions -> symbole du registre
+_PREFIX = {"-": "±", "√": "√"}
+_POSTFIX = {"²": "x²"}
+
+
+class _Parser:
+    """
+    Analyseur par précédence : les priorités des opérations binaires
+    viennent du registre OPERATORS (+ -  <  * /), puis viennent les
+    préfixes (- √) et enfin le suffixe ²
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.tokens = _tokenize(source)
+        self.pos = 0
+        self.variables = set()
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise ValueError("Expression vide")
+        node, _ = self._expression()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"Jeton inattendu : {self.tokens[self.pos][1]!r}")
+        return node
+
+    def _peek(self) -> Optional[str]:
+        if self.pos < len(self.tokens) and self.tokens[self.pos][0] == "op":
+            return self.tokens[self.pos][1]
+        return None
+
+    # Chaque règle renvoie (noeud, est_constant) pour le pliage des constantes
+    def _fold(self, node: Node, constant: bool):
+        if constant:
+            return _constant(node({})), True
+        return node, False
+
+    def _expression(self, min_precedence: int = 0):
+        left, left_const = self._factor()
+        while True:
+            operator = OPERATORS.get(self._peek())
+            if operator is None or operator.arity != 2 or operator.precedence < min_precedence:
+                return left, left_const
+            self.pos += 1
+            # Associativité à gauche : la droite ne prend que les priorités supérieures
+            right, right_const = self._expression(operator.precedence + 1)
+            left, left_const = self._fold(_binary(left, right, operator.calculate),
+                                          left_const and right_const)
+
+    def _factor(self):
+        symbol = self._peek()
+        if symbol == "+":
+            self.pos += 1
+            return self._factor()
+        if symbol in _PREFIX:
+            self.pos += 1
+            operand, constant = self._factor()
+            return self._fold(_unary(operand, OPERATORS[_PREFIX[symbol]].calculate), constant)
+        return self._postfix()
+
+    def _postfix(self):
+        node, constant = self._primary()
+        while self._peek() in _POSTFIX:
+            symbol = self.tokens[self.pos][1]
+            self.pos += 1
+            node, constant = self._fold(_unary(node, OPERATORS[_POSTFIX[symbol]].calculate), constant)
+        return node, constant
+
+    def _primary(self):
+        if self.pos >= len(self.tokens):
+            raise ValueError("Fin d'expression inattendue")
+        kind, value = self.tokens[self.pos]
+        self.pos += 1
+        if kind == "num":
+            return _constant(value), True
+        if kind == "name":
+            self.variables.add(value)
+            return _variable(value), False
+        if value == "(":
+            node, constant = self._expression()
+            if self._peek() != ")":
+                raise ValueError("Parenthèse fermante manquante")
+            self.pos += 1
+            return node, constant
+        raise ValueError(f"Jeton inattendu : {value!r}")
+
+
+class CompiledExpression:
+    """
+    Expression compilée en arbre de fermetures, réutilisable
+
+    Exemple :
+        expr = compile_expression("prix * qte")
+        expr.evaluate(prix=2.5, qte=4)   # 10.0
+    """
+
+    __slots__ = ("source", "variables", "_node")
+
+    def __init__(self, source: str):
+        parser = _Parser(source)
+        self._node = parser.parse()
+        self.source = source
+        self.variables = frozenset(parser.variables)
+
+    def evaluate(self, values: Optional[Mapping[str, float]] = None, **kwargs: float) -> Optional[float]:
+        """
+        Évalue l'expression
+
+        Args:
+            values: Valeurs des variables (dictionnaire)
+            **kwargs: Valeurs des variables (arguments nommés)
+
+        Returns:
+            Le résultat, ou None si erreur (comme _perform_calculation)
+
+        Raises:
+            KeyError: Si une variable n'a pas de valeur
+        """
+        if kwargs:
+            values = {**values, **kwargs} if values else kwargs
+        return self._node(values or {})
+
+    __call__ = evaluate
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.source!r})"
+
+
+class ExpressionCache:
+    """Cache LRU borné des expressions compilées, indexé par le texte source"""
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize < 1:
+            raise ValueError("maxsize doit être >= 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, CompiledExpression]" = OrderedDict()
+
+    def get(self, source: str) -> CompiledExpression:
+        """Renvoie l'expression compilée, en la compilant si besoin"""
+        entries = self._entries
+        compiled = entries.get(source)
+        if compiled is not None:
+            self.hits += 1
+            entries.move_to_end(source)
+            return compiled
+
+        self.misses += 1
+        compiled = CompiledExpression(source)
+        entries[source] = compiled
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)  # La moins récemment utilisée
+        return compiled
+
+    def info(self) -> Dict[str, int]:
+        """Statistiques du cache"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self) -> None:
+        """Vide le cache et remet les compteurs à zéro"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Cache partagé par défaut
+default_cache = ExpressionCache()
+
+
+def compile_expression(source: str) -> CompiledExpression:
+    """Compile une expression (avec le cache partagé)"""
+    return default_cache.get(source)
+
+
+def evaluate(source: str, values: Optional[Mapping[str, float]] = None, **kwargs: float) -> Optional[float]:
+    """Compile (si besoin) puis évalue une expression ; None si erreur"""
+    return default_cache.get(source).evaluate(values, **kwargs)
@@ -4,9 +4,154 @@ Interface graphique moderne avec CustomTkinter
 """
 
 import customtkinter as ctk
-import math
-from typing import Callable
-from calculator import Calculator
+import queue
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from decimal import Decimal
+from fractions import Fraction
+from functools import partial
+from typing import Callable, Dict, List, Optional
+from calculator import DIGITS, KEY_ALIASES, OPERATIONS, OPERATORS, UNARY_OPERATIONS, Calculator
+from history import UndoHistory
+from programmer import (BASE_DIGITS, BASES, DEFAULT_WORD_SIZE, HEX_DIGITS, INT_OPERATIONS,
+                        INT_UNARY_OPERATIONS, PROGRAMMER_ALIASES, WORD_SIZES, ProgrammerCalculator)
+from rpn import ENTER_KEYS, STACK_KEYS, RPNCalculator
+from running_stats import RunningStats
+from tape import TapeReader, TapedCalculator, TapeWriter
+
+
+# Message de statut des opérations immédiates (par défaut : "symbole(valeur) = résultat")
+UNARY_STATUS = {
+    "√": "√{value} = {result}",
+    "x²": "{value}² = {result}",
+    "±": "Signe inversé",
+}
+UNARY_ERRORS = {
+    "√": "❌ Racine de nombre négatif impossible",
+}
+
+# Touches du clavier (keysym Tk) -> bouton
+KEYSYM_BUTTONS = {"Return": "=", "KP_Enter": "=", "Escape": "AC", "Delete": "AC"}
+# Caractères collés traduits avant évaluation (les autres inconnus sont ignorés)
+PASTE_TRANSLATIONS = {"×": "*", "÷": "/", ",": ".", "\n": "="}
+INPUT_KEYS = DIGITS | OPERATIONS | UNARY_OPERATIONS | set(KEY_ALIASES) | {".", "="}
+PROGRAMMER_INPUT_KEYS = set(HEX_DIGITS) | set(INT_OPERATIONS) | set(INT_UNARY_OPERATIONS) | {"="}
+
+# Clavier standard : (texte, ligne, colonne, couleur, colonnes occupées)
+STANDARD_BUTTONS = [
+    # Ligne 0 - Fonctions spéciales
+    ("AC", 0, 0, "#ff4444", 1),   # All Clear - rouge
+    ("±", 0, 1, "#666666", 1),    # Plus/Minus - gris
+    ("√", 0, 2, "#666666", 1),    # Racine carrée - gris
+    ("/", 0, 3, "#ff8c00", 1),    # Division - orange
+    # Ligne 1 - Chiffres 7-9 et multiplication
+    ("7", 1, 0, "#333333", 1),    # Chiffres - gris foncé
+    ("8", 1, 1, "#333333", 1),
+    ("9", 1, 2, "#333333", 1),
+    ("*", 1, 3, "#ff8c00", 1),    # Multiplication - orange
+    # Ligne 2 - Chiffres 4-6 et soustraction
+    ("4", 2, 0, "#333333", 1),
+    ("5", 2, 1, "#333333", 1),
+    ("6", 2, 2, "#333333", 1),
+    ("-", 2, 3, "#ff8c00", 1),    # Soustraction - orange
+    # Ligne 3 - Chiffres 1-3 et addition
+    ("1", 3, 0, "#333333", 1),
+    ("2", 3, 1, "#333333", 1),
+    ("3", 3, 2, "#333333", 1),
+    ("+", 3, 3, "#ff8c00", 1),    # Addition - orange
+    # Ligne 4 - Zéro (2 colonnes), point et carré
+    ("0", 4, 0, "#333333", 2),
+    (".", 4, 2, "#333333", 1),    # Point décimal
+    ("x²", 4, 3, "#666666", 1),   # Carré (gris plus clair)
+    # Ligne 5 - Égal sur toute la ligne
+    ("=", 5, 0, "#0066cc", 4),
+]
+
+# Mode programmeur : (texte, ligne, colonne, couleur, colonnes occupées)
+PROGRAMMER_BUTTONS = [
+    ("HEX", 0, 0, "#0066cc", 1), ("DEC", 0, 1, "#0066cc", 1), ("OCT", 0, 2, "#0066cc", 1),
+    ("BIN", 0, 3, "#0066cc", 1), ("64 bits", 0, 4, "#666666", 1), ("AC", 0, 5, "#ff4444", 1),
+    ("AND", 1, 0, "#666666", 1), ("OR", 1, 1, "#666666", 1), ("XOR", 1, 2, "#666666", 1),
+    ("NOT", 1, 3, "#666666", 1), ("<<", 1, 4, "#666666", 1), (">>", 1, 5, "#666666", 1),
+    ("A", 2, 0, "#333333", 1), ("B", 2, 1, "#333333", 1), ("7", 2, 2, "#333333", 1),
+    ("8", 2, 3, "#333333", 1), ("9", 2, 4, "#333333", 1), ("/", 2, 5, "#ff8c00", 1),
+    ("C", 3, 0, "#333333", 1), ("D", 3, 1, "#333333", 1), ("4", 3, 2, "#333333", 1),
+    ("5", 3, 3, "#333333", 1), ("6", 3, 4, "#333333", 1), ("*", 3, 5, "#ff8c00", 1),
+    ("E", 4, 0, "#333333", 1), ("F", 4, 1, "#333333", 1), ("1", 4, 2, "#333333", 1),
+    ("2", 4, 3, "#333333", 1), ("3", 4, 4, "#333333", 1), ("-", 4, 5, "#ff8c00", 1),
+    ("MOD", 5, 0, "#ff8c00", 1), ("±", 5, 1, "#666666", 1), ("0", 5, 2, "#333333", 2),
+    ("=", 5, 4, "#0066cc", 1), ("+", 5, 5, "#ff8c00", 1),
+]
+WORD_SIZE_BUTTON = "64 bits"
+
+# Mode RPN : ENTER et manipulations de pile à la place de "="
+RPN_BUTTONS = STANDARD_BUTTONS[:-1] + [
+    ("SWAP", 5, 0, "#666666", 1), ("ROLL", 5, 1, "#666666", 1),
+    ("DUP", 5, 2, "#666666", 1), ("DROP", 5, 3, "#666666", 1),
+    ("ENTER", 6, 0, "#0066cc", 4),
+]
+RPN_INPUT_KEYS = INPUT_KEYS | {" "}  # Espace : sépare deux nombres (empile la saisie)
+# Niveaux de pile affichés au-dessus de l'écran
+RPN_STACK_LINES = 4
+
+# Couleur de survol de chaque couleur de bouton (plus claire)
+HOVER_COLORS = {
+    "#ff4444": "#ff6666",  # Rouge plus clair
+    "#ff8c00": "#ffaa33",  # Orange plus clair
+    "#666666": "#888888",  # Gris plus clair
+    "#333333": "#555555",  # Gris foncé plus clair
+    "#0066cc": "#3399ff",  # Bleu → Bleu plus clair
+}
+
+# Intervalle de relève des résultats du thread de calcul (une frame à 60 Hz)
+RESULT_POLL_MS = 16
+
+# Calculs affichés par page dans le panneau de la bande
+TAPE_PAGE_SIZE = 50
+
+
+class LatencyProbe:
+    """
+    Sonde de latence de la boucle Tk
+
+    Programme un rappel toutes les interval_ms et mesure son retard :
+    le pire retard est le plus long blocage de la boucle d'événements.
+    """
+
+    def __init__(self, root, interval_ms: int = 16):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.worst_stall = 0.0
+        self.total_lag = 0.0
+        self.samples = 0
+        self._expected = 0.0
+        self._after_id = None
+
+    def start(self) -> None:
+        self._expected = time.perf_counter() + self.interval_ms / 1000
+        self._after_id = self.root.after(self.interval_ms, self._tick)
+
+    def stop(self) -> None:
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _tick(self) -> None:
+        now = time.perf_counter()
+        lag = max(0.0, now - self._expected)
+        self.worst_stall = max(self.worst_stall, lag)
+        self.total_lag += lag
+        self.samples += 1
+        self._expected = now + self.interval_ms / 1000
+        self._after_id = self.root.after(self.interval_ms, self._tick)
+
+    def report(self) -> dict:
+        """Pire blocage et retard moyen, en millisecondes"""
+        return {
+            "worst_stall_ms": self.worst_stall * 1000,
+            "mean_lag_ms": self.total_lag / self.samples * 1000 if self.samples else 0.0,
+            "samples": self.samples,
+        }
 
 
 class CalculatorGUI:
@@ -17,23 +162,81 @@ class CalculatorGUI:
     Tous les calculs sont délégués à la classe Calculator.
     """
     
-    def __init__(self):
+    def __init__(self, backend: str = "float", precision: int = 28, probe_latency: bool = False,
+                 tape_path: Optional[str] = None, programmer: bool = False,
+                 word_size: Optional[int] = DEFAULT_WORD_SIZE, rpn: bool = False):
+        # Durée de chaque phase du démarrage, en secondes (main.py --profile-startup)
+        self.startup_times: Dict[str, float] = {}
+        clock = time.perf_counter
+        start = clock()
+        
         # Configuration du thème moderne
         ctk.set_appearance_mode("dark")  # "dark", "light", "system"
         ctk.set_default_color_theme("blue")  # "blue", "green", "dark-blue"
+        self.startup_times["theme"] = clock() - start
+        
+        # Logique métier (séparée !), avec bande de calcul si demandée
+        self.tape = TapeWriter(tape_path) if tape_path else None
+        # Mode programmeur : entiers, bases et opérations bit à bit (pas de bande)
+        # Mode RPN : pile d'opérandes, ENTER (float uniquement, pas de bande)
+        self.programmer = programmer
+        self.rpn = rpn
+        if (programmer or rpn) and self.tape:
+            raise ValueError("la bande n'enregistre que le mode standard")
+        if programmer and rpn:
+            raise ValueError("modes programmeur et RPN exclusifs")
+        self._input_keys, self._key_aliases = INPUT_KEYS, KEY_ALIASES
+        if programmer:
+            self.calculator = ProgrammerCalculator(word_size)
+            self._input_keys, self._key_aliases = PROGRAMMER_INPUT_KEYS, PROGRAMMER_ALIASES
+        elif rpn:
+            self.calculator = RPNCalculator()
+            self._input_keys = RPN_INPUT_KEYS
+        elif self.tape:
+            self.calculator = TapedCalculator(self.tape, backend, precision)
+        else:
+            self.calculator = Calculator(backend, precision)
+        self.history = UndoHistory(self.calculator)
+        self.stats = RunningStats()
+        self._handlers = self._build_handlers()
+        
+        # Calculs lourds (collage, saisie rapide) : un seul thread, donc dans l'ordre
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pycalc-calcul")
+        self._results: "queue.Queue" = queue.Queue()
+        self._jobs_pending = 0
+        self._polling = False
+        self._key_buffer: List[str] = []
         
-        # Logique métier (séparée !)
-        self.calculator = Calculator()
+        # Mises à jour de l'affichage regroupées : une seule par frame
+        self._pending_display = None
+        self._pending_status = None
+        self._rendered_display = None
+        self._rendered_status = None
+        self._flush_scheduled = False
         
-        # Interface
+        # Panneau de la bande : construit à la première ouverture
+        self.tape_window = None
+        self._tape_page = 0
+        
+        # Interface : seul ce qui est visible au premier rendu est construit ici
+        start = clock()
         self._setup_window()
+        self.startup_times["_setup_window"] = clock() - start
+        start = clock()
         self._create_widgets()
+        self.startup_times["_create_widgets"] = clock() - start
+        self._bind_keys()
+        self.constructed_at = clock()
+        
+        self.latency_probe = LatencyProbe(self.root) if probe_latency else None
+        if self.latency_probe:
+            self.latency_probe.start()
     
     def _setup_window(self) -> None:
         """Configuration de la fenêtre principale"""
         self.root = ctk.CTk()
         self.root.title("🧮 Calculatrice i-gore")
-        self.root.geometry("350x500")
+        self.root.geometry("460x560" if self.programmer else "350x640" if self.rpn else "350x500")
         self.root.resizable(False, False)
         
         # Configuration responsive
@@ -41,7 +244,15 @@ class CalculatorGUI:
         self.root.grid_rowconfigure(1, weight=1)
     
     def _create_widgets(self) -> None:
-        """Création de tous les widgets de l'interface"""
+        """
+        Création des widgets visibles au premier rendu
+        
+        Le contenu de la barre de statut est construit au premier passage
+        de la boucle (après le rendu de l'écran et du clavier), les panneaux
+        (bande) à leur première ouverture.
+        """
+        # Une seule police pour tous les boutons du clavier
+        self._button_font = ctk.CTkFont(size=15 if self.programmer else 18, weight="bold")
         self._create_display()
         self._create_buttons()
         self._create_status_bar()
@@ -54,96 +265,103 @@ class CalculatorGUI:
         # Variable pour l'affichage
         self.display_var = ctk.StringVar(value="0")
         
+        # Mode RPN : niveaux de pile au-dessus de l'écran (le niveau 1 est l'écran)
+        self.stack_label = None
+        self._rendered_stack = None
+        if self.rpn:
+            self.stack_label = ctk.CTkLabel(
+                self.display_frame, text=self._format_stack(), font=ctk.CTkFont(family="Courier", size=14),
+                anchor="e", justify="right", width=300
+            )
+            self.stack_label.pack(padx=15, pady=(10, 0))
+        
         # Label d'affichage avec style moderne
+        # Mode programmeur : 64 chiffres binaires, police réduite et retour à la ligne
         self.display = ctk.CTkLabel(
             self.display_frame,
             textvariable=self.display_var,
-            font=ctk.CTkFont(size=32, weight="bold"),
+            font=ctk.CTkFont(size=20 if self.programmer else 32, weight="bold"),
             anchor="e",  # Aligné à droite comme une vraie calculatrice
-            width=300,
-            height=70
+            width=410 if self.programmer else 300,
+            height=70,
+            wraplength=410 if self.programmer else 0
         )
         self.display.pack(padx=15, pady=15)
     
     def _create_buttons(self) -> None:
-        """Crée tous les boutons de la calculatrice"""
+        """Crée tous les boutons de la calculatrice (un seul placement par bouton)"""
         self.buttons_frame = ctk.CTkFrame(self.root, corner_radius=10)
         self.buttons_frame.grid(row=1, column=0, padx=10, pady=5, sticky="nsew")
         
+        if self.programmer:
+            layout, rows, columns, width, height, pad = PROGRAMMER_BUTTONS, 6, 6, 60, 50, 4
+        elif self.rpn:
+            layout, rows, columns, width, height, pad = RPN_BUTTONS, 7, 4, 70, 55, 5
+        else:
+            layout, rows, columns, width, height, pad = STANDARD_BUTTONS, 6, 4, 70, 60, 5
+        
         # Configuration responsive : tous les boutons s'adaptent
-        for i in range(5):  # 5 lignes de boutons
+        for i in range(rows):
             self.buttons_frame.grid_rowconfigure(i, weight=1)
-        for i in range(4):  # 4 colonnes
+        for i in range(columns):
             self.buttons_frame.grid_columnconfigure(i, weight=1)
         
-        # Définition des boutons : (texte, ligne, colonne, couleur)
-        button_config = [
-        # Ligne 0 - Fonctions spéciales
-        ("AC", 0, 0, "#ff4444"),   # All Clear - rouge
-        ("±", 0, 1, "#666666"),    # Plus/Minus - gris
-        ("√", 0, 2, "#666666"),    # Racine carrée - gris
-        ("/", 0, 3, "#ff8c00"),    # Division - orange
-
-        # Ligne 1 - Chiffres 7-9 et multiplication
-        ("7", 1, 0, "#333333"),    # Chiffres - gris foncé
-        ("8", 1, 1, "#333333"),
-        ("9", 1, 2, "#333333"),
-        ("*", 1, 3, "#ff8c00"),    # Multiplication - orange
-
-        # Ligne 2 - Chiffres 4-6 et soustraction
-        ("4", 2, 0, "#333333"),
-        ("5", 2, 1, "#333333"),
-        ("6", 2, 2, "#333333"),
-        ("-", 2, 3, "#ff8c00"),    # Soustraction - orange
-
-        # Ligne 3 - Chiffres 1-3 et addition
-        ("1", 3, 0, "#333333"),
-        ("2", 3, 1, "#333333"),
-        ("3", 3, 2, "#333333"),
-        ("+", 3, 3, "#ff8c00"),    # Addition - orange
-
-        # Ligne 4 - Zero (colspan=2), point, carré et égal
-        ("0", 4, 0, "#333333"),    # prendra 2 colonnes (0 et 1) dans le grid
-        (".", 4, 2, "#333333"),    # Point décimal
-        ("x²", 4, 3, "#666666"),   # Carré (gris plus clair)
-        ("=", 5, 0, "#0066cc"),    # Égal - orange (descendu pour aérer)
-    ]
-
-        
-        # Création des boutons avec leurs styles
+        font = self._button_font
         self.button_widgets = {}
-        for text, row, col, color in button_config:
+        for text, row, col, color, span in layout:
             btn = ctk.CTkButton(
                 self.buttons_frame,
                 text=text,
-                font=ctk.CTkFont(size=18, weight="bold"),
+                font=font,
                 command=lambda t=text: self._on_button_click(t),
-                width=70,
-                height=60,
+                width=width,
+                height=height,
                 corner_radius=10,
                 fg_color=color,
-                hover_color=self._get_hover_color(color)
+                hover_color=HOVER_COLORS.get(color, "#555555")
             )
-            
-            # Le bouton "0" prend 2 colonnes
-            if text == "0":
-                btn.grid(row=row, column=col, columnspan=2, padx=5, pady=5, sticky="nsew")
-            else:
-                btn.grid(row=row, column=col, padx=5, pady=5, sticky="nsew")
-            self.button_widgets[text] = btn
-
-            # Le bouton "=" prends toute la ligne
-            if text == "=":
-                btn.grid(row=row, column=col, columnspan=4, padx=5, pady=5, sticky="nsew")
-            else:
-                btn.grid(row=row, column=col, padx=5, pady=5, sticky="nsew")
-            
+            btn.grid(row=row, column=col, columnspan=span, padx=pad, pady=pad, sticky="nsew")
             self.button_widgets[text] = btn
+        if self.programmer:
+            self._refresh_programmer_buttons()
+    
+    def _refresh_programmer_buttons(self) -> None:
+        """Grise les chiffres absents de la base courante, affiche base et taille de mot"""
+        digits = BASE_DIGITS[self.calculator.base]
+        for digit in HEX_DIGITS:
+            self.button_widgets[digit].configure(state="normal" if digit in digits else "disabled")
+        for key, base in BASES.items():
+            self.button_widgets[key].configure(fg_color="#0066cc" if base == self.calculator.base else "#333333")
+        word_size = self.calculator.word_size
+        self.button_widgets[WORD_SIZE_BUTTON].configure(text="∞ bits" if word_size is None else f"{word_size} bits")
     
     def _create_status_bar(self) -> None:
-        """Barre de statut en bas pour les messages"""
+        """Barre de statut en bas : place réservée, contenu construit au premier passage de la boucle"""
         self.status_frame = ctk.CTkFrame(self.root, corner_radius=10, height=40)
         self.status_frame.grid(row=2, column=0, padx=10, pady=(5, 10), sticky="ew")
+        self.status_label = None
+        self.root.after_idle(self._create_status_bar_content)
+    
+    def _create_status_bar_content(self) -> None:
+        """Boutons (annuler, rétablir, statistiques, bande) et message de la barre de statut"""
+        start = time.perf_counter()
+        small_font = ctk.CTkFont(size=14, weight="bold")
+        hover = HOVER_COLORS["#666666"]
+        
+        def small_button(text, command, side, padx):
+            button = ctk.CTkButton(self.status_frame, text=text, width=32, height=28, font=small_font,
+                                   fg_color="#666666", hover_color=hover, command=command)
+            button.pack(side=side, padx=padx, pady=6)
+            return button
+        
+        # Annuler / rétablir (aussi Ctrl+Z / Ctrl+Y)
+        self.undo_button = small_button("↶", self._on_undo, "left", (10, 0))
+        # Statistiques : Σ+ ajoute la valeur affichée, Σ0 repart de zéro
+        self.stats_button = small_button("Σ+", self._on_stats_add, "left", (4, 0))
+        self.stats_clear_button = small_button("Σ0", self._on_stats_clear, "left", (4, 0))
+        self.redo_button = small_button("↷", self._on_redo, "right", (0, 10))
+        if self.tape:
+            self.tape_button = small_button("📜", self._open_tape_panel, "right", (0, 4))
         
         self.status_label = ctk.CTkLabel(
             self.status_frame,
@@ -151,17 +369,111 @@ class CalculatorGUI:
             font=ctk.CTkFont(size=12)
         )
         self.status_label.pack(pady=10)
+        self._rendered_status = "Prêt"
+        if self._pending_status is not None:
+            self._schedule_flush()  # Message arrivé avant la barre
+        self.startup_times["status_bar (différé)"] = time.perf_counter() - start
     
-    def _get_hover_color(self, base_color: str) -> str:
-        """Génère une couleur de survol plus claire que la couleur de base"""
-        color_map = {
-            "#ff4444": "#ff6666",  # Rouge plus clair
-            "#ff8c00": "#ffaa33",  # Orange plus clair
-            "#666666": "#888888",  # Gris plus clair
-            "#333333": "#555555",  # Gris foncé plus clair
-            "#0066cc": "#3399ff"   # Bleu → Bleu plus clair
-        }
-        return color_map.get(base_color, "#555555")
+    def _build_handlers(self) -> Dict[str, Callable[[], None]]:
+        """Table texte du bouton -> action (un seul accès dictionnaire par clic)"""
+        if self.programmer:
+            handlers = {digit: partial(self._on_digit, digit) for digit in HEX_DIGITS}
+            handlers.update({symbol: partial(self._on_operation, symbol) for symbol in INT_OPERATIONS})
+            handlers.update({symbol: partial(self._on_unary, symbol) for symbol in INT_UNARY_OPERATIONS})
+            handlers.update({key: partial(self._on_base, key) for key in BASES})
+            handlers[WORD_SIZE_BUTTON] = self._on_word_size
+            handlers["="] = self._on_equals
+            handlers["AC"] = self._on_clear
+            return handlers
+        if self.rpn:
+            keys = list(DIGITS) + list(OPERATORS) + list(STACK_KEYS) + list(ENTER_KEYS) + [".", "AC", " "]
+            return {key: partial(self._on_rpn_key, key) for key in keys}
+        handlers = {digit: partial(self._on_digit, digit) for digit in DIGITS}
+        for symbol, operator in OPERATORS.items():
+            action = self._on_operation if operator.arity == 2 else self._on_unary
+            handlers[symbol] = partial(action, symbol)
+        handlers["."] = self._on_decimal
+        handlers["="] = self._on_equals
+        handlers["AC"] = self._on_clear
+        return handlers
+    
+    def _bind_keys(self) -> None:
+        """Raccourcis clavier et collage (Ctrl+V)"""
+        self.root.bind("<Key>", self._on_key)
+        self.root.bind("<<Paste>>", self._on_paste)
+        self.root.bind("<Control-v>", self._on_paste)
+        self.root.bind("<Control-z>", self._on_undo)
+        self.root.bind("<Control-y>", self._on_redo)
+        self.root.bind("<Control-Z>", self._on_redo)  # Ctrl+Maj+Z
+    
+    def _on_key(self, event) -> None:
+        """Touche du clavier : mise en tampon, traitée au prochain passage de la boucle"""
+        key = KEYSYM_BUTTONS.get(event.keysym, event.char)
+        key = self._key_aliases.get(key, key)
+        if key not in self._input_keys and key != "AC":
+            return
+        if not self._key_buffer:
+            self.root.after_idle(self._flush_keys)
+        self._key_buffer.append(key)
+    
+    def _flush_keys(self) -> None:
+        """Une touche isolée est traitée comme un clic, une rafale part en lot"""
+        keys, self._key_buffer = self._key_buffer, []
+        if len(keys) == 1:
+            self._on_button_click(keys[0])
+        elif keys:
+            self._submit(keys, f"⌨️ {len(keys)} touches saisies")
+    
+    def _on_paste(self, event=None) -> str:
+        """Évalue le contenu du presse-papiers hors de la boucle Tk"""
+        try:
+            text = self.root.clipboard_get()
+        except Exception:
+            return "break"  # Presse-papiers vide
+        keys = [PASTE_TRANSLATIONS.get(char, char) for char in text]
+        keys = [self._key_aliases.get(key, key) for key in keys]
+        keys = [key for key in keys if key in self._input_keys]
+        if keys:
+            self._submit(keys, f"📋 {len(keys)} touches collées")
+        return "break"
+    
+    def _submit(self, keys: List[str], label: str) -> None:
+        """Envoie une séquence de touches au thread de calcul"""
+        self._jobs_pending += 1
+        self._update_status("⏳ Calcul en cours...")
+        future = self._executor.submit(self.calculator.feed, keys)
+        # Appelé dans le thread de calcul : on ne touche pas à Tk, on passe par la file
+        future.add_done_callback(lambda done: self._results.put((done, label)))
+        if not self._polling:
+            self._polling = True
+            self.root.after(RESULT_POLL_MS, self._poll_results)
+    
+    def _poll_results(self) -> None:
+        """Récupère (dans la boucle Tk) les résultats du thread de calcul"""
+        while True:
+            try:
+                future, label = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._jobs_pending -= 1
+            self._show_job_result(future, label)
+        
+        if self._jobs_pending:
+            self.root.after(RESULT_POLL_MS, self._poll_results)
+        else:
+            self._polling = False
+    
+    def _show_job_result(self, future: Future, label: str) -> None:
+        try:
+            result = future.result()
+        except Exception as e:
+            self._update_display("Erreur")
+            self._update_status(f"❌ Erreur : {str(e)[:30]}")
+            return
+        self._update_display(result)
+        self._update_status("❌ Erreur de calcul" if result == "Erreur" else label)
+        if not self._jobs_pending:
+            self.history.checkpoint()
     
     def _on_button_click(self, button_text: str) -> None:
         """
@@ -169,94 +481,270 @@ class CalculatorGUI:
         
         Cette méthode fait le pont entre l'interface et la logique métier
         """
+        handler = self._handlers.get(button_text)
+        if handler is None:
+            return
+        if self._jobs_pending:
+            # Un calcul est en cours : ce clic passe après lui, dans l'ordre
+            self._submit([button_text], f"Touche : {button_text}")
+            return
         try:
-            if button_text.isdigit():
-                # Chiffres 0-9
-                result = self.calculator.input_number(button_text)
-                self._update_display(result)
-                self._update_status(f"Nombre saisi : {button_text}")
-                
-            elif button_text == ".":
-                # Point décimal
-                result = self.calculator.input_decimal()
-                self._update_display(result)
-                self._update_status("Point décimal ajouté")
-                
-            elif button_text in ["+", "-", "*", "/"]:
-                # Opérations de base
-                result = self.calculator.input_operation(button_text)
-                self._update_display(result)
-                self._update_status(f"Opération : {button_text}")
-                
-            elif button_text == "=":
-                # Calcul du résultat final
-                result = self.calculator.calculate_result()
-                self._update_display(result)
-                if result == "Erreur":
-                    self._update_status("❌ Erreur de calcul")
-                else:
-                    self._update_status("✅ Résultat calculé")
-                
-            elif button_text == "AC":
-                # All Clear - remise à zéro complète
-                self.calculator.reset()
-                self._update_display("0")
-                self._update_status("🔄 Calculatrice remise à zéro")
-                
-            elif button_text == "√":
-                # Racine carrée (opération immédiate)
-                current = float(self.calculator.get_display_value())
-                if current < 0:
-                    self._update_display("Erreur")
-                    self._update_status("❌ Racine de nombre négatif impossible")
-                else:
-                    result = math.sqrt(current)
-                    self.calculator.current_value = str(result)
-                    self._update_display(str(result))
-                    self._update_status(f"√{current} = {result}")
-            
-            elif button_text == "x²":
-                # Carré (opération immédiate)
-                current = float(self.calculator.get_display_value())
-                result = current ** 2
-                self.calculator.current_value = str(result)
-                self._update_display(str(result))
-                self._update_status(f"{current}² = {result}")
-                
-            elif button_text == "±":
-                # Changement de signe
-                current = float(self.calculator.get_display_value())
-                result = -current
-                self.calculator.current_value = str(result)
-                self._update_display(str(result))
-                self._update_status("Signe inversé")
-                
+            handler()
+            self.history.checkpoint()
         except Exception as e:
             # Gestion d'erreur globale
             self._update_display("Erreur")
             self._update_status(f"❌ Erreur : {str(e)[:30]}")
     
+    def _on_undo(self, event=None) -> str:
+        """Annule la dernière touche"""
+        self._step_history(self.history.undo, "↶ Annulé", "Rien à annuler")
+        return "break"
+    
+    def _on_redo(self, event=None) -> str:
+        """Rétablit la touche annulée"""
+        self._step_history(self.history.redo, "↷ Rétabli", "Rien à rétablir")
+        return "break"
+    
+    def _step_history(self, step: Callable[[], str], done: str, nothing: str) -> None:
+        if self._jobs_pending:
+            self._update_status("⏳ Calcul en cours...")
+            return
+        result = step()
+        if result is None:
+            self._update_status(nothing)
+        else:
+            self._update_display(result)
+            self._update_status(done)
+    
+    def _on_stats_add(self) -> None:
+        """Ajoute la valeur affichée aux statistiques"""
+        if self._jobs_pending:
+            self._update_status("⏳ Calcul en cours...")
+            return
+        try:
+            if self.programmer:
+                value = float(self.calculator.value)
+            else:
+                value = float(Fraction(self.calculator.get_display_value()))  # "1/3" (backend fraction) compris
+            self.stats.add(value)
+        except (ValueError, ZeroDivisionError, OverflowError):
+            self._update_status("❌ Valeur non comptée")
+            return
+        self._update_status(self._format_stats())
+    
+    def _on_stats_clear(self) -> None:
+        """Remet les statistiques à zéro"""
+        self.stats = RunningStats()
+        self._update_status("Σ remis à zéro")
+    
+    def _format_stats(self) -> str:
+        """Résumé court pour la barre de statut"""
+        stats = self.stats
+        stdev = stats.stdev()
+        spread = "" if stdev is None else f" σ={stdev:.6g}"
+        return f"Σ n={stats.count} Σ={stats.sum:.10g} moy={stats.mean:.6g}{spread}"
+    
+    def _open_tape_panel(self) -> None:
+        """Ouvre le panneau de la bande (créé au premier appel)"""
+        if self.tape_window is None or not self.tape_window.winfo_exists():
+            self.tape_window = ctk.CTkToplevel(self.root)
+            self.tape_window.title("📜 Bande de calcul")
+            self.tape_window.geometry("380x420")
+            self.tape_text = ctk.CTkTextbox(self.tape_window, font=ctk.CTkFont(family="Courier", size=12))
+            self.tape_text.pack(fill="both", expand=True, padx=10, pady=(10, 5))
+            navigation = ctk.CTkFrame(self.tape_window, fg_color="transparent")
+            navigation.pack(fill="x", padx=10, pady=(0, 10))
+            ctk.CTkButton(navigation, text="◀ Plus anciens", width=120,
+                          command=lambda: self._show_tape_page(self._tape_page + 1)).pack(side="left")
+            ctk.CTkButton(navigation, text="Plus récents ▶", width=120,
+                          command=lambda: self._show_tape_page(self._tape_page - 1)).pack(side="right")
+            self.tape_page_label = ctk.CTkLabel(navigation, text="")
+            self.tape_page_label.pack()
+        self._show_tape_page(0)
+        self.tape_window.lift()
+    
+    def _show_tape_page(self, page: int) -> None:
+        """Affiche une seule page de la bande (les plus récents en page 0)"""
+        self.tape.flush()
+        with TapeReader(self.tape.path) as reader:
+            pages = max(1, -(-len(reader) // TAPE_PAGE_SIZE))
+            page = min(max(page, 0), pages - 1)
+            lines = [self._format_tape_record(record) for record in reader.page(page, TAPE_PAGE_SIZE)]
+        self._tape_page = page
+        self.tape_text.configure(state="normal")
+        self.tape_text.delete("1.0", "end")
+        self.tape_text.insert("1.0", "\n".join(lines) or "Bande vide")
+        self.tape_text.configure(state="disabled")
+        self.tape_page_label.configure(text=f"Page {page + 1}/{pages}")
+    
+    @staticmethod
+    def _format_tape_record(record) -> str:
+        """Une ligne du panneau : heure, calcul et résultat"""
+        if record.operation in UNARY_OPERATIONS:
+            calculation = f"{record.operation}({record.current:g})"
+        else:
+            calculation = f"{record.prev:g} {record.operation} {record.current:g}"
+        result = "Erreur" if record.result is None else f"{record.result:g}"
+        return f"{time.strftime('%H:%M:%S', time.localtime(record.timestamp))}  {calculation} = {result}"
+    
+    def _on_digit(self, digit: str) -> None:
+        """Chiffres 0-9 (et A-F en mode programmeur)"""
+        if self.programmer and digit not in BASE_DIGITS[self.calculator.base]:
+            self._update_status(f"Chiffre {digit} absent en base {self.calculator.base}")
+            return
+        result = self.calculator.input_number(digit)
+        self._update_display(result)
+        self._update_status(f"Nombre saisi : {digit}")
+    
+    def _on_decimal(self) -> None:
+        """Point décimal"""
+        result = self.calculator.input_decimal()
+        self._update_display(result)
+        self._update_status("Point décimal ajouté")
+    
+    def _on_operation(self, symbol: str) -> None:
+        """Opérations binaires (+, -, *, /...)"""
+        result = self.calculator.input_operation(symbol)
+        self._update_display(result)
+        self._update_status(f"Opération : {symbol}")
+    
+    def _on_unary(self, symbol: str) -> None:
+        """Opérations immédiates (√, x², ±...) sur la valeur affichée"""
+        value = self.calculator.get_display_value()
+        result = self.calculator.apply_unary(symbol)
+        self._update_display(result)
+        if result == "Erreur":
+            self._update_status(UNARY_ERRORS.get(symbol, "❌ Erreur de calcul"))
+        else:
+            template = UNARY_STATUS.get(symbol, symbol + "({value}) = {result}")
+            self._update_status(template.format(value=value, result=result))
+    
+    def _on_equals(self) -> None:
+        """Calcul du résultat final"""
+        result = self.calculator.calculate_result()
+        self._update_display(result)
+        if result == "Erreur":
+            self._update_status("❌ Erreur de calcul")
+        else:
+            self._update_status("✅ Résultat calculé")
+    
+    def _on_rpn_key(self, key: str) -> None:
+        """Mode RPN : une touche (chiffre, ENTER, opération, manipulation de pile)"""
+        result = self.calculator.feed((key,))
+        self._update_display(result)
+        if result == "Erreur":
+            self._update_status("❌ Pile trop courte ou calcul impossible")
+        else:
+            depth = len(self.calculator.stack)
+            self._update_status(f"Touche : {key.strip() or 'espace'} — pile : {depth} niveau{'x' if depth > 1 else ''}")
+    
+    def _format_stack(self) -> str:
+        """Niveaux RPN_STACK_LINES+1 à 2 de la pile, du plus profond au plus proche"""
+        values = self.calculator.visible_stack(RPN_STACK_LINES)
+        lines = [""] * (RPN_STACK_LINES - len(values))
+        for level, value in zip(range(len(values) + 1, 1, -1), values):
+            lines.append(f"{level}: {self._format_display(str(value))}")
+        return "\n".join(lines)
+    
+    def _on_base(self, key: str) -> None:
+        """Mode programmeur : change la base d'affichage et de saisie"""
+        self._update_display(self.calculator.set_base(BASES[key]))
+        self._refresh_programmer_buttons()
+        self._update_status(f"Base {BASES[key]}")
+    
+    def _on_word_size(self) -> None:
+        """Mode programmeur : passe à la taille de mot suivante (8, 16, 32, 64, illimitée)"""
+        index = WORD_SIZES.index(self.calculator.word_size) if self.calculator.word_size in WORD_SIZES else -1
+        word_size = WORD_SIZES[(index + 1) % len(WORD_SIZES)]
+        self._update_display(self.calculator.set_word_size(word_size))
+        self._refresh_programmer_buttons()
+        self._update_status("Entiers illimités" if word_size is None else f"Mots de {word_size} bits")
+    
+    def _on_clear(self) -> None:
+        """All Clear - remise à zéro complète"""
+        self.calculator.reset()
+        self._update_display("0")
+        self._update_status("🔄 Calculatrice remise à zéro")
+    
     def _update_display(self, value: str) -> None:
-        """Met à jour l'affichage principal"""
-        # Limite la longueur pour éviter le débordement
+        """Met à jour l'affichage principal (au prochain rendu)"""
+        self._pending_display = value
+        self._schedule_flush()
+    
+    def _update_status(self, message: str) -> None:
+        """Met à jour la barre de statut (au prochain rendu)"""
+        self._pending_status = message
+        self._schedule_flush()
+    
+    def _schedule_flush(self) -> None:
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after_idle(self._flush_updates)
+    
+    def _flush_updates(self) -> None:
+        """Applique la dernière valeur demandée, une seule fois par frame"""
+        self._flush_scheduled = False
+        value, self._pending_display = self._pending_display, None
+        message, self._pending_status = self._pending_status, None
+        if self.status_label is None:
+            self._pending_status, message = message, None  # Barre pas encore construite
+        
+        if value is not None:
+            value = self._format_display(value)
+            if value != self._rendered_display:
+                self.display_var.set(value)
+                self._rendered_display = value
+            if self.stack_label is not None:
+                stack = self._format_stack()  # DUP, SWAP... changent la pile sans changer l'écran
+                if stack != self._rendered_stack:
+                    self.stack_label.configure(text=stack)
+                    self._rendered_stack = stack
+        if message is not None and message != self._rendered_status:
+            self.status_label.configure(text=message)
+            self._rendered_status = message
+    
+    def _format_display(self, value: str) -> str:
+        """Limite la longueur pour éviter le débordement"""
+        if self.programmer:
+            return value  # Entier exact : jamais de notation scientifique (retour à la ligne)
         if len(value) > 12:
             try:
                 # Passage en notation scientifique si trop long
-                float_value = float(value)
-                value = f"{float_value:.4e}"
-            except ValueError:
+                value = self._to_scientific(value, getattr(self.calculator, "backend", "float") != "float")
+            except (ValueError, ArithmeticError):
                 value = "Erreur"
-        
-        self.display_var.set(value)
+        return value
     
-    def _update_status(self, message: str) -> None:
-        """Met à jour la barre de statut"""
-        self.status_label.configure(text=message)
+    @staticmethod
+    def _to_scientific(value: str, exact: bool = False) -> str:
+        """
+        Notation scientifique : float pour le backend float (affichage
+        inchangé, "3.0000e-01", "inf"), Decimal pour un décimal ou une
+        fraction ("7/3") sans passer par un float
+        """
+        if not exact:
+            return f"{float(value):.4e}"
+        numerator, _, denominator = value.partition("/")
+        number = Decimal(numerator)
+        if denominator:
+            number /= Decimal(denominator)
+        return f"{number:.4e}"
     
     def run(self) -> None:
         """Lance l'application graphique"""
         print("🚀 Lancement de la calculatrice...")
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            if self.tape:
+                self.tape.close()
+            if self.latency_probe:
+                self.latency_probe.stop()
+                report = self.latency_probe.report()
+                print(f"⏱️ Pire blocage de la boucle : {report['worst_stall_ms']:.1f} ms "
+                      f"(retard moyen {report['mean_lag_ms']:.2f} ms sur {report['samples']} frames)")
 
 
 # Test rapide si le fichier est lancé directement
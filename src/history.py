@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Historique annuler/rétablir de la calculatrice
+Tampon circulaire de snapshots immuables, taille fixe
+"""
+
+from typing import Optional
+
+from calculator import Calculator
+
+
+class UndoHistory:
+    """
+    Historique borné des états d'une Calculator
+
+    Appeler checkpoint() après chaque touche ; undo() et redo() remettent
+    l'état précédent ou suivant en O(1). Au-delà de capacity états, les
+    plus anciens sont oubliés : la mémoire reste fixe.
+
+    Exemple :
+        history = UndoHistory(calculator)
+        calculator.input_number("5")
+        history.checkpoint()
+        history.undo()   # Retour à "0"
+    """
+
+    def __init__(self, calculator: Calculator, capacity: int = 1000):
+        if capacity < 2:
+            raise ValueError("capacity doit être >= 2")
+        self.calculator = calculator
+        self.capacity = capacity
+        self._states = [None] * capacity  # Tampon circulaire
+        self._start = 0    # Position du plus ancien état
+        self._size = 0     # Nombre d'états valides (y compris ceux à rétablir)
+        self._cursor = -1  # Rang de l'état courant parmi les états valides
+        self.checkpoint()
+
+    def checkpoint(self) -> bool:
+        """
+        Enregistre l'état courant (s'il a changé)
+
+        Returns:
+            True si un nouvel état a été enregistré
+        """
+        state = self.calculator.snapshot()
+        if self._cursor >= 0 and self._states[(self._start + self._cursor) % self.capacity] == state:
+            return False
+
+        # Un nouvel état efface ce qui pouvait être rétabli
+        self._size = self._cursor + 1
+        if self._size == self.capacity:
+            # Plein : on oublie le plus ancien
+            self._states[self._start] = None
+            self._start = (self._start + 1) % self.capacity
+            self._size -= 1
+        self._states[(self._start + self._size) % self.capacity] = state
+        self._size += 1
+        self._cursor = self._size - 1
+        return True
+
+    def undo(self) -> Optional[str]:
+        """Revient à l'état précédent ; renvoie la valeur affichée, ou None si impossible"""
+        if not self.can_undo:
+            return None
+        self._cursor -= 1
+        self.calculator.restore(self._states[(self._start + self._cursor) % self.capacity])
+        return self.calculator.get_display_value()
+
+    def redo(self) -> Optional[str]:
+        """Rétablit l'état annulé ; renvoie la valeur affichée, ou None si impossible"""
+        if not self.can_redo:
+            return None
+        self._cursor += 1
+        self.calculator.restore(self._states[(self._start + self._cursor) % self.capacity])
+        return self.calculator.get_display_value()
+
+    @property
+    def can_undo(self) -> bool:
+        return self._cursor > 0
+
+    @property
+    def can_redo(self) -> bool:
+        return self._cursor < self._size - 1
+
+    def clear(self) -> None:
+        """Oublie tout l'historique (l'état courant devient le seul état)"""
+        self._states = [None] * self.capacity
+        self._start = 0
+        self._size = 0
+        self._cursor = -1
+        self.checkpoint()
+
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Instrumentation optionnelle de la calculatrice
+Compteurs d'appels, compteurs d'erreurs et histogrammes de latence
+
+Désactivée, elle ne coûte rien : enable() remplace les méthodes de la
+classe par des versions mesurées, disable() remet les originales.
+
+    from instrumentation import enable, disable
+    metrics = enable()
+    ...
+    print(metrics.snapshot())
+    disable()
+"""
+
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Optional
+
+from calculator import Calculator
+
+
+# Bornes des histogrammes (secondes) : 1 µs, 2 µs, 4 µs... ~1 s
+BUCKET_BOUNDS = tuple(1e-6 * 2 ** k for k in range(21))
+
+# Méthodes mesurées
+CALCULATOR_METHODS = (
+    "input_number", "input_decimal", "input_operation", "apply_unary",
+    "calculate_result", "feed", "_perform_calculation",
+)
+GUI_METHODS = ("_on_button_click", "_update_display")
+
+
+class Histogram:
+    """Histogramme de latences à seaux logarithmiques (base 2)"""
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)  # Dernier seau : au-delà de la dernière borne
+        self.total = 0.0
+        self.count = 0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+
+def _error_kind(method: str, args: tuple, result) -> Optional[str]:
+    """
+    Type d'erreur d'un appel, ou None s'il a réussi
+
+    "erreur" compte les "Erreur" renvoyés à l'utilisateur ; la cause
+    (division_par_zero, racine_negative, calcul) est comptée en plus
+    au niveau de _perform_calculation.
+    """
+    if result == "Erreur":
+        return "erreur"
+    if method == "_perform_calculation" and result is None:
+        if len(args) < 3:
+            return "calcul"
+        prev, current, operation = args[-3:]
+        if operation == "/" and current == 0:
+            return "division_par_zero"
+        if operation == "√" and current < 0:
+            return "racine_negative"
+        return "calcul"
+    return None
+
+
+class Instrumentation:
+    """Mesures collectées (partagées par tous les objets instrumentés)"""
+
+    def __init__(self):
+        self.calls: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+        self._dump_thread = None
+        self._dump_stop = threading.Event()
+
+    def record(self, method: str, seconds: float, args: tuple, result) -> None:
+        """Enregistre un appel (et son erreur éventuelle)"""
+        with self._lock:
+            self.calls[method] = self.calls.get(method, 0) + 1
+            histogram = self.histograms.get(method)
+            if histogram is None:
+                histogram = self.histograms[method] = Histogram()
+            histogram.record(seconds)
+            kind = _error_kind(method, args, result)
+            if kind is not None:
+                self.errors[kind] = self.errors.get(kind, 0) + 1
+
+    def reset(self) -> None:
+        """Remet toutes les mesures à zéro"""
+        with self._lock:
+            self.calls.clear()
+            self.errors.clear()
+            self.histograms.clear()
+
+    def snapshot(self) -> dict:
+        """Copie des mesures sous forme de dictionnaire"""
+        with self._lock:
+            return {
+                "calls": dict(self.calls),
+                "errors": dict(self.errors),
+                "latency": {
+                    method: {
+                        "count": h.count,
+                        "sum": h.total,
+                        "buckets": dict(zip(BUCKET_BOUNDS + (float("inf"),), h.counts)),
+                    }
+                    for method, h in self.histograms.items()
+                },
+            }
+
+    def prometheus_text(self) -> str:
+        """Mesures au format texte de Prometheus"""
+        data = self.snapshot()
+        lines = [
+            "# HELP pycalc_calls_total Nombre d'appels par méthode",
+            "# TYPE pycalc_calls_total counter",
+        ]
+        for method, count in sorted(data["calls"].items()):
+            lines.append(f'pycalc_calls_total{{method="{method}"}} {count}')
+
+        lines += [
+            "# HELP pycalc_errors_total Nombre d'erreurs par type",
+            "# TYPE pycalc_errors_total counter",
+        ]
+        for kind, count in sorted(data["errors"].items()):
+            lines.append(f'pycalc_errors_total{{kind="{kind}"}} {count}')
+
+        lines += [
+            "# HELP pycalc_latency_seconds Durée des appels par méthode",
+            "# TYPE pycalc_latency_seconds histogram",
+        ]
+        for method, h in sorted(data["latency"].items()):
+            cumulative = 0
+            for bound, count in h["buckets"].items():
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:.6g}"
+                lines.append(f'pycalc_latency_seconds_bucket{{method="{method}",le="{le}"}} {cumulative}')
+            lines.append(f'pycalc_latency_seconds_sum{{method="{method}"}} {h["sum"]:.9f}')
+            lines.append(f'pycalc_latency_seconds_count{{method="{method}"}} {h["count"]}')
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str) -> None:
+        """Écrit les mesures au format Prometheus (remplacement atomique du fichier)"""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp_path, path)
+
+    def start_periodic_dump(self, path: str, interval: float = 15.0) -> None:
+        """Écrit les mesures dans path toutes les interval secondes (thread en arrière-plan)"""
+        self.stop_periodic_dump()
+        self._dump_stop.clear()
+
+        def loop():
+            while not self._dump_stop.wait(interval):
+                self.dump(path)
+            self.dump(path)  # Dernière écriture à l'arrêt
+
+        self._dump_thread = threading.Thread(target=loop, name="pycalc-metrics", daemon=True)
+        self._dump_thread.start()
+
+    def stop_periodic_dump(self) -> None:
+        """Arrête l'écriture périodique (après une dernière écriture)"""
+        if self._dump_thread is not None:
+            self._dump_stop.set()
+            self._dump_thread.join()
+            self._dump_thread = None
+
+
+# Méthodes d'origine des classes instrumentées : (classe, nom) -> attribut brut
+_originals: Dict[tuple, object] = {}
+metrics = Instrumentation()
+
+
+def _measured(method: str, func: Callable, instrumentation: Instrumentation) -> Callable:
+    record = instrumentation.record
+    clock = time.perf_counter
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        result = func(*args, **kwargs)
+        record(method, clock() - start, args, result)
+        return result
+    return wrapper
+
+
+def _instrument_class(cls: type, methods: tuple, prefix: str) -> None:
+    for name in methods:
+        key = (cls, name)
+        if key in _originals:
+            continue
+        raw = cls.__dict__[name]
+        _originals[key] = raw
+        if isinstance(raw, staticmethod):
+            setattr(cls, name, staticmethod(_measured(prefix + name, raw.__func__, metrics)))
+        else:
+            setattr(cls, name, _measured(prefix + name, raw, metrics))
+
+
+def enable(gui_class: Optional[type] = None) -> Instrumentation:
+    """
+    Active l'instrumentation de Calculator (et de la GUI si gui_class est donnée)
+
+    Args:
+        gui_class: CalculatorGUI, passée par l'appelant pour ne pas importer
+                   customtkinter ici
+
+    Returns:
+        L'objet qui collecte les mesures
+    """
+    _instrument_class(Calculator, CALCULATOR_METHODS, "")
+    if gui_class is not None:
+        _instrument_class(gui_class, GUI_METHODS, "gui.")
+    return metrics
+
+
+def disable() -> None:
+    """Remet les méthodes d'origine : plus aucun surcoût"""
+    for (cls, name), raw in _originals.items():
+        setattr(cls, name, raw)
+    _originals.clear()
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
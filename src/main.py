@@ -1,19 +1,153 @@
 #!/usr/bin/env python3
 """
 Point d'entrée principal de la calculatrice
+
+Usage :
+    python src/main.py                      # Interface graphique
+    python src/main.py --stdin              # Expressions lues sur l'entrée standard
+    python src/main.py --batch calculs.txt  # Expressions lues dans un fichier
+    python src/main.py --stdin --keys       # Séquences de touches ("12+3=")
+    python src/main.py --batch calculs.txt --workers 4   # Fichier évalué en parallèle
+    python src/main.py --tape bande.bin     # Interface graphique, calculs enregistrés
+    python src/main.py --record session.jsonl  # Touches enregistrées (rejeu : src/replay.py)
+    python src/main.py --batch montants.txt --stats      # Effectif, somme, moyenne, écart-type, centiles
+    python src/main.py --programmer --word-size 32       # Mode programmeur (hex/bin, AND/OR/XOR, décalages)
+    python src/main.py --profile-startup    # Interface graphique, durée de chaque phase du démarrage
+    python src/main.py --rpn                # Interface graphique en notation polonaise inverse (ENTER)
+    echo "3 4 + 2 *" | python src/main.py --stdin --rpn  # Programmes RPN, un par ligne
+    python src/main.py --batch touches.txt --keys --plan  # Préfixes communs calculés une seule fois
 """
 
+import argparse
 import sys
 import os
+import time
+from typing import Iterable, Optional, TextIO
 
 # Pour les imports relatifs
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from gui import CalculatorGUI
+from batch import collect_stats, iter_results
 
+# La GUI (et donc customtkinter) n'est importée que si on la lance
 
-def main():
-    """Fonction principale - lance l'application"""
+
+def run_batch(source: TextIO, output: TextIO, keys: bool = False, backend: str = "float",
+              precision: int = 28, cache=None, calculator=None, rpn: bool = False) -> int:
+    """
+    Lit les lignes de source et écrit les résultats au fil de l'eau
+
+    Returns:
+        Le nombre de lignes traitées
+    """
+    count = 0
+    write = output.write
+    for result in iter_results(source, keys, backend, precision, cache, calculator, rpn):
+        write(result + "\n")
+        count += 1
+    output.flush()
+    return count
+
+
+def run_planned(source: Iterable[str], output: TextIO, keys: bool = False, backend: str = "float",
+                precision: int = 28, cache=None) -> dict:
+    """
+    Comme run_batch, mais le lot entier est planifié (planner.py) : préfixes
+    communs et lignes identiques ne sont calculés qu'une fois
+
+    Returns:
+        Le travail évité (BatchPlanner.info())
+    """
+    from planner import BatchPlanner
+    planner = BatchPlanner(keys, backend, precision, cache)
+    output.write("".join(result + "\n" for result in planner.evaluate(source)))
+    output.flush()
+    return planner.info()
+
+
+def format_plan_info(info: dict) -> str:
+    """Résumé du travail évité par --plan"""
+    return (f"🧩 {info['lines']} lignes, {info['distinct']} distinctes : "
+            f"{info['steps_evaluated']}/{info['steps']} étapes évaluées ({info['saved']:.0%} évitées)")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Analyse les options de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Calculatrice i-gore")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--batch", metavar="FICHIER",
+                      help="évalue chaque ligne du fichier (sans interface graphique)")
+    mode.add_argument("--stdin", action="store_true",
+                      help="évalue chaque ligne de l'entrée standard (sans interface graphique)")
+    parser.add_argument("--keys", action="store_true",
+                        help="les lignes sont des séquences de touches (ex : 12+3=) au lieu d'expressions")
+    parser.add_argument("--workers", type=int, metavar="N",
+                        help="avec --batch : évalue le fichier dans N processus (0 = nombre de coeurs)")
+    parser.add_argument("--chunk-size", type=int, default=4 * 1024 * 1024, metavar="OCTETS",
+                        help="avec --workers : taille des plages du fichier confiées à chaque processus")
+    parser.add_argument("--unordered", action="store_true",
+                        help="avec --workers : écrit les plages dès qu'elles sont prêtes, sans garder l'ordre")
+    parser.add_argument("--backend", choices=("float", "decimal", "fraction", "int"), default="float",
+                        help="représentation des nombres (GUI et --keys) : float rapide ou exacte")
+    parser.add_argument("--precision", type=int, default=28, metavar="CHIFFRES",
+                        help="précision du backend decimal")
+    parser.add_argument("--rpn", action="store_true",
+                        help="notation polonaise inverse : GUI avec ENTER et pile, ou un programme par ligne (\"3 4 + 2 *\")")
+    parser.add_argument("--programmer", action="store_true",
+                        help="mode programmeur (GUI et --keys) : entiers, bases 2/8/10/16, AND OR XOR NOT << >>")
+    parser.add_argument("--word-size", type=int, default=64, metavar="BITS",
+                        help="avec --programmer : taille de mot (8, 16, 32, 64... ; 0 = illimitée)")
+    parser.add_argument("--stats", action="store_true",
+                        help="avec --batch ou --stdin : résume la colonne de nombres (mémoire constante)")
+    parser.add_argument("--plan", action="store_true",
+                        help="avec --batch ou --stdin : lit tout le lot et ne calcule qu'une fois les préfixes "
+                             "communs (--keys) et les lignes identiques ; résumé sur la sortie d'erreur")
+    parser.add_argument("--memo", type=int, default=0, metavar="ENTRÉES",
+                        help="avec --keys : met en cache les calculs répétés (partagé entre les --workers)")
+    parser.add_argument("--tape", metavar="FICHIER",
+                        help="enregistre chaque calcul de l'interface sur une bande binaire")
+    parser.add_argument("--record", metavar="FICHIER",
+                        help="enregistre les touches de l'interface pour les rejouer (src/replay.py)")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="GUI : affiche la durée de chaque phase du démarrage (imports, thème, fenêtre, widgets, première inactivité)")
+    parser.add_argument("--probe-latency", action="store_true",
+                        help="GUI : mesure la latence de la boucle d'événements et affiche le pire blocage")
+    parser.add_argument("--metrics", metavar="FICHIER",
+                        help="instrumente Calculator (touches et GUI) et écrit les mesures (format Prometheus) dans FICHIER")
+    parser.add_argument("--metrics-interval", type=float, default=15.0, metavar="SECONDES",
+                        help="avec --metrics : intervalle entre deux écritures")
+    args = parser.parse_args(argv)
+    if args.workers is not None and not args.batch:
+        parser.error("--workers nécessite --batch")
+    if args.backend != "float" and (args.stdin or args.batch) and (not args.keys or args.workers is not None):
+        parser.error("--backend en mode lot nécessite --keys (sans --workers)")
+    if args.stats and not (args.stdin or args.batch):
+        parser.error("--stats nécessite --batch ou --stdin")
+    if args.stats and (args.keys or args.unordered):
+        parser.error("--stats lit des nombres ou des expressions (sans --keys ni --unordered)")
+    if args.programmer and ((args.stdin or args.batch) and (not args.keys or args.workers is not None)
+                            or args.backend != "float" or args.memo or args.tape):
+        parser.error("--programmer : GUI ou --keys sans --workers, sans --backend, --memo ni --tape")
+    if args.rpn and (args.programmer or args.keys or args.stats or args.backend != "float"
+                     or args.memo or args.tape):
+        parser.error("--rpn est incompatible avec --programmer, --keys, --stats, --backend, --memo et --tape")
+    if args.plan and (not (args.stdin or args.batch) or args.workers is not None or args.stats
+                      or args.rpn or args.programmer):
+        parser.error("--plan nécessite --batch ou --stdin, sans --workers, --stats, --rpn ni --programmer")
+    if args.word_size < 0:
+        parser.error("--word-size doit être >= 0")
+    if args.memo and not args.keys:
+        parser.error("--memo nécessite --keys")
+    if (args.tape or args.record) and (args.stdin or args.batch):
+        parser.error("--tape et --record sont réservés à l'interface graphique")
+    return args
+
+
+def run_gui(backend: str = "float", precision: int = 28, probe_latency: bool = False,
+            tape_path: Optional[str] = None, record_path: Optional[str] = None,
+            programmer: bool = False, word_size: Optional[int] = 64, profile_startup: bool = False,
+            rpn: bool = False) -> None:
+    """Lance l'interface graphique"""
     print("=" * 50)
     print("🧮 CALCULATRICE i-gore")
     print("=" * 50)
@@ -24,8 +158,21 @@ def main():
     
     try:
         # Lance l'interface graphique
-        app = CalculatorGUI()
-        app.run()
+        start = time.perf_counter()
+        from gui import CalculatorGUI
+        imports = time.perf_counter() - start
+        app = CalculatorGUI(backend, precision, probe_latency, tape_path, programmer, word_size, rpn)
+        if profile_startup:
+            app.root.after_idle(lambda: print(format_startup_profile(app, imports, start)))
+        if record_path:
+            from replay import SessionRecorder
+            recorder = SessionRecorder(app).start()
+            try:
+                app.run()
+            finally:
+                print(f"🎬 {recorder.save(record_path)} touches enregistrées dans {record_path}")
+        else:
+            app.run()
         
     except ImportError as e:
         print("❌ ERREUR : Dépendances manquantes")
@@ -43,5 +190,101 @@ def main():
         print("\n👋 Merci d'avoir utilisé la calculatrice i-gore !")
 
 
+def format_startup_profile(app, imports: float, start: float) -> str:
+    """
+    Durée de chaque phase du démarrage de la GUI (appelé à la première inactivité de la boucle)
+
+    Args:
+        app: La CalculatorGUI (startup_times et constructed_at)
+        imports: Durée de l'import de gui (customtkinter compris), en secondes
+        start: Instant (perf_counter) du début de l'import
+    """
+    now = time.perf_counter()
+    times = app.startup_times
+    phases = [("imports", imports)]
+    phases += [(name, times[name]) for name in ("theme", "_setup_window", "_create_widgets") if name in times]
+    phases.append(("first idle", now - app.constructed_at))
+    lines = ["⏱️ Démarrage de la GUI :"]
+    for name, seconds in phases:
+        lines.append(f"  {name:<30} {seconds * 1000:8.1f} ms")
+    for name, seconds in times.items():
+        if name.endswith("(différé)"):
+            lines.append(f"    {'dont ' + name:<28} {seconds * 1000:8.1f} ms")
+    lines.append(f"  {'total':<30} {(now - start) * 1000:8.1f} ms")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Fonction principale - lance l'application"""
+    args = parse_args(argv)
+
+    if args.metrics:
+        import instrumentation
+        gui_class = None
+        if not (args.stdin or args.batch):
+            try:
+                from gui import CalculatorGUI as gui_class
+            except ImportError:
+                pass  # run_gui() affichera l'erreur
+        instrumentation.enable(gui_class).start_periodic_dump(args.metrics, args.metrics_interval)
+
+    try:
+        _run(args)
+    finally:
+        if args.metrics:
+            instrumentation.metrics.stop_periodic_dump()
+
+
+def _run(args: argparse.Namespace) -> None:
+    """Lance le mode demandé"""
+    cache = None
+    calculator = None
+    if args.memo and args.workers is None:
+        from memo import CalculationCache
+        cache = CalculationCache(args.memo)
+    word_size = args.word_size or None
+    if args.programmer and args.keys:
+        from programmer import ProgrammerCalculator
+        calculator = ProgrammerCalculator(word_size)
+    if args.stats:
+        _run_stats(args)
+    elif args.plan:
+        if args.stdin:
+            info = run_planned(sys.stdin, sys.stdout, args.keys, args.backend, args.precision, cache)
+        else:
+            with open(args.batch, encoding="utf-8") as source:
+                info = run_planned(source, sys.stdout, args.keys, args.backend, args.precision, cache)
+        print(format_plan_info(info), file=sys.stderr)
+    elif args.stdin:
+        run_batch(sys.stdin, sys.stdout, args.keys, args.backend, args.precision, cache, calculator, args.rpn)
+    elif args.batch and args.workers is not None:
+        from parallel import run_parallel
+        run_parallel(args.batch, sys.stdout.buffer, workers=args.workers or None,
+                     chunk_size=args.chunk_size, keys=args.keys, ordered=not args.unordered,
+                     memo=args.memo, rpn=args.rpn)
+    elif args.batch:
+        with open(args.batch, encoding="utf-8") as source:
+            run_batch(source, sys.stdout, args.keys, args.backend, args.precision, cache, calculator, args.rpn)
+    else:
+        run_gui(args.backend, args.precision, args.probe_latency, args.tape, args.record,
+                args.programmer, word_size, args.profile_startup, args.rpn)
+
+
+def _run_stats(args: argparse.Namespace) -> None:
+    """Mode --stats : résumé de la colonne lue"""
+    from running_stats import format_summary
+    if args.batch and args.workers is not None:
+        from parallel import stats_parallel
+        stats, ignored = stats_parallel(args.batch, workers=args.workers or None, chunk_size=args.chunk_size)
+    elif args.batch:
+        with open(args.batch, encoding="utf-8") as source:
+            stats, ignored = collect_stats(source)
+    else:
+        stats, ignored = collect_stats(sys.stdin)
+    print(format_summary(stats))
+    if ignored:
+        print(f"⚠️ {ignored} lignes ignorées (pas un nombre fini)")
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
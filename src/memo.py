@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Mémoïsation des calculs : cache des résultats de (précédent, actuel, opération)
+
+Deux caches au même usage (get / put / info / clear) :
+- CalculationCache : LRU borné en mémoire, avec durée de vie optionnelle
+- SharedCalculationCache : table de hachage dans un bloc multiprocessing.shared_memory,
+  partagée par les workers d'un pool (backend float uniquement)
+
+Les résultats "Erreur" (None) sont mis en cache comme les autres. Un cache
+ne sert qu'un seul backend (et une seule précision) : 2 et 2.0, ou
+Decimal("1.0") et Decimal("1.00"), sont égaux mais ne s'affichent pas pareil.
+"""
+
+import struct
+import time
+import zlib
+from collections import OrderedDict
+from multiprocessing import Lock, shared_memory
+from typing import Callable, Dict, Optional
+
+from calculator import OPERATIONS, Calculator
+
+
+# Valeur renvoyée par get() quand la clé est absente (None est un résultat valide)
+MISSING = object()
+
+
+class CalculationCache:
+    """Cache LRU borné des calculs, avec durée de vie optionnelle (ttl, en secondes)"""
+
+    float_only = False
+
+    def __init__(self, maxsize: int = 65536, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        if maxsize < 1:
+            raise ValueError("maxsize doit être >= 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl doit être > 0")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self.backend = None  # (nom, précision) du backend servi, fixé au premier MemoizedCalculator
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, prev, current, operation: str):
+        """Renvoie le résultat en cache, ou MISSING"""
+        key = (prev, current, operation)
+        entry = self._entries.get(key, MISSING)
+        if entry is not MISSING:
+            if self.ttl is None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry
+            result, deadline = entry
+            if self._clock() < deadline:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return result
+            del self._entries[key]  # Expiré
+        self.misses += 1
+        return MISSING
+
+    def put(self, prev, current, operation: str, result) -> None:
+        """Mémorise un résultat (None compris)"""
+        entries = self._entries
+        key = (prev, current, operation)
+        entries[key] = result if self.ttl is None else (result, self._clock() + self.ttl)
+        entries.move_to_end(key)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)  # Le moins récemment utilisé
+
+    def info(self) -> Dict[str, float]:
+        """Statistiques du cache"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self) -> None:
+        """Vide le cache et remet les compteurs à zéro"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# En-tête du bloc partagé : nombre de cases
+HEADER = struct.Struct("<Q")
+# Case de la table partagée : version, état, précédent, actuel, résultat, opération (UTF-8)
+SLOT = struct.Struct("<IBxxxddd8s")
+_VERSION = struct.Struct("<I")
+_EMPTY, _VALUE, _ERROR = 0, 1, 2
+
+
+class SharedCalculationCache:
+    """
+    Cache des calculs dans une mémoire partagée entre processus
+
+    Table à adressage direct : une clé n'a qu'une case possible, et une
+    nouvelle clé remplace l'ancienne (éviction bornée, sans liste LRU).
+    Les écritures sont sérialisées par un verrou ; les lectures sont sans
+    verrou et vérifient le numéro de version de la case (une lecture
+    concurrente d'une écriture compte comme un défaut, jamais comme un
+    résultat faux). Les statistiques sont propres à chaque processus.
+    """
+
+    float_only = True
+
+    def __init__(self, slots: int = 65536, name: Optional[str] = None, lock=None):
+        if slots < 1:
+            raise ValueError("slots doit être >= 1")
+        self._owner = name is None
+        if self._owner:
+            self._memory = shared_memory.SharedMemory(create=True, size=HEADER.size + slots * SLOT.size)
+            self._memory.buf[:] = bytes(len(self._memory.buf))
+            HEADER.pack_into(self._memory.buf, 0, slots)
+        else:
+            self._memory = shared_memory.SharedMemory(name=name)
+        self.slots = HEADER.unpack_from(self._memory.buf, 0)[0]
+        self.lock = lock if lock is not None else Lock()
+        self._buf = self._memory.buf
+        self._op_hashes: Dict[str, tuple] = {}
+        self.backend = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def name(self) -> str:
+        """Nom du bloc de mémoire partagée (pour attach())"""
+        return self._memory.name
+
+    @classmethod
+    def attach(cls, name: str, lock) -> "SharedCalculationCache":
+        """Ouvre dans un worker le cache créé par le processus parent"""
+        return cls(name=name, lock=lock)
+
+    def _operation(self, operation: str) -> tuple:
+        # Hachage stable d'un processus à l'autre (hash() des str ne l'est pas)
+        known = self._op_hashes.get(operation)
+        if known is None:
+            encoded = operation.encode("utf-8")
+            if len(encoded) > 8:
+                raise ValueError("symbole d'opération trop long pour le cache partagé")
+            known = self._op_hashes[operation] = (zlib.crc32(encoded), encoded.ljust(8, b"\0"))
+        return known
+
+    def _offset(self, prev: float, current: float, op_hash: int) -> int:
+        return HEADER.size + ((hash(prev) * 1000003) ^ hash(current) ^ op_hash) % self.slots * SLOT.size
+
+    def get(self, prev, current, operation: str):
+        """Renvoie le résultat en cache, ou MISSING"""
+        op_hash, op_bytes = self._operation(operation)
+        offset = self._offset(prev, current, op_hash)
+        version, state, slot_prev, slot_current, result, slot_op = SLOT.unpack_from(self._buf, offset)
+        if (state != _EMPTY and not version & 1 and slot_prev == prev and slot_current == current
+                and slot_op == op_bytes and _VERSION.unpack_from(self._buf, offset)[0] == version):
+            self.hits += 1
+            return None if state == _ERROR else result
+        self.misses += 1
+        return MISSING
+
+    def put(self, prev, current, operation: str, result) -> None:
+        """Mémorise un résultat (None compris), en remplaçant l'occupant de la case"""
+        op_hash, op_bytes = self._operation(operation)
+        offset = self._offset(prev, current, op_hash)
+        state = _ERROR if result is None else _VALUE
+        with self.lock:
+            version = _VERSION.unpack_from(self._buf, offset)[0]
+            # Impair pendant toute l'écriture du contenu, puis la version paire
+            # est publiée seule, en dernier : un get() concurrent ne peut pas
+            # associer la nouvelle clé à l'ancien résultat
+            _VERSION.pack_into(self._buf, offset, (version + 1) & 0xFFFFFFFF)
+            SLOT.pack_into(self._buf, offset, (version + 1) & 0xFFFFFFFF, state,
+                           prev, current, 0.0 if result is None else result, op_bytes)
+            _VERSION.pack_into(self._buf, offset, (version + 2) & 0xFFFFFFFF)
+
+    def info(self) -> Dict[str, float]:
+        """Statistiques du cache (pour ce processus)"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": sum(1 for offset in range(HEADER.size, HEADER.size + self.slots * SLOT.size, SLOT.size)
+                        if self._buf[offset + 4] != _EMPTY),
+            "maxsize": self.slots,
+        }
+
+    def clear(self) -> None:
+        """Vide la table et remet les compteurs à zéro"""
+        with self.lock:
+            self._buf[HEADER.size:HEADER.size + self.slots * SLOT.size] = bytes(self.slots * SLOT.size)
+        self.hits = 0
+        self.misses = 0
+
+    def close(self) -> None:
+        """Détache le bloc (et le libère si ce processus l'a créé)"""
+        if self._buf is None:
+            return
+        self._buf = None
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# Clés du cache selon le backend
+_PLAIN_KEYS = 0    # fraction, int : une valeur n'a qu'une écriture
+_FLOAT_KEYS = 1    # 0.0 == -0.0 : les zéros ne passent pas par le cache
+_DECIMAL_KEYS = 2  # 1.0 == 1.00 : la clé est le texte du nombre
+
+
+class MemoizedCalculator(Calculator):
+    """Calculator dont les calculs passent par un cache (CalculationCache ou SharedCalculationCache)"""
+
+    __slots__ = ("cache", "_key_mode")
+
+    def __init__(self, cache=None, backend: str = "float", precision: int = 28):
+        """
+        Raises:
+            ValueError: Si le cache sert déjà un autre backend (ou une autre
+                        précision), ou s'il ne stocke que des float
+        """
+        if cache is None:
+            cache = CalculationCache()
+        if cache.float_only and backend != "float":
+            raise ValueError("le cache partagé ne stocke que des float (backend 'float')")
+        served = (backend, None if backend == "float" else precision)
+        if cache.backend is None:
+            cache.backend = served
+        elif cache.backend != served:
+            raise ValueError(f"ce cache sert déjà le backend {cache.backend[0]!r} "
+                             f"(précision {cache.backend[1]})")
+        self.cache = cache
+        self._key_mode = {"float": _FLOAT_KEYS, "decimal": _DECIMAL_KEYS}.get(backend, _PLAIN_KEYS)
+        super().__init__(backend, precision)
+
+    def _perform_calculation(self, prev, current, operation):
+        mode = self._key_mode
+        if mode == _FLOAT_KEYS:
+            # Le signe d'un zéro change le résultat (-0.0 * 5) : calcul direct, peu coûteux
+            if not current or (not prev and operation in OPERATIONS):
+                return super()._perform_calculation(prev, current, operation)
+            key_prev, key_current = prev, current
+        elif mode == _DECIMAL_KEYS:
+            key_prev, key_current = str(prev), str(current)
+        else:
+            key_prev, key_current = prev, current
+
+        cache = self.cache
+        result = cache.get(key_prev, key_current, operation)
+        if result is MISSING:
+            result = super()._perform_calculation(prev, current, operation)
+            cache.put(key_prev, key_current, operation, result)
+        return result
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Évaluation parallèle de gros fichiers de calculs
+Le fichier est découpé en plages d'octets évaluées dans un pool de processus
+"""
+
+import os
+from contextlib import ExitStack
+from multiprocessing import Pool
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from batch import collect_stats, iter_results
+
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024  # 4 Mio par tâche
+
+# Cache des calculs du worker (partagé entre les processus du pool), voir _attach_cache
+_worker_cache = None
+
+
+def split_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """
+    Découpe un fichier en plages d'octets [début, fin) alignées sur les fins de ligne
+
+    Args:
+        path: Fichier à découper
+        chunk_size: Taille visée pour chaque plage (en octets)
+
+    Returns:
+        La liste des plages, dans l'ordre du fichier
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size doit être >= 1")
+
+    size = os.path.getsize(path)
+    chunks = []
+    start = 0
+    with open(path, "rb") as f:
+        while start < size:
+            end = start + chunk_size
+            if end < size:
+                # On avance jusqu'à la fin de la ligne en cours
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            else:
+                end = size
+            chunks.append((start, end))
+            start = end
+    return chunks
+
+
+def _attach_cache(name: str, lock) -> None:
+    """Initialisation d'un worker : ouvre le cache partagé créé par le parent"""
+    global _worker_cache
+    from memo import SharedCalculationCache
+    _worker_cache = SharedCalculationCache.attach(name, lock)
+
+
+def _evaluate_chunk(task: Tuple[str, int, int, bool, bool]) -> Tuple[bytes, int]:
+    """Tâche d'un worker : évalue une plage du fichier"""
+    path, start, end, keys, rpn = task
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    lines = data.decode("utf-8").split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    results = "\n".join(iter_results(lines, keys, cache=_worker_cache, rpn=rpn))
+    if lines:
+        results += "\n"
+    return results.encode("utf-8"), len(lines)
+
+
+def iter_chunk_results(path: str, workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       keys: bool = False, ordered: bool = True, memo: int = 0,
+                       rpn: bool = False) -> Iterator[Tuple[bytes, int]]:
+    """
+    Évalue un fichier en parallèle, plage par plage
+
+    Args:
+        path: Fichier d'expressions (ou de séquences de touches si keys)
+        workers: Nombre de processus (par défaut : nombre de coeurs)
+        chunk_size: Taille visée des plages (en octets)
+        keys: True pour des séquences de touches
+        ordered: True pour produire les plages dans l'ordre du fichier,
+                 False pour les produire dès qu'elles sont prêtes
+        memo: Avec keys, nombre de cases du cache des calculs partagé
+              entre les workers (0 = pas de cache)
+        rpn: True pour des programmes en notation polonaise inverse
+
+    Yields:
+        (résultats encodés en UTF-8, nombre de lignes) pour chaque plage
+    """
+    global _worker_cache
+    tasks = [(path, start, end, keys, rpn) for start, end in split_chunks(path, chunk_size)]
+    if workers == 1:
+        # Pas de pool : évite le coût des processus pour les petits fichiers
+        if memo and keys:
+            from memo import CalculationCache
+            _worker_cache = CalculationCache(memo)
+        try:
+            for task in tasks:
+                yield _evaluate_chunk(task)
+        finally:
+            _worker_cache = None
+        return
+
+    with ExitStack() as stack:
+        pool_options = {}
+        if memo and keys:
+            from memo import SharedCalculationCache
+            cache = stack.enter_context(SharedCalculationCache(memo))
+            pool_options = {"initializer": _attach_cache, "initargs": (cache.name, cache.lock)}
+        pool = stack.enter_context(Pool(processes=workers, **pool_options))
+        mapper = pool.imap if ordered else pool.imap_unordered
+        yield from mapper(_evaluate_chunk, tasks)
+
+
+def run_parallel(path: str, output: BinaryIO, workers: Optional[int] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, keys: bool = False, ordered: bool = True,
+                 memo: int = 0, rpn: bool = False) -> int:
+    """
+    Évalue un fichier en parallèle et écrit les résultats (une ligne par entrée)
+
+    Returns:
+        Le nombre de lignes traitées
+    """
+    count = 0
+    write = output.write
+    for data, lines in iter_chunk_results(path, workers, chunk_size, keys, ordered, memo, rpn):
+        write(data)
+        count += lines
+    output.flush()
+    return count
+
+
+def _chunk_stats(task: Tuple[str, int, int]):
+    """Tâche d'un worker : résume une plage du fichier"""
+    path, start, end = task
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return collect_stats(data.decode("utf-8").split("\n"))
+
+
+def stats_parallel(path: str, workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Résume une colonne de nombres en parallèle : chaque worker résume ses
+    plages, les résumés partiels sont fusionnés (RunningStats.merge)
+
+    Returns:
+        (stats, nombre de lignes ignorées)
+    """
+    from running_stats import RunningStats
+    tasks = [(path, start, end) for start, end in split_chunks(path, chunk_size)]
+    stats = RunningStats()
+    ignored = 0
+    with ExitStack() as stack:
+        if workers == 1:
+            partials = map(_chunk_stats, tasks)
+        else:
+            pool = stack.enter_context(Pool(processes=workers))
+            partials = pool.imap_unordered(_chunk_stats, tasks)
+        for partial, partial_ignored in partials:
+            stats.merge(partial)
+            ignored += partial_ignored
+    return stats, ignored
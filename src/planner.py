@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Planification d'un lot de calculs : ce qui est commun n'est calculé qu'une fois
+
+Séquences de touches : les lignes forment un arbre de préfixes. Chaque
+embranchement est l'état de la calculatrice après ce préfixe. On le calcule
+une seule fois, on le garde (snapshot) et on le reprend (restore) pour
+chacune des suites ; les touches entre deux embranchements passent en un
+seul feed(). "12+3=" et "12+4=" partagent ainsi "12+".
+
+Expressions : les lignes identiques (aux espaces près) ne sont évaluées
+qu'une fois ; l'analyse d'une expression replie déjà ses sous-expressions
+constantes.
+
+Les résultats reviennent dans l'ordre des lignes, avec les règles de
+iter_results : ligne vide -> "", touche inconnue ou calcul impossible ->
+"Erreur".
+"""
+
+from typing import Dict, Iterable, List, Sequence, Union
+
+from calculator import KEY_ALIASES, MEMORY_KEYS, Calculator
+
+
+def _normalize_keys(line: Union[str, Sequence[str]]) -> tuple:
+    """Touches d'une liste, sans espaces et avec les alias résolus ("²" -> "x²")"""
+    return tuple(KEY_ALIASES.get(key, key) for key in line if not key.isspace())
+
+
+# Un embranchement (restore, feed, snapshot) coûte à peu près autant que
+# rejouer une quinzaine de touches : en deçà, on ne le garde pas
+_MIN_SHARED_KEYS = 16
+
+
+def _common_prefix(first: Sequence, last: Sequence, start: int) -> int:
+    """
+    Longueur du préfixe commun, connu jusqu'à start : pas doublés puis
+    dichotomie, sur des tranches (rapide quand le préfixe s'arrête tôt)
+    """
+    limit = min(len(first), len(last))
+    low, step = start, 1
+    while low < limit:
+        high = min(low + step, limit)
+        if first[low:high] != last[low:high]:
+            break
+        low = high
+        step *= 2
+    else:
+        return limit
+    high -= 1  # Le préfixe commun est dans [low, high]
+    while low < high:
+        middle = (low + high + 1) // 2
+        if first[low:middle] == last[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+class BatchPlanner:
+    """
+    Évalue un lot de lignes en partageant les préfixes communs
+
+    Exemple :
+        planner = BatchPlanner(keys=True)
+        planner.evaluate(["12+3=", "12+4=", "12+3="])   # ["15.0", "16.0", "15.0"]
+        planner.info()["saved"]                         # Part du travail évitée
+    """
+
+    def __init__(self, keys: bool = False, backend: str = "float", precision: int = 28, cache=None):
+        """
+        Args:
+            keys: True pour des séquences de touches, False pour des expressions
+            backend: Backend numérique (séquences de touches)
+            precision: Précision du backend "decimal"
+            cache: Cache des calculs (module memo) : les mêmes (précédent,
+                   actuel, opération) venus de préfixes différents ne sont
+                   calculés qu'une fois
+        """
+        if cache is None:
+            self.calculator = Calculator(backend, precision)
+        else:
+            from memo import MemoizedCalculator
+            self.calculator = MemoizedCalculator(cache, backend, precision)
+        self.keys = keys
+        self.cache = cache
+        self._info = {"lines": 0, "distinct": 0, "steps": 0, "steps_evaluated": 0}
+        self._distinct = 0         # Compteurs du parcours en cours
+        self._steps_evaluated = 0
+
+    def evaluate(self, lines: Iterable[Union[str, Sequence[str]]]) -> List[str]:
+        """
+        Évalue toutes les lignes
+
+        Args:
+            lines: Expressions, ou séquences de touches (chaîne ou liste de
+                   touches comme pour Calculator.feed) si keys
+
+        Returns:
+            Le résultat de chaque ligne, dans l'ordre
+        """
+        if self.keys:
+            return self._evaluate_keys(lines)
+        return self._evaluate_expressions(lines)
+
+    def info(self) -> Dict[str, float]:
+        """
+        Travail du dernier evaluate() : lignes non vides, lignes distinctes,
+        étapes d'une évaluation ligne par ligne (touches ou expressions),
+        étapes réellement évaluées et part évitée (saved)
+        """
+        info = dict(self._info)
+        info["saved"] = 1 - info["steps_evaluated"] / info["steps"] if info["steps"] else 0.0
+        if self.cache is not None:
+            info["cache_hit_rate"] = self.cache.info()["hit_rate"]
+        return info
+
+    # --- Expressions ---
+
+    def _evaluate_expressions(self, lines) -> List[str]:
+        from expression import compile_expression
+        results = []
+        distinct = {}  # Texte sans espaces -> résultat
+        count = 0
+        for line in lines:
+            text = "".join(line.split())
+            if not text:
+                results.append("")
+                continue
+            count += 1
+            result = distinct.get(text)
+            if result is None:
+                try:
+                    value = compile_expression(text).evaluate()
+                except (ValueError, KeyError):
+                    value = None
+                result = distinct[text] = "Erreur" if value is None else str(value)
+            results.append(result)
+        self._info = {"lines": count, "distinct": len(distinct), "steps": count, "steps_evaluated": len(distinct)}
+        return results
+
+    # --- Séquences de touches ---
+
+    def _evaluate_keys(self, lines) -> List[str]:
+        lines = list(lines)
+        if not all(isinstance(line, str) for line in lines):
+            lines = [_normalize_keys(line) for line in lines]  # Chaînes et listes comparables
+        prefixes = {}  # Touches avant la première touche mémoire -> {suite -> indices}
+        results = [""] * len(lines)
+        count = steps = 0
+        for index, line in enumerate(lines):
+            if isinstance(line, str):
+                keys = line.strip()
+                if " " in keys or "\t" in keys:
+                    keys = "".join(keys.split())
+                prefix, tail = keys, ""
+            else:
+                keys = line
+                # Les touches mémoire agissent sur les registres, hors snapshot :
+                # le partage s'arrête à la première, la suite est jouée ligne par ligne
+                cut = next((position for position, key in enumerate(keys) if key in MEMORY_KEYS), len(keys))
+                prefix, tail = keys[:cut], keys[cut:]
+            if not keys:
+                continue
+            count += 1
+            steps += len(keys)
+            ends = prefixes.get(prefix)
+            if ends is None:
+                prefixes[prefix] = {tail: [index]}
+            else:
+                ends.setdefault(tail, []).append(index)
+
+        self._distinct = 0
+        self._steps_evaluated = 0
+        if prefixes:
+            self._walk(sorted(prefixes), prefixes, results)
+        self._info = {"lines": count, "distinct": self._distinct, "steps": steps,
+                      "steps_evaluated": self._steps_evaluated}
+        return results
+
+    def _walk(self, ordered: list, prefixes: dict, results: List[str]) -> None:
+        """
+        Parcours de l'arbre des préfixes sans le construire
+
+        Triées, les lignes d'un même sous-arbre sont contiguës, et le préfixe
+        commun d'une plage est celui de sa première et de sa dernière ligne.
+        Chaque plage est donc jouée une fois jusqu'à ce préfixe, puis coupée
+        selon la touche suivante. Un embranchement qui ferait gagner moins de
+        _MIN_SHARED_KEYS touches n'est pas joué : ses sous-plages repartent de
+        l'état précédent.
+        """
+        calc = self.calculator
+        calc.reset(registers=True)
+        # (début, fin, touches jouées dans state, préfixe commun connu, state, affichage après state)
+        pending = [(0, len(ordered), 0, 0, calc.snapshot(), calc.current_value)]
+        while pending:
+            low, high, depth, known, state, display = pending.pop()
+            first = ordered[low]
+            if high - low == 1:
+                shared = len(first)
+            else:
+                shared = _common_prefix(first, ordered[high - 1], known)
+            ends_here = len(first) == shared  # Le préfixe lui-même est une ligne (trié en premier)
+            # Sous-plages selon la touche suivante
+            groups = []
+            start = low + ends_here
+            while start < high:
+                key = ordered[start][shared]
+                end = start + 1
+                while end < high and ordered[end][shared] == key:
+                    end += 1
+                groups.append((start, end))
+                start = end
+
+            if shared > depth and (ends_here or (len(groups) - 1) * (shared - depth) >= _MIN_SHARED_KEYS):
+                calc.restore(state)
+                self._steps_evaluated += shared - depth
+                try:
+                    display = calc.feed(first[depth:shared])
+                except ValueError:
+                    self._fail(ordered[low:high], prefixes, results)  # Touche inconnue dans toute la plage
+                    continue
+                if not groups:
+                    ends = prefixes[first]
+                    tail = first[:0]  # Suite vide, chaîne ou tuple
+                    if len(ends) == 1 and tail in ends:
+                        # Feuille sans suite : inutile de garder l'état
+                        self._distinct += 1
+                        for index in ends[tail]:
+                            results[index] = display
+                        continue
+                state = calc.snapshot()
+                depth = shared
+            if ends_here:
+                self._finish(prefixes[first], state, display, results)
+            for start, end in groups:
+                if end - start == 1:
+                    # Feuille (le cas le plus fréquent) : jouée tout de suite, sans passer par la pile
+                    line = ordered[start]
+                    ends = prefixes[line]
+                    tail = line[:0]
+                    if len(ends) == 1 and tail in ends:
+                        calc.restore(state)
+                        self._steps_evaluated += len(line) - depth
+                        self._distinct += 1
+                        try:
+                            result = calc.feed(line[depth:])
+                        except ValueError:
+                            result = "Erreur"
+                        for index in ends[tail]:
+                            results[index] = result
+                        continue
+                pending.append((start, end, depth, shared + 1, state, display))
+
+    def _finish(self, ends: dict, state: tuple, display: str, results: List[str]) -> None:
+        """Lignes qui se terminent sur ce noeud (ou dont la suite commence par une touche mémoire)"""
+        calc = self.calculator
+        for tail, indices in ends.items():
+            self._distinct += 1
+            if tail:
+                calc.restore(state)
+                calc.registers.clear()
+                self._steps_evaluated += len(tail)
+                try:
+                    result = calc.feed(tail)
+                except ValueError:
+                    result = "Erreur"
+            else:
+                result = display
+            for index in indices:
+                results[index] = result
+
+    def _fail(self, keys: list, prefixes: dict, results: List[str]) -> None:
+        """"Erreur" pour toutes ces lignes"""
+        for prefix in keys:
+            for indices in prefixes[prefix].values():
+                self._distinct += 1
+                for index in indices:
+                    results[index] = "Erreur"
@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Mode programmeur : entiers exacts, bases 2 / 8 / 10 / 16, opérations bit à bit
+
+ProgrammerCalculator ne passe jamais par float : saisie lue avec int(texte, base),
+calculs sur des int Python, résultat ramené à la taille de mot choisie
+(8, 16, 32, 64 bits ou illimitée), en complément à deux si signé.
+
+Exemple :
+    calc = ProgrammerCalculator(word_size=8)
+    calc.feed(["HEX", "F", "0", "OR", "0", "F", "="])   # "FF" (= -1 sur 8 bits signés)
+"""
+
+import re
+from math import isqrt
+from typing import Callable, Dict, Iterable, List, Optional
+
+from calculator import MEMORY_KEYS, MEMORY_REGISTER, Calculator, NumericBackend, _DISPATCH_ERRORS
+
+
+# Bases d'affichage et de saisie : touche -> base
+BASES = {"HEX": 16, "DEC": 10, "OCT": 8, "BIN": 2}
+# Tailles de mot proposées par la GUI (None = illimitée)
+WORD_SIZES = (8, 16, 32, 64, None)
+DEFAULT_WORD_SIZE = 64
+# Décalage maximal en mode illimité (1 << 10**9 prendrait toute la mémoire)
+MAX_UNBOUNDED_SHIFT = 1 << 16
+
+HEX_DIGITS = "0123456789ABCDEF"
+BASE_DIGITS = {base: frozenset(HEX_DIGITS[:base]) for base in BASES.values()}
+_BASE_FORMATS = {16: "X", 8: "o", 2: "b"}
+
+# Touches de plusieurs lettres reconnues dans un texte quand elles sont isolées par
+# des espaces : feed("HEX FF AND 0F =") ("DEC" ou "AC" collés à d'autres
+# caractères restent des chiffres hexadécimaux)
+WORD_KEYS = frozenset(BASES) | frozenset(MEMORY_KEYS) | {"AC", "AND", "OR", "XOR", "NOT", "MOD", "x²"}
+_CHARACTER_KEYS = re.compile(r"<<|>>|\S")
+
+# Raccourcis clavier / texte : feed("FF&0F=") ou feed("1<4=")
+PROGRAMMER_ALIASES = {
+    "&": "AND", "|": "OR", "^": "XOR", "~": "NOT", "<": "<<", ">": ">>", "%": "MOD", "²": "x²",
+    **{digit.lower(): digit for digit in HEX_DIGITS[10:]},
+}
+
+
+def split_keys(text: str) -> List[str]:
+    """Découpe un texte en touches : mots de WORD_KEYS isolés, sinon caractère par caractère ("<<" compris)"""
+    keys = []
+    for word in text.split():
+        if word in WORD_KEYS:
+            keys.append(word)
+        else:
+            keys.extend(_CHARACTER_KEYS.findall(word))
+    return keys
+
+
+def _truncated_divide(prev: int, current: int) -> Optional[int]:
+    """Division entière tronquée vers zéro (comme en C)"""
+    if current == 0:
+        return None  # Division par zéro
+    quotient = abs(prev) // abs(current)
+    return quotient if (prev < 0) == (current < 0) else -quotient
+
+
+def _truncated_remainder(prev: int, current: int) -> Optional[int]:
+    """Reste du signe du dividende (comme en C)"""
+    if current == 0:
+        return None
+    remainder = abs(prev) % abs(current)
+    return -remainder if prev < 0 else remainder
+
+
+def _shift_left(prev: int, current: int) -> Optional[int]:
+    if not 0 <= current <= MAX_UNBOUNDED_SHIFT:
+        return None  # Décalage négatif ou démesuré
+    return prev << current
+
+
+def _shift_right(prev: int, current: int) -> Optional[int]:
+    if current < 0:
+        return None
+    return prev >> current  # Arithmétique : garde le signe
+
+
+def _integer_square_root(current: int) -> Optional[int]:
+    if current < 0:
+        return None
+    return isqrt(current)
+
+
+# Opérations entières : symbole -> f(prev, current), comme le registre de calculator
+INT_OPERATIONS: Dict[str, Callable[[int, int], Optional[int]]] = {
+    "+": int.__add__,
+    "-": int.__sub__,
+    "*": int.__mul__,
+    "/": _truncated_divide,
+    "MOD": _truncated_remainder,
+    "AND": int.__and__,
+    "OR": int.__or__,
+    "XOR": int.__xor__,
+    "<<": _shift_left,
+    ">>": _shift_right,
+}
+INT_UNARY_OPERATIONS: Dict[str, Callable[[int], Optional[int]]] = {
+    "±": int.__neg__,
+    "NOT": int.__invert__,
+    "x²": lambda current: current * current,
+    "√": _integer_square_root,
+}
+_INT_CALCULATIONS = dict(INT_OPERATIONS)
+_INT_CALCULATIONS.update({symbol: (lambda function: lambda prev, current: function(current))(function)
+                          for symbol, function in INT_UNARY_OPERATIONS.items()})
+
+
+class ProgrammerCalculator(Calculator):
+    """
+    Calculatrice entière pour la programmation bas niveau
+
+    Mêmes touches que Calculator (chiffres, opérations, =, AC, mémoire) plus
+    les chiffres A-F, les opérations de INT_OPERATIONS / INT_UNARY_OPERATIONS
+    et les touches de base (HEX, DEC, OCT, BIN). Pas de point décimal.
+    """
+
+    __slots__ = ("base", "signed", "_word_size", "_mask", "_sign_limit", "_defaults")
+
+    def __init__(self, word_size: Optional[int] = DEFAULT_WORD_SIZE, base: int = 10, signed: bool = True):
+        """
+        Args:
+            word_size: Taille de mot en bits (None = entiers illimités)
+            base: Base d'affichage et de saisie (2, 8, 10 ou 16)
+            signed: True pour le complément à deux, False pour des mots non signés
+        """
+        if base not in BASE_DIGITS:
+            raise ValueError(f"Base inconnue : {base!r} (attendu : 2, 8, 10 ou 16)")
+        self.base = base
+        self.signed = signed
+        self._defaults = (base, word_size)
+        self._set_mask(word_size)
+        super().__init__("int")
+        self._backend = NumericBackend("programmer", self._parse_entry, _INT_CALCULATIONS)
+        self._parse = self._parse_entry
+        self._calculations = _INT_CALCULATIONS
+
+    @property
+    def word_size(self) -> Optional[int]:
+        """Taille de mot en bits (None = illimitée)"""
+        return self._word_size
+
+    def _set_mask(self, word_size: Optional[int]) -> None:
+        if word_size is not None and word_size < 1:
+            raise ValueError("word_size doit être >= 1 (ou None)")
+        self._word_size = word_size
+        self._mask = None if word_size is None else (1 << word_size) - 1
+        self._sign_limit = None if word_size is None else 1 << (word_size - 1)
+
+    def _wrap(self, value: int) -> int:
+        """Ramène value à la taille de mot (complément à deux si signé)"""
+        mask = self._mask
+        if mask is None:
+            return value
+        value &= mask
+        if self.signed and value >= self._sign_limit:
+            value -= mask + 1
+        return value
+
+    def _parse_entry(self, text: str) -> int:
+        """Saisie dans la base courante -> entier ramené à la taille de mot"""
+        return self._wrap(int(text, self.base))
+
+    def format(self, value: int, base: Optional[int] = None) -> str:
+        """
+        Texte d'un entier dans une base (par défaut la base courante)
+
+        Avec une taille de mot, un négatif s'affiche en hexadécimal, octal ou
+        binaire par son motif de bits (-1 sur 8 bits -> "FF") ; en décimal
+        et en illimité, avec un signe moins.
+        """
+        base = self.base if base is None else base
+        if base == 10:
+            return str(value)
+        if value < 0 and self._mask is not None:
+            value &= self._mask
+        return format(value, _BASE_FORMATS[base])
+
+    def reset(self, registers: bool = False) -> None:
+        """
+        Remet à zéro ; AC garde la base et la taille de mot, registers=True
+        (calculatrice recyclée) revient aussi à celles de la construction
+        """
+        super().reset(registers)
+        self._value = 0  # Jamais de float, même après AC
+        if registers:
+            self.base, word_size = self._defaults
+            self._set_mask(word_size)
+
+    @property
+    def current_value(self) -> str:
+        if self._entry is not None:
+            return self._entry
+        return self.format(self._value)
+
+    @property
+    def value(self) -> int:
+        """Valeur affichée, en entier"""
+        return self._current_number()
+
+    def set_base(self, base: int) -> str:
+        """
+        Change la base d'affichage et de saisie (la valeur est gardée)
+
+        Returns:
+            La valeur affichée dans la nouvelle base
+        """
+        if base not in BASE_DIGITS:
+            raise ValueError(f"Base inconnue : {base!r} (attendu : 2, 8, 10 ou 16)")
+        if self._entry is not None:
+            self._value = self._parse_entry(self._entry)
+            self._entry = None
+        self.base = base
+        return self.current_value
+
+    def set_word_size(self, word_size: Optional[int]) -> str:
+        """
+        Change la taille de mot ; valeurs en cours ramenées à la nouvelle taille
+
+        Returns:
+            La valeur affichée
+        """
+        if self._entry is not None:
+            self._value = self._parse_entry(self._entry)
+            self._entry = None
+        self._set_mask(word_size)
+        self._value = self._wrap(self._value)
+        if self._accumulator is not None:
+            self._accumulator = self._wrap(self._accumulator)
+        return self.current_value
+
+    def input_number(self, number: str) -> str:
+        """
+        Ajoute un chiffre de la base courante (A-F en hexadécimal)
+
+        Raises:
+            ValueError: Si le chiffre n'existe pas dans la base courante
+        """
+        digit = number.upper()
+        if digit not in BASE_DIGITS[self.base]:
+            raise ValueError(f"Chiffre {number!r} invalide en base {self.base}")
+        if self.wait_for_operand:
+            self._entry = digit
+            self.wait_for_operand = False
+        else:
+            entry = self.current_value
+            self._entry = digit if entry == "0" else entry + digit
+        return self._entry
+
+    def input_decimal(self) -> str:
+        """Pas de décimales en mode entier : la touche est ignorée"""
+        return self.current_value
+
+    def _perform_calculation(self, prev: int, current: int, operation: str) -> Optional[int]:
+        """Calcul entier puis retour à la taille de mot"""
+        try:
+            result = self._calculations[operation](prev, current)
+        except _DISPATCH_ERRORS:
+            return None
+        return None if result is None else self._wrap(result)
+
+    def apply_unary(self, operation: str) -> str:
+        if operation not in INT_UNARY_OPERATIONS:
+            return "Erreur"
+        result = self._perform_calculation(0, self._current_number(), operation)
+        if result is None:
+            return "Erreur"
+        self._entry = None
+        self._value = result
+        return self.current_value
+
+    def recall(self, name: str = MEMORY_REGISTER) -> str:
+        """MR : le registre est relu comme un entier de la taille de mot"""
+        value = self.registers.get(name, 0)
+        if value is None:
+            return "Erreur"
+        self._entry = None
+        self._value = self._wrap(int(value))
+        self.wait_for_operand = True
+        return self.current_value
+
+    def _save_for_rollback(self) -> tuple:
+        return super()._save_for_rollback() + (self.base,)
+
+    def _rollback(self, saved: tuple) -> None:
+        super()._rollback(saved[:2])
+        self.base = saved[2]
+
+    def feed(self, keys: Iterable[str]) -> str:
+        """
+        Rejoue une séquence de touches (comme Calculator.feed, en entiers)
+
+        Touches : chiffres de la base courante, A-F, + - * / MOD AND OR XOR << >>,
+        ± NOT x² √, =, AC, HEX / DEC / OCT / BIN, M+ M- MR MC ; raccourcis
+        d'un caractère dans PROGRAMMER_ALIASES (feed("F0|0F=") en HEX)
+
+        Raises:
+            ValueError: Touche inconnue, ou chiffre invalide dans la base courante
+                        (l'état, la base et les registres sont alors remis
+                        comme avant l'appel)
+        """
+        if isinstance(keys, str):
+            keys = split_keys(keys)
+        entry = self._entry
+        value = self._value
+        accumulator = self._accumulator
+        operation = self.operation
+        wait = self.wait_for_operand
+        base = self.base
+        digits = BASE_DIGITS[base]
+        error = False
+        calculate = self._perform_calculation
+        wrap = self._wrap
+        render = self.format
+        aliases = PROGRAMMER_ALIASES
+        binary = INT_OPERATIONS
+        unary = INT_UNARY_OPERATIONS
+        saved = None  # État d'avant l'appel, gardé à la première touche mémoire
+
+        for key in keys:
+            key = aliases.get(key, key)
+            if key in digits:
+                if wait:
+                    entry = key
+                    wait = False
+                elif entry is None:
+                    entry = render(value, base) + key
+                elif entry == "0":
+                    entry = key
+                else:
+                    entry += key
+                error = False
+            elif key in binary:
+                current = wrap(int(entry, base)) if entry is not None else value
+                if accumulator is None:
+                    accumulator = current
+                elif operation:
+                    result = calculate(accumulator, current, operation)
+                    if result is None:
+                        error = True
+                        continue
+                    entry = None
+                    value = accumulator = result
+                else:
+                    accumulator = current
+                wait = True
+                operation = key
+                error = False
+            elif key == "=":
+                if operation and accumulator is not None:
+                    current = wrap(int(entry, base)) if entry is not None else value
+                    result = calculate(accumulator, current, operation)
+                    if result is None:
+                        error = True
+                        continue
+                    entry = None
+                    value = result
+                    accumulator = None
+                    operation = None
+                    wait = True
+                error = False
+            elif key in unary:
+                result = calculate(0, wrap(int(entry, base)) if entry is not None else value, key)
+                if result is None:
+                    error = True
+                    continue
+                entry = None
+                value = result
+                error = False
+            elif key in BASES:
+                if entry is not None:
+                    value = wrap(int(entry, base))
+                    entry = None
+                base = BASES[key]
+                digits = BASE_DIGITS[base]
+            elif key == "AC":
+                entry = "0"
+                value = 0
+                accumulator = None
+                operation = None
+                wait = False
+                error = False
+            elif key in MEMORY_KEYS:
+                if saved is None:
+                    saved = self._save_for_rollback()
+                self._entry, self._value, self._accumulator = entry, value, accumulator
+                self.operation, self.wait_for_operand, self.base = operation, wait, base
+                error = getattr(self, MEMORY_KEYS[key])() == "Erreur"
+                entry, value, accumulator = self._entry, self._value, self._accumulator
+                operation, wait = self.operation, self.wait_for_operand
+            elif key in BASE_DIGITS[16] or not key.isspace():
+                if saved is not None:
+                    self._rollback(saved)
+                if key in BASE_DIGITS[16]:
+                    raise ValueError(f"Chiffre {key!r} invalide en base {base}")
+                raise ValueError(f"Touche inconnue : {key!r}")
+
+        self._entry = entry
+        self._value = value
+        self._accumulator = accumulator
+        self.operation = operation
+        self.wait_for_operand = wait
+        self.base = base
+        return "Erreur" if error else self.current_value
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Enregistrement et rejeu des sessions de la GUI (générateur de charge sans clics)
+
+Une session est la suite des touches reçues par CalculatorGUI._on_button_click
+(clics, clavier, collage), avec leur instant et l'affichage obtenu, en JSON
+ligne par ligne : {"t": 0.52, "key": "7", "display": "7"}.
+
+Le rejeu pousse la même suite dans une CalculatorGUI (réelle, sous un écran
+virtuel : xvfb-run) ou directement dans Calculator, aussi vite que possible
+ou au rythme enregistré, et mesure touches/s, latence par touche et
+divergences entre l'affichage de la GUI et celui du moteur.
+
+Usage :
+    python src/main.py --record session.jsonl      # GUI enregistrée
+    python src/replay.py session.jsonl             # rejeu dans Calculator
+    xvfb-run python src/replay.py session.jsonl --gui
+"""
+
+import argparse
+import json
+import sys
+import os
+import time
+from typing import Iterable, List, NamedTuple, Optional
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculator import Calculator
+from history import UndoHistory
+
+
+# Divergences gardées dans le rapport (les suivantes sont seulement comptées)
+MAX_DIVERGENCES = 20
+# Annuler / rétablir (boutons ↶ ↷, Ctrl+Z / Ctrl+Y) enregistrés comme des touches
+UNDO_KEYS = {"↶": "undo", "↷": "redo"}
+
+
+class Event(NamedTuple):
+    """Une touche de la session"""
+    t: float                       # Secondes depuis le début de l'enregistrement
+    key: str                       # Texte du bouton ("7", "+", "√", "AC"...)
+    display: Optional[str] = None  # Affichage après la touche (si connu)
+
+
+class SessionRecorder:
+    """
+    Enregistre les touches d'une CalculatorGUI
+
+    Exemple :
+        recorder = SessionRecorder(gui).start()
+        gui.run()
+        recorder.save("session.jsonl")
+    """
+
+    def __init__(self, gui):
+        self.gui = gui
+        self.events: List[Event] = []
+        self._start = None
+        self._nested = False
+        self._originals = None
+
+    def start(self) -> "SessionRecorder":
+        """Commence l'enregistrement (remplace les méthodes de cette instance)"""
+        if self._originals is not None:
+            return self
+        gui = self.gui
+        self._originals = (gui._on_button_click, gui._submit, gui._step_history)
+        self._start = time.perf_counter()
+        on_button_click, submit, step_history = self._originals
+
+        def recorded_click(button_text):
+            self._nested = True
+            try:
+                on_button_click(button_text)
+            finally:
+                self._nested = False
+            self._record([button_text])
+
+        def recorded_submit(keys, label):
+            submit(keys, label)
+            if not self._nested:  # Clic déjà enregistré par recorded_click
+                self._record(keys)
+
+        def recorded_step(step, done, nothing):
+            step_history(step, done, nothing)
+            self._record(["↶" if step == gui.history.undo else "↷"])
+
+        gui._on_button_click = recorded_click
+        gui._submit = recorded_submit
+        gui._step_history = recorded_step
+        return self
+
+    def stop(self) -> List[Event]:
+        """Arrête l'enregistrement et renvoie les touches"""
+        if self._originals is not None:
+            del self.gui._on_button_click
+            del self.gui._submit
+            del self.gui._step_history
+            self._originals = None
+        return self.events
+
+    def _record(self, keys: List[str]) -> None:
+        now = time.perf_counter() - self._start
+        pending = self.gui._pending_display
+        # Lot envoyé au thread de calcul : l'affichage n'est connu qu'après
+        display = pending if pending is not None and not self.gui._jobs_pending else None
+        for key in keys[:-1]:
+            self.events.append(Event(now, key))
+        if keys:
+            self.events.append(Event(now, keys[-1], display))
+
+    def save(self, path: str) -> int:
+        """Écrit la session ; renvoie le nombre de touches"""
+        return save_events(path, self.events)
+
+
+def save_events(path: str, events: Iterable[Event]) -> int:
+    """Écrit une session (JSON ligne par ligne)"""
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for event in events:
+            record = {"t": round(event.t, 6), "key": event.key}
+            if event.display is not None:
+                record["display"] = event.display
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count += 1
+    return count
+
+
+def load_events(path: str) -> List[Event]:
+    """Lit une session enregistrée"""
+    events = []
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                events.append(Event(float(record["t"]), str(record["key"]), record.get("display")))
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"{path}:{number} : enregistrement invalide ({e})") from None
+    return events
+
+
+def _pace(events: List[Event], index: int, start: float, speed: Optional[float]) -> None:
+    """Attend l'instant enregistré de la touche (accéléré speed fois)"""
+    if speed:
+        delay = start + events[index].t / speed - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class _Engine:
+    """Calculator et son historique, pilotés touche par touche comme la GUI"""
+
+    def __init__(self, calculator: Calculator):
+        self.calculator = calculator
+        self.history = UndoHistory(calculator)
+
+    def press(self, key: str) -> Optional[str]:
+        """Applique une touche ; renvoie l'affichage, ou None si la touche est inconnue"""
+        step = UNDO_KEYS.get(key)
+        if step is not None:
+            display = getattr(self.history, step)()
+            return self.calculator.get_display_value() if display is None else display
+        try:
+            display = self.calculator.feed((key,))
+        except ValueError:
+            return None
+        self.history.checkpoint()
+        return display
+
+
+def _report(events: List[Event], latencies: List[float], elapsed: float, divergences: list,
+            divergence_count: int) -> dict:
+    ordered = sorted(latencies)
+
+    def percentile(fraction):
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1e6 if ordered else 0.0
+
+    return {
+        "events": len(events),
+        "seconds": elapsed,
+        "events_per_sec": len(events) / elapsed if elapsed else 0.0,
+        "latency_us": {
+            "mean": sum(ordered) / len(ordered) * 1e6 if ordered else 0.0,
+            "p50": percentile(0.50),
+            "p99": percentile(0.99),
+            "max": ordered[-1] * 1e6 if ordered else 0.0,
+        },
+        "divergence_count": divergence_count,
+        "divergences": divergences,
+    }
+
+
+def replay_engine(events: List[Event], backend: str = "float", precision: int = 28,
+                  speed: Optional[float] = None) -> dict:
+    """
+    Rejoue une session directement dans Calculator
+
+    Args:
+        events: Touches à rejouer
+        backend, precision: Backend numérique de la calculatrice
+        speed: None = aussi vite que possible, sinon rythme enregistré accéléré speed fois
+
+    Returns:
+        Le rapport (touches/s, latences en µs, divergences avec l'affichage enregistré)
+    """
+    press = _Engine(Calculator(backend, precision)).press
+    clock = time.perf_counter
+    latencies = []
+    divergences = []
+    divergence_count = 0
+    start = clock()
+    for index, event in enumerate(events):
+        _pace(events, index, start, speed)
+        before = clock()
+        display = press(event.key)  # None : touche que le moteur ne connaît pas
+        latencies.append(clock() - before)
+        # L'enregistrement garde la valeur demandée à l'affichage, avant mise en forme
+        if event.display is not None and display is not None and event.display != display:
+            divergence_count += 1
+            if len(divergences) < MAX_DIVERGENCES:
+                divergences.append({"index": index, "key": event.key,
+                                    "recorded": event.display, "engine": display})
+    return _report(events, latencies, clock() - start, divergences, divergence_count)
+
+
+def replay_gui(gui, events: List[Event], speed: Optional[float] = None, precision: int = 28) -> dict:
+    """
+    Rejoue une session dans une CalculatorGUI, touche par touche
+
+    Chaque touche passe par _on_button_click puis un tour de boucle Tk
+    (rendu compris). Une Calculator fantôme reçoit les mêmes touches :
+    toute différence entre l'affichage de la GUI et celui du moteur
+    (mis en forme comme la GUI) est une divergence.
+
+    Returns:
+        Le rapport (touches/s, latences en µs, divergences GUI / moteur)
+    """
+    shadow = Calculator(gui.calculator.backend, precision)
+    shadow.restore(gui.calculator.snapshot())
+    shadow_press = _Engine(shadow).press
+    click = gui._on_button_click
+    undo = {"↶": gui._on_undo, "↷": gui._on_redo}
+    update = gui.root.update
+    clock = time.perf_counter
+    latencies = []
+    divergences = []
+    divergence_count = 0
+    start = clock()
+    for index, event in enumerate(events):
+        _pace(events, index, start, speed)
+        before = clock()
+        step = undo.get(event.key)
+        if step is not None:
+            step()
+        else:
+            click(event.key)
+        update()
+        latencies.append(clock() - before)
+        expected = shadow_press(event.key)
+        if expected is None:
+            continue  # Touche inconnue : la GUI l'ignore aussi
+        expected = gui._format_display(expected)
+        shown = gui.display_var.get()
+        if shown != expected:
+            divergence_count += 1
+            if len(divergences) < MAX_DIVERGENCES:
+                divergences.append({"index": index, "key": event.key, "gui": shown, "engine": expected})
+    return _report(events, latencies, clock() - start, divergences, divergence_count)
+
+
+def format_report(report: dict, label: str) -> str:
+    """Rapport lisible"""
+    latency = report["latency_us"]
+    lines = [
+        f"{label} : {report['events']} touches en {report['seconds']:.3f} s "
+        f"({report['events_per_sec']:,.0f} touches/s)",
+        f"  latence par touche : moyenne {latency['mean']:.1f} µs, p50 {latency['p50']:.1f} µs, "
+        f"p99 {latency['p99']:.1f} µs, max {latency['max']:.1f} µs",
+        f"  divergences : {report['divergence_count']}",
+    ]
+    for divergence in report["divergences"]:
+        lines.append("    " + json.dumps(divergence, ensure_ascii=False))
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    """Rejoue une session en ligne de commande ; code 1 si divergence"""
+    parser = argparse.ArgumentParser(description="Rejeu d'une session de la calculatrice i-gore")
+    parser.add_argument("session", help="session enregistrée (python src/main.py --record FICHIER)")
+    parser.add_argument("--gui", action="store_true",
+                        help="rejoue aussi dans une vraie CalculatorGUI (écran requis, ex : xvfb-run)")
+    parser.add_argument("--speed", type=float, metavar="FACTEUR",
+                        help="respecte le rythme enregistré, accéléré FACTEUR fois (défaut : au plus vite)")
+    parser.add_argument("--repeat", type=int, default=1, metavar="N",
+                        help="rejoue la session N fois à la suite (charge plus longue)")
+    parser.add_argument("--backend", choices=("float", "decimal", "fraction", "int"), default="float")
+    parser.add_argument("--precision", type=int, default=28, metavar="CHIFFRES")
+    args = parser.parse_args(argv)
+
+    events = load_events(args.session)
+    if args.repeat > 1:
+        duration = events[-1].t if events else 0.0
+        events = [event._replace(t=event.t + lap * duration)
+                  for lap in range(args.repeat) for event in events]
+
+    report = replay_engine(events, args.backend, args.precision, speed=args.speed)
+    print(format_report(report, "Moteur (Calculator)"))
+    divergent = report["divergence_count"] > 0
+    if args.gui:
+        from gui import CalculatorGUI
+        gui = CalculatorGUI(args.backend, args.precision)
+        try:
+            report = replay_gui(gui, events, speed=args.speed, precision=args.precision)
+        finally:
+            gui.root.destroy()
+        print(format_report(report, "GUI (CalculatorGUI)"))
+        divergent = divergent or report["divergence_count"] > 0
+    return 1 if divergent else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
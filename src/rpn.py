@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Notation polonaise inverse (RPN) : "3 4 + 2 *" -> 14.0
+
+Les opérandes vivent dans une pile préallouée de doubles (array('d')) :
+empiler ou dépiler écrit un double à un indice, sans liste d'objets float.
+Les opérations sont celles du registre de calculator (OPERATORS), plus les
+manipulations de pile DUP, DROP, SWAP et ROLL.
+
+Deux interfaces :
+- evaluate_rpn(tokens) évalue un programme complet (sans GUI, par lots) ;
+- RPNCalculator est une Calculator pilotée touche par touche (GUI : ENTER).
+"""
+
+from array import array
+from typing import Iterable, List, Optional, Union
+
+from calculator import CALCULATION_ERRORS, DIGITS, KEY_ALIASES, MEMORY_KEYS, MEMORY_REGISTER, \
+    OPERATORS, Calculator
+
+
+DEFAULT_CAPACITY = 1024  # Niveaux préalloués (la pile double si besoin)
+
+# Manipulations de pile (touches et mots des programmes)
+STACK_KEYS = ("DUP", "DROP", "SWAP", "ROLL")
+ENTER_KEYS = {"ENTER", "⏎", "="}  # "=" : la touche Entrée du clavier
+
+
+class RPNStack:
+    """
+    Pile de doubles préallouée
+
+    Exemple :
+        stack = RPNStack()
+        stack.push(3.0); stack.push(4.0); stack.swap()
+        stack.pop()   # 3.0
+    """
+
+    __slots__ = ("_data", "_size")
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity doit être >= 1")
+        self._data = array("d", bytes(8 * capacity))
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        """Du fond vers le sommet"""
+        return iter(self._data[:self._size])
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def _grow(self) -> None:
+        self._data.frombytes(bytes(8 * len(self._data)))  # Double la capacité
+
+    def push(self, value: float) -> None:
+        if self._size == len(self._data):
+            self._grow()
+        self._data[self._size] = value
+        self._size += 1
+
+    def pop(self) -> float:
+        """Raises: IndexError si la pile est vide"""
+        if not self._size:
+            raise IndexError("pile vide")
+        self._size -= 1
+        return self._data[self._size]
+
+    def peek(self, depth: int = 0) -> float:
+        """Valeur à depth niveaux sous le sommet (0 = sommet)"""
+        if not 0 <= depth < self._size:
+            raise IndexError("pile trop courte")
+        return self._data[self._size - 1 - depth]
+
+    def dup(self) -> None:
+        """Duplique le sommet"""
+        self.push(self.peek())
+
+    def drop(self) -> None:
+        self.pop()
+
+    def swap(self) -> None:
+        """Échange les deux valeurs du sommet"""
+        if self._size < 2:
+            raise IndexError("pile trop courte")
+        data, top = self._data, self._size - 1
+        data[top], data[top - 1] = data[top - 1], data[top]
+
+    def roll(self, depth: Optional[int] = None) -> None:
+        """
+        Amène au sommet la valeur à depth niveaux sous le sommet (comme ROLL
+        en Forth) ; par défaut celle du fond (toute la pile tourne)
+        """
+        size = self._size
+        if depth is None:
+            depth = size - 1
+        if not 0 <= depth < size:
+            raise IndexError("pile trop courte")
+        data, position = self._data, size - 1 - depth
+        value = data[position]
+        data[position:size - 1] = data[position + 1:size]
+        data[size - 1] = value
+
+    def clear(self) -> None:
+        self._size = 0
+
+    def to_bytes(self) -> bytes:
+        """Contenu (du fond vers le sommet) en doubles natifs, pour un snapshot"""
+        return self._data[:self._size].tobytes()
+
+    def load_bytes(self, data: bytes) -> None:
+        """Remet un contenu de to_bytes()"""
+        values = array("d", data)
+        while len(self._data) < len(values):
+            self._grow()
+        self._data[:len(values)] = values
+        self._size = len(values)
+
+
+def _rpn_tables():
+    """Mot d'un programme -> fonction, pour les opérations binaires, unaires et de pile"""
+    binary, unary = {}, {}
+    for symbol, entry in OPERATORS.items():
+        (binary if entry.arity == 2 else unary)[symbol] = entry.function
+    for alias, symbol in KEY_ALIASES.items():
+        if symbol in unary:
+            unary[alias] = unary[symbol]
+    stack_words = {}
+    for word in STACK_KEYS:
+        stack_words[word] = stack_words[word.lower()] = word.lower()
+    return binary, unary, stack_words
+
+
+def evaluate_rpn(tokens: Union[str, Iterable[str]], stack: Optional[RPNStack] = None) -> Optional[float]:
+    """
+    Évalue un programme RPN
+
+    Args:
+        tokens: Mots du programme (nombres, opérations du registre, DUP DROP
+                SWAP ROLL) ; une chaîne est découpée sur les espaces
+        stack: Pile de départ (gardée après l'appel) ; par défaut une pile neuve
+
+    Returns:
+        Le sommet de la pile à la fin, ou None en cas d'erreur (pile trop
+        courte, mot inconnu, erreur de calcul) ; la pile garde alors l'état
+        d'avant le mot fautif
+    """
+    if isinstance(tokens, str):
+        tokens = tokens.split()
+    if stack is None:
+        stack = RPNStack()
+    binary, unary, stack_words = _rpn_tables()
+    get_binary = binary.get
+    data = stack._data
+    size = stack._size
+    capacity = len(data)
+    try:
+        # Boucle chaude : la pile en variables locales, opérations binaires testées en premier
+        for token in tokens:
+            function = get_binary(token)
+            if function is not None:
+                if size < 2:
+                    return None
+                result = function(data[size - 2], data[size - 1])
+                if result is None:
+                    return None
+                size -= 1
+                data[size - 1] = result
+            elif token in unary:
+                if not size:
+                    return None
+                result = unary[token](data[size - 1])
+                if result is None:
+                    return None
+                data[size - 1] = result
+            elif token in stack_words:
+                stack._size = size
+                word = stack_words[token]
+                if word == "roll":
+                    stack.roll(int(stack.pop()) if size else 0)  # Profondeur lue sur la pile
+                else:
+                    getattr(stack, word)()
+                size = stack._size
+                capacity = len(data)
+            else:
+                value = float(token)  # ValueError : mot inconnu
+                if size == capacity:
+                    stack._grow()
+                    capacity = len(data)
+                data[size] = value
+                size += 1
+        return data[size - 1] if size else None
+    except (IndexError,) + CALCULATION_ERRORS:
+        return None  # ValueError (mot inconnu) comprise
+    finally:
+        stack._size = size
+
+
+class RPNCalculator(Calculator):
+    """
+    Calculatrice RPN pilotée touche par touche
+
+    Les chiffres tapés forment une saisie (hors pile) ; ENTER l'empile (ou
+    duplique le sommet s'il n'y a pas de saisie) ; une opération empile la
+    saisie en cours puis s'applique au sommet. L'affichage montre la saisie,
+    sinon le sommet de la pile.
+
+    Exemple :
+        calc = RPNCalculator()
+        calc.feed("3 4+2*")   # "14.0" (l'espace sépare deux nombres)
+    """
+
+    __slots__ = ("stack",)
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.stack = RPNStack(capacity)
+        super().__init__("float")
+
+    def reset(self, registers: bool = False) -> None:
+        """AC : vide la pile et la saisie"""
+        super().reset(registers)
+        self._entry = None
+        self.stack.clear()
+
+    @property
+    def current_value(self) -> str:
+        if self._entry is not None:
+            return self._entry
+        return str(self.stack.peek()) if len(self.stack) else "0"
+
+    def _current_number(self) -> float:
+        if self._entry is not None:
+            return float(self._entry)
+        return self.stack.peek() if len(self.stack) else 0.0
+
+    def visible_stack(self, levels: int = 4) -> List[float]:
+        """Niveaux de pile au-dessus de l'affichage (du plus profond au plus proche)"""
+        size = len(self.stack)
+        hidden = 0 if self._entry is not None else 1  # Le sommet est déjà affiché
+        shown = max(0, min(levels, size - hidden))
+        return [self.stack.peek(depth) for depth in range(hidden + shown - 1, hidden - 1, -1)]
+
+    def input_number(self, number: str) -> str:
+        entry = self._entry
+        self._entry = number if entry is None or entry == "0" else entry + number
+        return self._entry
+
+    def input_decimal(self) -> str:
+        entry = self._entry
+        if entry is None:
+            self._entry = "0."
+        elif "." not in entry:
+            self._entry = entry + "."
+        return self._entry
+
+    def _push_entry(self) -> bool:
+        """Empile la saisie en cours ; True s'il y en avait une"""
+        if self._entry is None:
+            return False
+        self.stack.push(float(self._entry))
+        self._entry = None
+        return True
+
+    def enter(self) -> str:
+        """ENTER : empile la saisie, ou duplique le sommet"""
+        if not self._push_entry() and len(self.stack):
+            self.stack.dup()
+        return self.current_value
+
+    def input_operation(self, next_operation: str) -> str:
+        """Opération binaire sur les deux valeurs du sommet (saisie empilée d'abord)"""
+        self._push_entry()
+        stack = self.stack
+        if len(stack) < 2:
+            return "Erreur"
+        result = self._perform_calculation(stack.peek(1), stack.peek(), next_operation)
+        if result is None:
+            return "Erreur"  # Opérandes gardés
+        stack.pop()
+        stack._data[len(stack) - 1] = result
+        return self.current_value
+
+    def apply_unary(self, operation: str) -> str:
+        self._push_entry()
+        if not len(self.stack):
+            return "Erreur"
+        result = self._perform_calculation(0.0, self.stack.peek(), operation)
+        if result is None:
+            return "Erreur"
+        self.stack._data[len(self.stack) - 1] = result
+        return self.current_value
+
+    def calculate_result(self) -> str:
+        """"=" : comme ENTER (pas d'opération en attente en RPN)"""
+        return self.enter()
+
+    def stack_operation(self, key: str) -> str:
+        """DUP, DROP, SWAP ou ROLL (toute la pile tourne) ; "Erreur" si la pile est trop courte"""
+        self._push_entry()
+        try:
+            getattr(self.stack, key.lower())()
+        except IndexError:
+            return "Erreur"
+        return self.current_value
+
+    def recall(self, name: str = MEMORY_REGISTER) -> str:
+        """MR : empile le registre"""
+        value = self.registers.get(name, 0)
+        if value is None:
+            return "Erreur"
+        self._push_entry()
+        self.stack.push(float(value))
+        return self.current_value
+
+    def feed(self, keys: Iterable[str]) -> str:
+        """
+        Rejoue une séquence de touches RPN
+
+        Touches : chiffres, ".", ENTER (ou "="), opérations du registre, DUP DROP
+        SWAP ROLL, AC, M+ M- MR MC ; un espace empile la saisie en cours
+
+        Raises:
+            ValueError: Si une touche est inconnue (les touches précédentes restent appliquées)
+        """
+        display = self.current_value
+        for key in keys:
+            key = KEY_ALIASES.get(key, key)
+            if key in DIGITS:
+                display = self.input_number(key)
+            elif key == ".":
+                display = self.input_decimal()
+            elif key in ENTER_KEYS:
+                display = self.enter()
+            elif key.isspace():
+                self._push_entry()
+                display = self.current_value
+            elif key in OPERATORS:
+                if OPERATORS[key].arity == 2:
+                    display = self.input_operation(key)
+                else:
+                    display = self.apply_unary(key)
+            elif key in STACK_KEYS:
+                display = self.stack_operation(key)
+            elif key == "AC":
+                self.reset()
+                display = self.current_value
+            elif key in MEMORY_KEYS:
+                display = getattr(self, MEMORY_KEYS[key])()
+            else:
+                raise ValueError(f"Touche inconnue : {key!r}")
+        return display
+
+    def snapshot(self) -> tuple:
+        """Saisie et contenu de la pile (en octets : immuable et compact)"""
+        return (self._entry, self.stack.to_bytes())
+
+    def restore(self, snapshot: tuple) -> None:
+        self._entry, data = snapshot
+        self.stack.load_bytes(data)
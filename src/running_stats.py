@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Statistiques au fil de l'eau, en mémoire constante
+
+RunningStats résume une colonne de nombres sans la garder : effectif, somme
+compensée (Kahan-Neumaier), moyenne et variance (Welford), min / max et
+centiles approchés (histogramme à cases logarithmiques, erreur relative
+bornée). Deux résumés partiels (workers d'un pool) se fusionnent avec merge().
+
+Le module ne s'appelle pas "statistics" pour ne pas masquer celui de Python.
+"""
+
+import math
+from typing import Dict, Iterable, Optional
+
+
+# Erreur relative des centiles et nombre maximal de cases de l'histogramme
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 2048
+
+
+class RunningStats:
+    """
+    Résumé d'un flot de nombres
+
+    Exemple :
+        stats = RunningStats()
+        stats.extend([12.5, 7.25, 3.0])
+        stats.mean, stats.stdev(), stats.percentile(50)
+    """
+
+    __slots__ = ("count", "_sum", "_compensation", "_mean", "_m2", "min", "max",
+                 "relative_accuracy", "max_buckets", "_log_gamma", "_positive", "_negative", "_zeros")
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+                 max_buckets: int = DEFAULT_MAX_BUCKETS):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy doit être dans ]0, 1[")
+        if max_buckets < 2:
+            raise ValueError("max_buckets doit être >= 2")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._log_gamma = math.log((1 + relative_accuracy) / (1 - relative_accuracy))
+        self.count = 0
+        self._sum = 0.0
+        self._compensation = 0.0  # Bits perdus par la somme flottante
+        self._mean = 0.0
+        self._m2 = 0.0            # Somme des carrés des écarts à la moyenne
+        self.min = math.inf
+        self.max = -math.inf
+        self._positive: Dict[int, int] = {}  # Case -> effectif (|x| dans ]γ^(i-1), γ^i])
+        self._negative: Dict[int, int] = {}
+        self._zeros = 0
+
+    def add(self, value: float) -> None:
+        """Ajoute un nombre (fini)"""
+        self.extend((value,))
+
+    def extend(self, values: Iterable[float]) -> int:
+        """
+        Ajoute une suite de nombres ; renvoie combien ont été ajoutés
+
+        Raises:
+            ValueError: Pour un nombre infini ou NaN (les précédents restent comptés)
+        """
+        # Tout l'état en variables locales : une seule boucle, sans appel par valeur
+        count, total, compensation = self.count, self._sum, self._compensation
+        mean, m2, low, high = self._mean, self._m2, self.min, self.max
+        positive, negative, zeros = self._positive, self._negative, self._zeros
+        log_gamma, log, ceil, isfinite = self._log_gamma, math.log, math.ceil, math.isfinite
+        max_buckets = self.max_buckets
+        added = 0
+        try:
+            for value in values:
+                value = float(value)
+                if not isfinite(value):
+                    raise ValueError(f"valeur non finie : {value!r}")
+                count += 1
+                added += 1
+                # Kahan-Neumaier
+                t = total + value
+                if abs(total) >= abs(value):
+                    compensation += (total - t) + value
+                else:
+                    compensation += (value - t) + total
+                total = t
+                # Welford
+                delta = value - mean
+                mean += delta / count
+                m2 += delta * (value - mean)
+                if value < low:
+                    low = value
+                if value > high:
+                    high = value
+                # Histogramme logarithmique
+                if value > 0:
+                    buckets = positive
+                    index = ceil(log(value) / log_gamma)
+                elif value < 0:
+                    buckets = negative
+                    index = ceil(log(-value) / log_gamma)
+                else:
+                    zeros += 1
+                    continue
+                if index in buckets:
+                    buckets[index] += 1
+                else:
+                    buckets[index] = 1
+                    if len(positive) + len(negative) > max_buckets:
+                        self._bound_buckets()  # Nouvelle case de trop : rare
+        finally:
+            self.count, self._sum, self._compensation = count, total, compensation
+            self._mean, self._m2, self.min, self.max = mean, m2, low, high
+            self._zeros = zeros
+        return added
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """
+        Ajoute le résumé d'un autre flot (même précision), comme si ses
+        valeurs avaient été ajoutées ici ; renvoie self
+
+        Raises:
+            ValueError: Si les précisions des histogrammes diffèrent
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("histogrammes de précisions différentes")
+        if not other.count:
+            return self
+        count = self.count + other.count
+        delta = other._mean - self._mean
+        # Formule de Chan pour combiner deux variances
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self._mean += delta * other.count / count
+        self.count = count
+        t = self._sum + other._sum
+        if abs(self._sum) >= abs(other._sum):
+            self._compensation += (self._sum - t) + other._sum
+        else:
+            self._compensation += (other._sum - t) + self._sum
+        self._sum = t
+        self._compensation += other._compensation
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for mine, theirs in ((self._positive, other._positive), (self._negative, other._negative)):
+            for index, bucket_count in theirs.items():
+                mine[index] = mine.get(index, 0) + bucket_count
+        self._zeros += other._zeros
+        self._bound_buckets()
+        return self
+
+    def _bound_buckets(self) -> None:
+        """Fusionne les plus petites cases tant qu'il y en a trop (les petits |x| perdent en précision)"""
+        while len(self._positive) + len(self._negative) > self.max_buckets:
+            buckets = self._positive if len(self._positive) >= len(self._negative) else self._negative
+            lowest, second = sorted(buckets)[:2]
+            buckets[second] += buckets.pop(lowest)
+
+    @property
+    def sum(self) -> float:
+        """Somme compensée"""
+        return self._sum + self._compensation
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self._mean if self.count else None
+
+    def variance(self, sample: bool = True) -> Optional[float]:
+        """Variance de l'échantillon (n - 1) ou de la population (n)"""
+        divisor = self.count - 1 if sample else self.count
+        return self._m2 / divisor if divisor > 0 else None
+
+    def stdev(self, sample: bool = True) -> Optional[float]:
+        variance = self.variance(sample)
+        return None if variance is None else math.sqrt(variance)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Centile approché (q de 0 à 100), à relative_accuracy près
+
+        Raises:
+            ValueError: Si q n'est pas dans [0, 100]
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("q doit être entre 0 et 100")
+        if not self.count:
+            return None
+        if q == 0:
+            return self.min
+        if q == 100:
+            return self.max
+        rank = q / 100 * (self.count - 1)
+        gamma = math.exp(self._log_gamma)
+        seen = 0
+        # Des plus négatifs aux plus positifs
+        for index in sorted(self._negative, reverse=True):
+            seen += self._negative[index]
+            if seen > rank:
+                return max(self.min, -2 * gamma ** index / (gamma + 1))
+        seen += self._zeros
+        if seen > rank:
+            return 0.0
+        for index in sorted(self._positive):
+            seen += self._positive[index]
+            if seen > rank:
+                return min(self.max, 2 * gamma ** index / (gamma + 1))
+        return self.max
+
+    def summary(self) -> dict:
+        """Résumé complet (None pour ce qui n'est pas défini)"""
+        empty = not self.count
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.mean,
+            "stdev": self.stdev(),
+            "min": None if empty else self.min,
+            "max": None if empty else self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def __repr__(self) -> str:
+        return f"RunningStats(count={self.count}, mean={self.mean}, min={self.min}, max={self.max})"
+
+
+def format_summary(stats: RunningStats) -> str:
+    """Résumé lisible, une statistique par ligne"""
+    lines = []
+    for name, value in stats.summary().items():
+        lines.append(f"{name:<6} {'-' if value is None else format(value, '.12g')}")
+    return "\n".join(lines)
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Serveur de calcul asyncio (JSON ligne par ligne sur TCP)
+
+Chaque session garde son propre état Calculator. Protocole : une requête
+JSON par ligne, une réponse JSON par ligne, dans l'ordre des requêtes
+(les clients peuvent donc envoyer plusieurs requêtes sans attendre).
+
+    -> {"session": "alice", "keys": "12+3="}
+    <- {"session": "alice", "display": "15.0"}
+    -> {"session": "alice", "reset": true}
+    <- {"session": "alice", "display": "0"}
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from calculator import Calculator
+
+
+# Longueur maximale d'une requête (ligne JSON) : de quoi envoyer beaucoup de touches à la fois
+MAX_REQUEST_BYTES = 1 << 20
+
+
+class SessionPool:
+    """
+    Sessions actives (LRU + TTL) et réserve de Calculator recyclés
+
+    Les calculatrices des sessions expirées sont remises à zéro et
+    réutilisées pour les nouvelles sessions, sans nouvelle allocation.
+    """
+
+    def __init__(self, max_sessions: int = 10_000, ttl: float = 300.0, max_free: int = 1_000):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.max_free = max_free
+        self._sessions: "OrderedDict[str, list]" = OrderedDict()  # id -> [calculator, dernier accès]
+        self._free = []
+        self.created = 0
+        self.recycled = 0
+        self.evicted = 0
+
+    def get(self, session_id: str) -> Calculator:
+        """Renvoie la calculatrice de la session (créée ou recyclée si besoin)"""
+        now = time.monotonic()
+        entry = self._sessions.get(session_id)
+        if entry is not None:
+            entry[1] = now
+            self._sessions.move_to_end(session_id)
+            return entry[0]
+
+        if len(self._sessions) >= self.max_sessions:
+            # La session la moins récemment utilisée laisse sa place
+            _, (old, _) = self._sessions.popitem(last=False)
+            self._release(old)
+
+        if self._free:
+            calculator = self._free.pop()
+            self.recycled += 1
+        else:
+            calculator = Calculator()
+            self.created += 1
+        self._sessions[session_id] = [calculator, now]
+        return calculator
+
+    def drop(self, session_id: str) -> None:
+        """Termine une session"""
+        entry = self._sessions.pop(session_id, None)
+        if entry is not None:
+            self._release(entry[0])
+
+    def evict_expired(self) -> int:
+        """Supprime les sessions inactives depuis plus de ttl secondes"""
+        deadline = time.monotonic() - self.ttl
+        count = 0
+        # Les sessions sont rangées de la moins à la plus récemment utilisée
+        while self._sessions:
+            session_id, (calculator, last_used) = next(iter(self._sessions.items()))
+            if last_used > deadline:
+                break
+            del self._sessions[session_id]
+            self._release(calculator)
+            count += 1
+        return count
+
+    def _release(self, calculator: Calculator) -> None:
+        self.evicted += 1
+        if len(self._free) < self.max_free:
+            calculator.reset(registers=True)  # Rien ne passe d'une session à l'autre
+            self._free.append(calculator)
+
+    def stats(self) -> dict:
+        """Statistiques du pool"""
+        return {
+            "sessions": len(self._sessions),
+            "free": len(self._free),
+            "created": self.created,
+            "recycled": self.recycled,
+            "evicted": self.evicted,
+        }
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+class CalculatorServer:
+    """Serveur TCP asyncio, une Calculator par session"""
+
+    def __init__(self, pool: Optional[SessionPool] = None, evict_interval: float = 10.0,
+                 max_request_bytes: int = MAX_REQUEST_BYTES):
+        self.pool = pool or SessionPool()
+        self.evict_interval = evict_interval
+        self.max_request_bytes = max_request_bytes
+        self._server = None
+        self._evict_task = None
+
+    def handle_request(self, request: dict) -> dict:
+        """Traite une requête décodée et renvoie la réponse"""
+        session_id = request.get("session")
+        if not isinstance(session_id, str):
+            return {"error": "champ 'session' manquant"}
+
+        if request.get("close"):
+            self.pool.drop(session_id)
+            return {"session": session_id, "closed": True}
+
+        calculator = self.pool.get(session_id)
+        if request.get("reset"):
+            calculator.reset()
+        keys = request.get("keys", "")
+        if not isinstance(keys, str) and not (
+                isinstance(keys, list) and all(isinstance(key, str) for key in keys)):
+            return {"session": session_id, "error": "champ 'keys' : chaîne ou liste de chaînes attendue"}
+        try:
+            display = calculator.feed(keys) if keys else calculator.get_display_value()
+        except (ValueError, TypeError) as e:
+            return {"session": session_id, "error": str(e)}
+        return {"session": session_id, "display": display}
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader) -> Optional[bytes]:
+        """
+        Une ligne de requête (b"" en fin de connexion), ou None si elle
+        dépasse la limite : elle est alors lue jusqu'à son retour à la ligne
+        et ignorée, la requête suivante reste lisible
+        """
+        oversized = False
+        while True:
+            try:
+                line = await reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError as error:
+                line = error.partial  # Fin de connexion
+            except asyncio.LimitOverrunError as error:
+                oversized = True
+                await reader.readexactly(error.consumed)
+                continue
+            return None if oversized else line
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                line = await self._read_request(reader)
+                if line is None:
+                    response = {"error": f"requête trop longue (plus de {self.max_request_bytes} octets)"}
+                elif not line:
+                    break
+                else:
+                    try:
+                        request = json.loads(line)
+                        response = self.handle_request(request) if isinstance(request, dict) \
+                            else {"error": "requête JSON attendue"}
+                    except (json.JSONDecodeError, UnicodeDecodeError, RecursionError):
+                        response = {"error": "JSON invalide"}
+                writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _evict_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.evict_interval)
+            self.pool.evict_expired()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> int:
+        """Démarre le serveur ; renvoie le port réellement utilisé"""
+        self._server = await asyncio.start_server(self._handle_client, host, port,
+                                                  limit=self.max_request_bytes)
+        self._evict_task = asyncio.create_task(self._evict_periodically())
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Arrête le serveur"""
+        if self._evict_task:
+            self._evict_task.cancel()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        """Démarre le serveur et le garde actif"""
+        port = await self.start(host, port)
+        print(f"🚀 Serveur de calcul sur {host}:{port}")
+        await self._server.serve_forever()
+
+
+def main(argv=None):
+    """Lance le serveur en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Serveur de calcul i-gore")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-sessions", type=int, default=10_000)
+    parser.add_argument("--ttl", type=float, default=300.0, help="durée de vie d'une session inactive (s)")
+    args = parser.parse_args(argv)
+
+    server = CalculatorServer(SessionPool(max_sessions=args.max_sessions, ttl=args.ttl))
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n👋 Serveur arrêté")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Stockage compact de très nombreux états de calculatrice
+Chaque champ de Calculator est rangé dans un tableau typé (une colonne par champ)
+"""
+
+import re
+from array import array
+from typing import Iterable, Optional
+
+from calculator import DIGITS, KEY_ALIASES, OPERATIONS, UNARY_OPERATIONS, Calculator
+
+
+# Mêmes règles de calcul (et d'erreur) que la calculatrice
+_calculate = Calculator()._perform_calculation
+
+
+# Codes des opérations binaires du registre (0 = aucune)
+OP_SYMBOLS = (None,) + tuple(sorted(OPERATIONS))
+OP_CODES = {symbol: code for code, symbol in enumerate(OP_SYMBOLS) if symbol}
+
+# Drapeaux
+WAIT = 1         # En attente d'un nouveau nombre
+HAS_PREVIOUS = 2 # Une valeur précédente est stockée
+IS_RESULT = 4    # L'affichage est un résultat calculé (et non des chiffres saisis)
+
+# Au-delà, la saisie ne tient plus dans un entier 64 bits : elle est gardée en texte
+_MAX_MANTISSA = 10 ** 17
+_PLAIN_ENTRY_RE = re.compile(r"[0-9]+(\.[0-9]*)?")
+
+
+class SessionTable:
+    """
+    États de N calculatrices dans des tableaux parallèles
+
+    La saisie en cours est gardée sous forme (mantisse entière, nombre de
+    décimales), par exemple "12.50" -> (1250, 2), "5." -> (5, 0) et
+    "7" -> (7, -1). Une session coûte ainsi 27 octets au lieu d'un objet
+    Calculator et de ses chaînes.
+    """
+
+    def __init__(self, size: int = 0):
+        self._value = array("d")        # Dernier résultat calculé
+        self._accumulator = array("d")  # Valeur précédente
+        self._mantissa = array("q")     # Chiffres saisis, sans le point
+        self._scale = array("b")        # Chiffres après le point (-1 = pas de point)
+        self._op = array("B")           # Code d'opération
+        self._flags = array("B")        # WAIT | HAS_PREVIOUS | IS_RESULT
+        self._long_entries = {}         # index -> saisie trop longue pour la mantisse
+        self._free = []
+        if size:
+            self.add_many(size)
+
+    def __len__(self) -> int:
+        return len(self._flags)
+
+    def add(self) -> int:
+        """Ajoute une session vierge (ou en recycle une) et renvoie son index"""
+        if self._free:
+            index = self._free.pop()
+            self.reset(index)
+            return index
+        self.add_many(1)
+        return len(self._flags) - 1
+
+    def add_many(self, count: int) -> range:
+        """Ajoute count sessions vierges d'un coup"""
+        start = len(self._flags)
+        zeros_d = array("d", bytes(8 * count))
+        self._value.extend(zeros_d)
+        self._accumulator.extend(zeros_d)
+        self._mantissa.extend(array("q", bytes(8 * count)))
+        self._scale.extend(array("b", [-1]) * count)
+        self._op.extend(bytes(count))
+        self._flags.extend(bytes(count))
+        return range(start, start + count)
+
+    def release(self, index: int) -> None:
+        """Libère une session ; son index sera réutilisé par add()"""
+        self.reset(index)
+        self._free.append(index)
+
+    def reset(self, index: int) -> None:
+        """Remet une session à zéro (comme Calculator.reset)"""
+        self._value[index] = 0.0
+        self._accumulator[index] = 0.0
+        self._mantissa[index] = 0
+        self._scale[index] = -1
+        self._op[index] = 0
+        self._flags[index] = 0
+        self._long_entries.pop(index, None)
+
+    # --- Saisie ---
+
+    def _entry_text(self, index: int) -> str:
+        """Texte de la saisie en cours (hors résultat calculé)"""
+        text = self._long_entries.get(index)
+        if text is not None:
+            return text
+        mantissa = self._mantissa[index]
+        scale = self._scale[index]
+        if scale < 0:
+            return str(mantissa)
+        if scale == 0:
+            return f"{mantissa}."
+        digits = str(mantissa).rjust(scale + 1, "0")
+        return f"{digits[:-scale]}.{digits[-scale:]}"
+
+    def _set_entry_text(self, index: int, text: str) -> None:
+        """Range une saisie donnée sous forme de texte"""
+        self._flags[index] &= ~IS_RESULT
+        if _PLAIN_ENTRY_RE.fullmatch(text):
+            whole, _, decimals = text.partition(".")
+            mantissa = int(whole + decimals)
+            if mantissa < _MAX_MANTISSA and len(decimals) < 100:
+                self._long_entries.pop(index, None)
+                self._mantissa[index] = mantissa
+                self._scale[index] = len(decimals) if "." in text else -1
+                return
+        self._long_entries[index] = text
+
+    def _current_number(self, index: int) -> float:
+        """Valeur numérique de ce qui s'affiche"""
+        if self._flags[index] & IS_RESULT:
+            return self._value[index]
+        if index in self._long_entries:
+            return float(self._long_entries[index])
+        # La division d'entiers Python est correctement arrondie : identique à float(texte)
+        scale = self._scale[index]
+        mantissa = self._mantissa[index]
+        return float(mantissa) if scale <= 0 else mantissa / 10 ** scale
+
+    def display(self, index: int) -> str:
+        """Valeur affichée par la session (comme Calculator.get_display_value)"""
+        if self._flags[index] & IS_RESULT:
+            return str(self._value[index])
+        return self._entry_text(index)
+
+    def feed(self, index: int, keys: Iterable[str]) -> str:
+        """
+        Applique une séquence de touches à une session (comme Calculator.feed)
+
+        Returns:
+            La valeur affichée après la dernière touche, ou "Erreur"
+
+        Raises:
+            ValueError: Si une touche est inconnue
+        """
+        flags = self._flags
+        mantissa = self._mantissa
+        scale = self._scale
+        error = False
+
+        for key in keys:
+            key = KEY_ALIASES.get(key, key)
+            if key in DIGITS:
+                state = flags[index]
+                if state & WAIT:
+                    self._long_entries.pop(index, None)
+                    mantissa[index] = ord(key) - 48
+                    scale[index] = -1
+                    flags[index] = state & ~(WAIT | IS_RESULT)
+                elif state & IS_RESULT or index in self._long_entries \
+                        or mantissa[index] >= _MAX_MANTISSA // 10 or scale[index] >= 100:
+                    self._set_entry_text(index, self.display(index) + key)
+                else:
+                    mantissa[index] = mantissa[index] * 10 + ord(key) - 48
+                    if scale[index] >= 0:
+                        scale[index] += 1
+                error = False
+            elif key in OPERATIONS:
+                error = not self._input_operation(index, key)
+            elif key == "=":
+                error = not self._calculate_result(index)
+            elif key == ".":
+                state = flags[index]
+                if state & WAIT:
+                    self._long_entries.pop(index, None)
+                    mantissa[index] = 0
+                    scale[index] = 0
+                    flags[index] = state & ~(WAIT | IS_RESULT)
+                elif state & IS_RESULT or index in self._long_entries:
+                    text = self.display(index)
+                    self._set_entry_text(index, text if "." in text else text + ".")
+                elif scale[index] < 0:
+                    scale[index] = 0
+                error = False
+            elif key in UNARY_OPERATIONS:
+                result = _calculate(0.0, self._current_number(index), key)
+                error = result is None
+                if not error:
+                    self._value[index] = result
+                    self._long_entries.pop(index, None)
+                    flags[index] |= IS_RESULT
+            elif key == "AC":
+                self.reset(index)
+                error = False
+            elif not key.isspace():
+                raise ValueError(f"Touche inconnue : {key!r}")
+
+        return "Erreur" if error else self.display(index)
+
+    def _input_operation(self, index: int, next_operation: str) -> bool:
+        """Comme Calculator.input_operation ; False si erreur"""
+        current = self._current_number(index)
+        state = self._flags[index]
+        if not state & HAS_PREVIOUS:
+            self._accumulator[index] = current
+        elif self._op[index]:
+            result = _calculate(self._accumulator[index], current, OP_SYMBOLS[self._op[index]])
+            if result is None:
+                return False
+            self._value[index] = result
+            self._accumulator[index] = result
+            self._long_entries.pop(index, None)
+            state |= IS_RESULT
+        else:
+            self._accumulator[index] = current
+        self._flags[index] = state | WAIT | HAS_PREVIOUS
+        self._op[index] = OP_CODES[next_operation]
+        return True
+
+    def _calculate_result(self, index: int) -> bool:
+        """Comme Calculator.calculate_result ; False si erreur"""
+        state = self._flags[index]
+        if self._op[index] and state & HAS_PREVIOUS:
+            result = _calculate(self._accumulator[index], self._current_number(index),
+                                OP_SYMBOLS[self._op[index]])
+            if result is None:
+                return False
+            self._value[index] = result
+            self._long_entries.pop(index, None)
+            self._op[index] = 0
+            self._flags[index] = (state & ~HAS_PREVIOUS) | WAIT | IS_RESULT
+        return True
+
+    # --- Conversion avec Calculator ---
+
+    def load(self, index: int, calculator: Calculator) -> None:
+        """Copie l'état d'une calculatrice (backend "float") dans la session index"""
+        if calculator.backend != "float":
+            raise ValueError("SessionTable ne stocke que des calculatrices en float")
+        self.reset(index)
+        flags = WAIT if calculator.wait_for_operand else 0
+        if calculator._entry is None:
+            self._value[index] = calculator._value
+            flags |= IS_RESULT
+        else:
+            self._set_entry_text(index, calculator._entry)
+        if calculator._accumulator is not None:
+            self._accumulator[index] = calculator._accumulator
+            flags |= HAS_PREVIOUS
+        self._op[index] = OP_CODES.get(calculator.operation, 0)
+        self._flags[index] = flags
+
+    def to_calculator(self, index: int, calculator: Optional[Calculator] = None) -> Calculator:
+        """Reconstruit une Calculator à partir de la session index"""
+        calculator = calculator or Calculator()
+        state = self._flags[index]
+        if state & IS_RESULT:
+            calculator._entry = None
+            calculator._value = self._value[index]
+        else:
+            calculator._entry = self._entry_text(index)
+        calculator._accumulator = self._accumulator[index] if state & HAS_PREVIOUS else None
+        calculator.operation = OP_SYMBOLS[self._op[index]]
+        calculator.wait_for_operand = bool(state & WAIT)
+        return calculator
+
+    def nbytes(self) -> int:
+        """Taille des tableaux typés (hors saisies trop longues)"""
+        return sum(a.itemsize * len(a) for a in (
+            self._value, self._accumulator, self._mantissa, self._scale, self._op, self._flags))
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Bande de calcul : journal binaire en ajout seul de tous les résultats
+
+Chaque calcul est un enregistrement de taille fixe (horodatage, opérandes,
+opération, résultat). Un index à côté du fichier (".idx") résume chaque bloc
+d'enregistrements (bornes d'horodatage et de résultat) : une recherche ne lit
+que les blocs qui peuvent contenir des réponses.
+"""
+
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Iterator, List, NamedTuple, Optional
+
+from calculator import Calculator
+
+
+# Enregistrement : horodatage, valeur précédente, valeur actuelle, résultat, code opération, drapeaux
+RECORD = struct.Struct("<ddddBBxx")
+# Entrée d'index : bloc [premier, fin), horodatage min/max, résultat min/max
+INDEX_ENTRY = struct.Struct("<QQdddd")
+
+TAPE_OPERATIONS = ("+", "-", "*", "/", "√", "x²", "±")
+_OP_CODES = {symbol: code for code, symbol in enumerate(TAPE_OPERATIONS)}
+UNKNOWN_OPERATION = 255
+ERROR = 1     # Drapeau : le calcul a donné "Erreur" (résultat NaN)
+OVERFLOW = 2  # Drapeau : un nombre dépasse les float, enregistré en ±inf
+
+DEFAULT_BLOCK_SIZE = 1024
+_CHUNK_RECORDS = 4096  # Enregistrements copiés à la fois par iter_records
+
+
+class TapeRecord(NamedTuple):
+    """Un calcul de la bande"""
+    timestamp: float
+    prev: float
+    current: float
+    operation: str
+    result: Optional[float]  # None = "Erreur"
+
+
+def _decode(fields: tuple) -> TapeRecord:
+    timestamp, prev, current, result, code, flags = fields
+    operation = TAPE_OPERATIONS[code] if code < len(TAPE_OPERATIONS) else "?"
+    return TapeRecord(timestamp, prev, current, operation, None if flags & ERROR else result)
+
+
+def _to_float(number) -> float:
+    """float(number), ou ±inf pour un entier / une fraction trop grand"""
+    try:
+        return float(number)
+    except OverflowError:
+        return math.inf if number > 0 else -math.inf
+
+
+def _index_path(path: str) -> str:
+    return path + ".idx"
+
+
+class TapeWriter:
+    """
+    Ajoute des calculs à la bande (écritures tamponnées)
+
+    L'index reçoit une entrée à chaque bloc complet de block_size
+    enregistrements ; le dernier bloc, incomplet, est lu directement.
+    append() et flush() peuvent venir de threads différents (thread de
+    calcul de la GUI et boucle Tk).
+    """
+
+    def __init__(self, path: str, block_size: int = DEFAULT_BLOCK_SIZE, buffer_size: int = 1 << 16):
+        self.path = path
+        self.block_size = block_size
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        # Un éventuel enregistrement tronqué (arrêt brutal) est ignoré
+        self.count = size // RECORD.size
+        if size % RECORD.size:
+            with open(path, "r+b") as f:
+                f.truncate(self.count * RECORD.size)
+        self._file = open(path, "ab", buffering=buffer_size)
+        self._lock = threading.Lock()
+        self._reset_block()
+        if self.count:
+            self._resume()
+        else:
+            open(_index_path(path), "wb").close()
+        self._index = open(_index_path(path), "ab")
+
+    def _resume(self) -> None:
+        """
+        Reprise : l'index est remis en accord avec les données (après un
+        arrêt brutal, une entrée peut manquer, être en double ou décrire un
+        enregistrement perdu), puis les bornes du bloc en cours sont recalculées
+        """
+        block_size = self.block_size
+        with TapeReader(self.path) as reader:
+            entries = reader._blocks
+            valid = 0
+            while (valid < len(entries) and entries[valid][0] == valid * block_size
+                   and entries[valid][1] == (valid + 1) * block_size <= self.count):
+                valid += 1
+            with open(_index_path(self.path), "ab") as index:
+                index.truncate(valid * INDEX_ENTRY.size)
+                for start in range(valid * block_size, self.count, block_size):
+                    stop = min(start + block_size, self.count)
+                    for record in reader.iter_records(start, stop):
+                        self._extend_block(record.timestamp, record.result)
+                    if stop - start == block_size:
+                        index.write(INDEX_ENTRY.pack(start, stop, self._min_ts, self._max_ts,
+                                                     self._min_result, self._max_result))
+                        self._reset_block()
+
+    def _reset_block(self) -> None:
+        self._min_ts = math.inf
+        self._max_ts = -math.inf
+        self._min_result = math.inf
+        self._max_result = -math.inf
+
+    def _extend_block(self, timestamp: float, result: Optional[float]) -> None:
+        if timestamp < self._min_ts:
+            self._min_ts = timestamp
+        if timestamp > self._max_ts:
+            self._max_ts = timestamp
+        if result is not None and not math.isnan(result):
+            if result < self._min_result:
+                self._min_result = result
+            if result > self._max_result:
+                self._max_result = result
+
+    def append(self, prev, current, operation: str, result, timestamp: Optional[float] = None) -> int:
+        """
+        Ajoute un calcul (result None = "Erreur") et renvoie son numéro
+
+        Les nombres sont enregistrés en float (valeur approchée pour les
+        backends decimal / fraction / int, ±inf et drapeau OVERFLOW au-delà).
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        error = result is None
+        prev, current = _to_float(prev), _to_float(current)
+        result = math.nan if error else _to_float(result)
+        flags = ERROR if error else 0
+        if math.isinf(prev) or math.isinf(current) or math.isinf(result):
+            flags |= OVERFLOW
+        data = RECORD.pack(timestamp, prev, current, result, _OP_CODES.get(operation, UNKNOWN_OPERATION), flags)
+        with self._lock:
+            self._file.write(data)
+            self._extend_block(timestamp, None if error else result)
+            number = self.count
+            self.count += 1
+            if self.count % self.block_size == 0:
+                self._index.write(INDEX_ENTRY.pack(
+                    self.count - self.block_size, self.count,
+                    self._min_ts, self._max_ts, self._min_result, self._max_result))
+                self._reset_block()
+        return number
+
+    def flush(self) -> None:
+        """Écrit sur disque ce qui est encore dans les tampons"""
+        with self._lock:
+            self._file.flush()
+            self._index.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+            self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class TapeReader:
+    """
+    Lecture de la bande par projection mémoire (mmap)
+
+    Les enregistrements sont décodés à la demande, sans lire tout le fichier.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._mmap = None
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= RECORD.size:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._count = size // RECORD.size if self._mmap is not None else 0
+        self._blocks = self._load_index()
+
+    def _load_index(self) -> List[tuple]:
+        try:
+            with open(_index_path(self.path), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        usable = len(data) - len(data) % INDEX_ENTRY.size
+        return list(INDEX_ENTRY.iter_unpack(data[:usable]))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, number: int) -> TapeRecord:
+        if number < 0:
+            number += self._count
+        if not 0 <= number < self._count:
+            raise IndexError("enregistrement hors de la bande")
+        return _decode(RECORD.unpack_from(self._mmap, number * RECORD.size))
+
+    def iter_records(self, start: int = 0, stop: Optional[int] = None) -> Iterator[TapeRecord]:
+        """
+        Parcourt les enregistrements [start, stop), par tranches copiées de
+        la projection : un générateur non terminé n'empêche pas close()
+        """
+        stop = self._count if stop is None else min(stop, self._count)
+        for chunk in range(start, stop, _CHUNK_RECORDS):
+            data = self._mmap[chunk * RECORD.size:min(chunk + _CHUNK_RECORDS, stop) * RECORD.size]
+            for fields in RECORD.iter_unpack(data):
+                yield _decode(fields)
+
+    def page(self, page: int, page_size: int = 50, newest_first: bool = True) -> List[TapeRecord]:
+        """Une page d'enregistrements (page 0 = les plus récents par défaut)"""
+        if newest_first:
+            stop = self._count - page * page_size
+            records = list(self.iter_records(max(stop - page_size, 0), max(stop, 0)))
+            records.reverse()
+            return records
+        start = page * page_size
+        return list(self.iter_records(start, start + page_size))
+
+    def _candidate_ranges(self, low_field: int, high_field: int, low: float, high: float) -> Iterator[tuple]:
+        """Plages d'enregistrements dont les bornes indexées recoupent [low, high]"""
+        indexed = 0
+        for entry in self._blocks:
+            first, stop = entry[0], min(entry[1], self._count)
+            if first >= stop:
+                break
+            if entry[low_field] <= high and entry[high_field] >= low:
+                yield first, stop
+            indexed = stop
+        if indexed < self._count:
+            yield indexed, self._count  # Bloc en cours, pas encore indexé
+
+    def find_time_range(self, start: float, end: float) -> Iterator[TapeRecord]:
+        """Calculs dont l'horodatage est dans [start, end]"""
+        for first, stop in self._candidate_ranges(2, 3, start, end):
+            for record in self.iter_records(first, stop):
+                if start <= record.timestamp <= end:
+                    yield record
+
+    def find_result(self, low: float, high: Optional[float] = None) -> Iterator[TapeRecord]:
+        """Calculs dont le résultat vaut low (ou est dans [low, high])"""
+        high = low if high is None else high
+        for first, stop in self._candidate_ranges(4, 5, low, high):
+            for record in self.iter_records(first, stop):
+                if record.result is not None and low <= record.result <= high:
+                    yield record
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class TapedCalculator(Calculator):
+    """Calculator qui enregistre chaque calcul sur une bande"""
+
+    __slots__ = ("tape",)
+
+    def __init__(self, tape: TapeWriter, backend: str = "float", precision: int = 28):
+        self.tape = tape
+        super().__init__(backend, precision)
+
+    def _perform_calculation(self, prev, current, operation):
+        result = super()._perform_calculation(prev, current, operation)
+        self.tape.append(prev, current, operation, result)
+        return result
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Calculs vectorisés avec NumPy
+Applique les opérations de la calculatrice élément par élément sur des tableaux
+"""
+
+import numpy as np
+
+
+def perform_calculation_array(prev, current, operation: str) -> np.ma.MaskedArray:
+    """
+    Équivalent vectorisé de Calculator._perform_calculation
+
+    Les lignes en erreur (division par zéro, racine d'un nombre négatif,
+    dépassement de capacité) sont masquées, là où la version scalaire
+    renvoie None. `result.filled(np.nan)` donne un tableau de floats
+    avec NaN pour "Erreur".
+
+    Args:
+        prev: Valeurs précédentes (ignorées pour √ et x²)
+        current: Valeurs actuelles
+        operation: Opération à effectuer (+, -, *, /, √, x²)
+
+    Returns:
+        Un tableau masqué de float64 (masque = "Erreur")
+
+    Raises:
+        ValueError: Si l'opération est inconnue
+    """
+    current = np.asarray(current, dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        if operation in ("√", "x²"):
+            if operation == "√":
+                error = current < 0
+                result = np.sqrt(np.where(error, 0.0, current))
+            else:
+                result = np.square(current)
+                # Le carré scalaire lève OverflowError au-delà de float max
+                error = np.isinf(result) & np.isfinite(current)
+        else:
+            prev = np.asarray(prev, dtype=np.float64)
+            if operation == "+":
+                result = np.add(prev, current)
+                error = np.zeros(result.shape, dtype=bool)
+            elif operation == "-":
+                result = np.subtract(prev, current)
+                error = np.zeros(result.shape, dtype=bool)
+            elif operation == "*":
+                result = np.multiply(prev, current)
+                error = np.zeros(result.shape, dtype=bool)
+            elif operation == "/":
+                error = np.broadcast_to(current == 0, np.broadcast(prev, current).shape)
+                result = np.divide(prev, np.where(current == 0, 1.0, current))
+            else:
+                raise ValueError(f"Opération inconnue : {operation!r}")
+
+    return np.ma.MaskedArray(result, mask=error)
+
+
+def to_display(result: np.ma.MaskedArray) -> list:
+    """
+    Convertit un résultat vectorisé en valeurs d'affichage
+
+    Returns:
+        Une liste de chaînes, comme Calculator.calculate_result ("8.0", "Erreur"...)
+    """
+    values = result.filled(np.nan).tolist()
+    mask = np.ma.getmaskarray(result).tolist()
+    return ["Erreur" if masked else str(value) for value, masked in zip(values, mask)]
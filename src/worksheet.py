@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Feuille de calcul : formules sur les registres d'une calculatrice
+
+Chaque formule ("tva = sous_total * 0.2") lit des registres et écrit le sien.
+Les formules forment un graphe orienté sans cycle : quand un registre change,
+seules les formules qui en dépendent sont recalculées, dans l'ordre
+topologique (par niveau : une formule passe après toutes ses dépendances).
+"""
+
+from typing import Dict, Iterable, Optional, Set
+
+from calculator import Calculator
+from expression import CompiledExpression, compile_expression
+
+
+class Worksheet:
+    """
+    Formules recalculées au fil des changements
+
+    Exemple :
+        sheet = Worksheet()
+        sheet.define("tva", "sous_total * 0.2")
+        sheet.define("total", "sous_total + tva")
+        sheet.set("sous_total", 100)   # recalcule tva puis total
+        sheet["total"]                 # 120.0
+
+    Un registre absent ou une formule en erreur vaut None ("Erreur"),
+    et l'erreur se propage aux formules qui en dépendent.
+    """
+
+    def __init__(self, calculator: Optional[Calculator] = None):
+        """
+        Args:
+            calculator: Calculatrice dont les registres portent les valeurs
+                        (MR rappelle un résultat de formule, STO / M+ recalculent
+                        les formules) ; backend float
+
+        Raises:
+            ValueError: Si la calculatrice n'utilise pas le backend float,
+                        ou a déjà une feuille
+        """
+        self.calculator = calculator if calculator is not None else Calculator()
+        if self.calculator.backend != "float":
+            raise ValueError("les formules calculent en float (backend 'float' uniquement)")
+        if self.calculator.worksheet is not None:
+            raise ValueError("la calculatrice a déjà une feuille de formules")
+        self.calculator.worksheet = self
+        self.values = self.calculator.registers
+        self._formulas: Dict[str, CompiledExpression] = {}
+        self._dependents: Dict[str, Set[str]] = {}  # registre -> formules qui le lisent
+        self._levels: Dict[str, int] = {}           # formule -> 1 + niveau max de ses dépendances
+        self.recomputed = 0                         # Formules évaluées depuis la création
+
+    def __getitem__(self, name: str):
+        return self.values.get(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.values or name in self._formulas
+
+    def __len__(self) -> int:
+        return len(self._formulas)
+
+    @property
+    def formulas(self) -> Dict[str, str]:
+        """Formules définies : nom -> source"""
+        return {name: formula.source for name, formula in self._formulas.items()}
+
+    def set(self, name: str, value: float) -> int:
+        """
+        Change un registre d'entrée et recalcule ses dépendants
+
+        Returns:
+            Le nombre de formules recalculées
+
+        Raises:
+            ValueError: Si name est une formule
+        """
+        if name in self._formulas:
+            raise ValueError(f"{name!r} est une formule, pas une entrée")
+        self.values[name] = value
+        return self._propagate((name,))
+
+    def update(self, values: Dict[str, float]) -> int:
+        """Change plusieurs entrées et recalcule une seule fois leurs dépendants"""
+        for name in values:
+            if name in self._formulas:
+                raise ValueError(f"{name!r} est une formule, pas une entrée")
+        self.values.update(values)
+        return self._propagate(values)
+
+    def discard(self, name: str) -> int:
+        """Vide un registre d'entrée (ses dépendants passent en erreur)"""
+        if name in self._formulas:
+            raise ValueError(f"{name!r} est une formule, pas une entrée")
+        self.values.pop(name, None)
+        return self._propagate((name,))
+
+    def define(self, name: str, source: str) -> int:
+        """
+        Définit (ou remplace) la formule d'un registre et recalcule ses dépendants
+
+        Returns:
+            Le nombre de formules recalculées (celle-ci comprise)
+
+        Raises:
+            ValueError: Si la source est invalide ou crée un cycle
+        """
+        formula = compile_expression(source)
+        # Personne ne lit name : il ne peut pas fermer un cycle (évite le parcours)
+        if name in formula.variables or (name in self._dependents and self._reaches(formula.variables, name)):
+            raise ValueError(f"Référence circulaire : {name!r} dépend de lui-même")
+
+        self._unlink(name)
+        self._formulas[name] = formula
+        for dependency in formula.variables:
+            self._dependents.setdefault(dependency, set()).add(name)
+        self._relevel(name)
+        self.values[name] = self._evaluate(formula)
+        self.recomputed += 1
+        return 1 + self._propagate((name,))
+
+    def remove(self, name: str) -> None:
+        """Supprime une formule ; son registre garde la dernière valeur calculée"""
+        if name not in self._formulas:
+            raise KeyError(name)
+        self._unlink(name)
+        del self._formulas[name]
+        del self._levels[name]
+        for dependent in self._dependents.get(name, ()):
+            self._relevel(dependent)
+
+    def recompute_all(self) -> int:
+        """Réévalue toutes les formules dans l'ordre topologique (sans incrémental)"""
+        values = self.values
+        for name in sorted(self._formulas, key=self._levels.__getitem__):
+            values[name] = self._evaluate(self._formulas[name])
+        self.recomputed += len(self._formulas)
+        return len(self._formulas)
+
+    def _evaluate(self, formula: CompiledExpression) -> Optional[float]:
+        try:
+            return formula.evaluate(self.values)
+        except KeyError:
+            return None  # Registre jamais rempli
+
+    def _propagate(self, changed: Iterable[str]) -> int:
+        """Recalcule, par niveau croissant, les formules touchées par changed"""
+        formulas = self._formulas
+        dependents = self._dependents
+        levels = self._levels
+        values = self.values
+        buckets: Dict[int, list] = {}  # niveau -> formules à recalculer
+        queued = set()
+        top = 0
+        for name in changed:
+            for dependent in dependents.get(name, ()):
+                if dependent not in queued:
+                    queued.add(dependent)
+                    level = levels[dependent]
+                    buckets.setdefault(level, []).append(dependent)
+                    if level > top:
+                        top = level
+
+        count = 0
+        level = 1
+        # Les dépendants d'une formule ont un niveau strictement plus grand :
+        # un seul passage par niveaux croissants respecte l'ordre topologique
+        while level <= top:
+            for name in buckets.pop(level, ()):
+                try:
+                    value = formulas[name].evaluate(values)
+                except KeyError:
+                    value = None  # Registre jamais rempli
+                count += 1
+                if name in values and values[name] == value:
+                    continue  # Inchangé : inutile de descendre plus loin
+                values[name] = value
+                for dependent in dependents.get(name, ()):
+                    if dependent not in queued:
+                        queued.add(dependent)
+                        dependent_level = levels[dependent]
+                        buckets.setdefault(dependent_level, []).append(dependent)
+                        if dependent_level > top:
+                            top = dependent_level
+            level += 1
+        self.recomputed += count
+        return count
+
+    def _unlink(self, name: str) -> None:
+        """Retire les arêtes entrantes de la formule name"""
+        formula = self._formulas.get(name)
+        if formula is None:
+            return
+        for dependency in formula.variables:
+            readers = self._dependents.get(dependency)
+            if readers is not None:
+                readers.discard(name)
+                if not readers:
+                    del self._dependents[dependency]
+
+    def _reaches(self, starts: Iterable[str], target: str) -> bool:
+        """True si target est une dépendance (directe ou non) d'un des registres starts"""
+        stack = list(starts)
+        seen = set(stack)
+        while stack:
+            name = stack.pop()
+            if name == target:
+                return True
+            formula = self._formulas.get(name)
+            if formula is None:
+                continue  # Entrée : pas de dépendances
+            for dependency in formula.variables:
+                if dependency not in seen:
+                    seen.add(dependency)
+                    stack.append(dependency)
+        return False
+
+    def _relevel(self, name: str) -> None:
+        """Recalcule le niveau de name puis, si besoin, celui de ses dépendants"""
+        formulas = self._formulas
+        levels = self._levels
+        stack = [name]
+        while stack:
+            current = stack.pop()
+            if current not in formulas:
+                continue
+            level = 1 + max((levels.get(dependency, 0) for dependency in formulas[current].variables), default=0)
+            if levels.get(current) == level:
+                continue
+            levels[current] = level
+            stack.extend(self._dependents.get(current, ()))
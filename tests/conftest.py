@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Fixtures partagées des tests
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+
+@pytest.fixture
+def gui_class():
+    """CalculatorGUI sur un faux CustomTkinter (pas d'écran dans les tests)"""
+    import fake_ctk
+    saved = {name: sys.modules.pop(name, None) for name in ("customtkinter", "gui")}
+    fake_ctk.install()
+    from gui import CalculatorGUI
+    yield CalculatorGUI
+    for name, module in saved.items():
+        sys.modules.pop(name, None)
+        if module is not None:
+            sys.modules[name] = module
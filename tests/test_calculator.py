@@ -10,7 +10,7 @@ import os
 # Ajoute le dossier src au PATH pour les imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from calculator import Calculator
+from calculator import OPERATORS, Calculator, register_operator, unregister_operator
 
 
 class TestCalculator:
@@ -127,18 +127,202 @@ class TestCalculator:
         assert self.calc.get_display_value() == "0"
         assert self.calc.previous_value == ""
         assert self.calc.operation is None
+    
+    def test_previous_value_is_numeric(self):
+        """La valeur précédente est gardée sous forme de nombre"""
+        self.calc.input_number("7")
+        self.calc.input_operation("+")
+        assert self.calc.previous_value == 7.0
+        assert self.calc.get_display_value() == "7"
+    
+    def test_digits_appended_to_result(self):
+        """Une valeur imposée de l'extérieur (comme le fait la GUI) reste modifiable"""
+        self.calc.current_value = "2.5"
+        self.calc.input_number("1")
+        assert self.calc.get_display_value() == "2.51"
+        self.calc.input_operation("*")
+        self.calc.input_number("2")
+        assert self.calc.calculate_result() == "5.02"
+
+
+class TestFeed:
+    """Tests pour la saisie en lot Calculator.feed()"""
+
+    def setup_method(self):
+        self.calc = Calculator()
+
+    @staticmethod
+    def _replay_key_by_key(keys):
+        """Rejoue les touches une par une, comme la GUI"""
+        calc = Calculator()
+        display = calc.get_display_value()
+        for key in keys:
+            if key.isdigit():
+                display = calc.input_number(key)
+            elif key == ".":
+                display = calc.input_decimal()
+            elif key == "=":
+                display = calc.calculate_result()
+            elif key == "AC":
+                calc.reset()
+                display = "0"
+            elif key in ("√", "x²", "±"):
+                display = calc.apply_unary(key)
+            else:
+                display = calc.input_operation(key)
+        return calc, display
+
+    @pytest.mark.parametrize("keys", [
+        "5+3=",
+        "2+3*4=",
+        "2.5+1.5=",
+        "5/0=",
+        "5/0+1=",
+        "9-3=2",
+        "1..5*2=",
+        "7*=",
+        "8+=",
+        "9√+1=",
+        "3±*2=",
+    ])
+    def test_matches_key_by_key(self, keys):
+        """feed() donne le même affichage et le même état que la saisie touche par touche"""
+        expected_calc, expected_display = self._replay_key_by_key(keys)
+        assert self.calc.feed(keys) == expected_display
+        assert self.calc.get_display_value() == expected_calc.get_display_value()
+        assert self.calc.previous_value == expected_calc.previous_value
+        assert self.calc.operation == expected_calc.operation
+        assert self.calc.wait_for_operand == expected_calc.wait_for_operand
 
+    def test_token_iterable_with_reset(self):
+        """Un itérable de touches accepte aussi AC"""
+        assert self.calc.feed(["1", "2", "+", "AC", "4", "*", "2", "="]) == "8.0"
 
-# Tests pour les fonctions spéciales (à ajouter plus tard)
+    def test_square_alias(self):
+        """"²" est un raccourci de "x²" dans une chaîne"""
+        assert self.calc.feed("12²") == "144.0"
+
+    def test_whitespace_ignored(self):
+        """Les espaces d'une chaîne sont ignorés"""
+        assert self.calc.feed("6 * 7 =") == "42.0"
+
+    def test_unknown_key(self):
+        """Une touche inconnue lève ValueError sans modifier l'état"""
+        self.calc.input_number("4")
+        with pytest.raises(ValueError):
+            self.calc.feed("1+x")
+        assert self.calc.get_display_value() == "4"
+
+    def test_unknown_key_after_memory_key(self):
+        """Les touches mémoire déjà jouées sont annulées aussi (état et registres)"""
+        self.calc.feed(["7", "M+", "AC", "4"])
+        before = self.calc.snapshot()
+        with pytest.raises(ValueError):
+            self.calc.feed(["+", "2", "M+", "MR", "=", "x"])
+        assert self.calc.snapshot() == before
+        assert self.calc.registers == {"M": 7.0}
+        assert self.calc.feed(["+", "1", "="]) == "5.0"
+
+
+# Tests pour les fonctions spéciales
 class TestSpecialFunctions:
     """Tests pour les fonctions spéciales (racine, carré...)"""
     
     def setup_method(self):
         self.calc = Calculator()
     
-    # Ces tests seront pour les fonctions racine, carré, etc.
-    # À implémenter quand on ajoutera ces fonctions
-    pass
+    def test_square_root(self):
+        """Test racine carrée : √16 = 4"""
+        self.calc.input_number("1")
+        self.calc.input_number("6")
+        assert self.calc.apply_unary("√") == "4.0"
+    
+    def test_negative_square_root(self):
+        """Racine d'un nombre négatif : erreur, la valeur reste affichée"""
+        self.calc.input_number("4")
+        self.calc.apply_unary("±")
+        assert self.calc.apply_unary("√") == "Erreur"
+        assert self.calc.get_display_value() == "-4.0"
+    
+    def test_square(self):
+        """Test carré : 7² = 49"""
+        self.calc.input_number("7")
+        assert self.calc.apply_unary("x²") == "49.0"
+    
+    def test_square_overflow(self):
+        """Le dépassement de capacité donne une erreur"""
+        self.calc.current_value = "1e200"
+        assert self.calc.apply_unary("x²") == "Erreur"
+    
+    def test_unary_in_chain(self):
+        """Une opération immédiate sur le deuxième nombre : 2 + √9 = 5"""
+        self.calc.input_number("2")
+        self.calc.input_operation("+")
+        self.calc.input_number("9")
+        self.calc.apply_unary("√")
+        assert self.calc.calculate_result() == "5.0"
+
+
+class TestOperatorRegistry:
+    """Tests pour le registre des opérations"""
+    
+    def test_metadata(self):
+        assert OPERATORS["*"].arity == 2
+        assert OPERATORS["*"].precedence > OPERATORS["+"].precedence
+        assert OPERATORS["√"].arity == 1
+    
+    def test_register_new_operator(self):
+        """Une opération ajoutée au registre est utilisable partout"""
+        register_operator("%", 2, 2, lambda prev, current: prev % current)
+        try:
+            calc = Calculator()
+            assert calc.feed("17%5=") == "2.0"
+            assert calc.feed("%0=") == "Erreur"  # ZeroDivisionError -> Erreur
+        finally:
+            unregister_operator("%")
+        assert "%" not in OPERATORS
+
+
+class TestNumericBackends:
+    """Tests pour les backends numériques exacts"""
+    
+    def test_float_is_default(self):
+        calc = Calculator()
+        assert calc.backend == "float"
+        assert calc.feed("0.1+0.2=") == "0.30000000000000004"
+    
+    def test_decimal(self):
+        calc = Calculator("decimal")
+        assert calc.feed("0.1+0.2=") == "0.3"
+        assert calc.previous_value == ""
+        assert Calculator("decimal", precision=5).feed("1/3=") == "0.33333"
+    
+    def test_decimal_large_square(self):
+        """Pas de dépassement de capacité en décimal"""
+        assert Calculator().feed("1000000000²²²²²²") == "Erreur"
+        assert Calculator("decimal").feed("1000000000²²²²²²") == "1.000000000000000000000000000E+576"
+    
+    def test_fraction(self):
+        calc = Calculator("fraction")
+        assert calc.feed("1/3*3=") == "1"
+        assert Calculator("fraction").feed("7/2=") == "7/2"
+        assert Calculator("fraction").feed("0.25√") == "1/2"
+    
+    def test_int(self):
+        calc = Calculator("int")
+        assert calc.feed("6*7=") == "42"
+        assert isinstance(calc._value, int)
+        assert Calculator("int").feed("144√") == "12"
+        assert Calculator("int").feed("7/2=") == "7/2"
+    
+    def test_exact_errors(self):
+        for backend in ("decimal", "fraction", "int"):
+            assert Calculator(backend).feed("5/0=") == "Erreur"
+            assert Calculator(backend).feed("4±√") == "Erreur"
+    
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            Calculator("complex")
 
 
 # Point d'entrée pour lancer les tests
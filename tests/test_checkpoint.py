@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour les points de reprise binaires
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from calculator import Calculator, calculator_from_snapshot
+from checkpoint import HEADER, RECORD, SEGMENT, CheckpointReader, CheckpointWriter, load_calculators, save_calculators
+from programmer import ProgrammerCalculator
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "etat.ckpt")
+
+
+def make_calculators():
+    keys = ["12.5+3", "7*", "1/0=", "", "42"]
+    calculators = [Calculator() for _ in keys]
+    for calc, sequence in zip(calculators, keys):
+        calc.feed(sequence)
+    calculators += [Calculator("decimal", 50), Calculator("fraction"), Calculator("int")]
+    calculators[-3].feed("1/3=")
+    calculators[-2].feed("1/3+")
+    calculators[-1].feed("9√+3/2")
+    return calculators
+
+
+def states(calculators):
+    return [(calc.backend, calc._backend.precision, calc.snapshot()) for calc in calculators]
+
+
+class TestCheckpoint:
+    """Tests pour CheckpointWriter / CheckpointReader"""
+
+    def test_round_trip(self, path):
+        calculators = make_calculators()
+        assert save_calculators(path, calculators) == len(calculators)
+        loaded = load_calculators(path)
+        assert states(loaded) == states(calculators)
+        # Les types exacts sont gardés (Fraction, int, Decimal)
+        assert [type(calc._value) for calc in loaded] == [type(calc._value) for calc in calculators]
+        # Le calcul reprend là où il en était
+        for original, restored in zip(calculators, loaded):
+            assert original.feed("2=") == restored.feed("2=")
+
+    def test_string_table_shares_entries(self, path):
+        calculators = [Calculator() for _ in range(1000)]
+        for calc in calculators:
+            calc.feed("123.45+6")
+        save_calculators(path, calculators)
+        assert os.path.getsize(path) < HEADER.size + 1000 * RECORD.size + 100
+
+    def test_random_access(self, path):
+        calculators = make_calculators()
+        save_calculators(path, calculators)
+        with CheckpointReader(path) as reader:
+            assert len(reader) == len(calculators)
+            assert reader[1].snapshot() == calculators[1].snapshot()
+            assert reader.state(5)[:2] == ("decimal", 50)
+            with pytest.raises(IndexError):
+                reader[len(calculators)]
+
+    def test_dirty_only(self, path):
+        calculators = make_calculators()
+        writer = CheckpointWriter(path)
+        writer.checkpoint(calculators)
+        size = os.path.getsize(path)
+        assert writer.checkpoint(calculators) == 0
+        calculators[0].feed("9")
+        calculators[3].feed("5")
+        calculators.append(Calculator())
+        assert writer.checkpoint(calculators) == 3  # Deux modifiées + une nouvelle
+        assert os.path.getsize(path) < size + SEGMENT.size + 3 * (RECORD.size + 4) + 16
+        calculators[2].feed("1")
+        assert writer.checkpoint(calculators, dirty=[1]) == 0  # Seuls les indices indiqués
+        assert writer.checkpoint(calculators, dirty=[2]) == 1
+        assert states(load_calculators(path)) == states(calculators)
+
+    def test_compaction_and_shrink(self, path):
+        calculators = [Calculator() for _ in range(4)]
+        writer = CheckpointWriter(path, compact_ratio=0.5)
+        writer.checkpoint(calculators)
+        size = os.path.getsize(path)
+        for digit in "12":
+            calculators[0].feed(digit)
+            writer.checkpoint(calculators)
+        assert os.path.getsize(path) > size
+        calculators[1].feed("3")
+        writer.checkpoint(calculators)  # Trop de deltas : réécriture complète
+        full_path = path + ".complet"
+        save_calculators(full_path, calculators)
+        assert os.path.getsize(path) == os.path.getsize(full_path)
+        assert writer.checkpoint(calculators[:2]) == 2
+        assert states(load_calculators(path)) == states(calculators[:2])
+
+    def test_torn_delta_ignored_and_truncated(self, path):
+        calculators = make_calculators()
+        writer = CheckpointWriter(path)
+        writer.checkpoint(calculators)
+        calculators[0].feed("7")
+        writer.checkpoint(calculators)
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) - 5)  # Arrêt brutal pendant le delta
+        expected = make_calculators()
+        resumed = CheckpointWriter(path)
+        loaded = resumed.load()
+        assert states(loaded) == states(expected)
+        loaded[4].feed("1")
+        assert resumed.checkpoint(loaded) == 1
+        assert states(load_calculators(path)) == states(loaded)
+
+    def test_restore_into(self, path):
+        calculators = make_calculators()
+        save_calculators(path, calculators)
+        targets = [Calculator(calc.backend, calc._backend.precision) for calc in calculators]
+        with CheckpointReader(path) as reader:
+            reader.restore_into(targets)
+            with pytest.raises(ValueError):
+                reader.restore_into(targets[:2])
+        assert states(targets) == states(calculators)
+
+    def test_invalid(self, path):
+        with pytest.raises(ValueError):
+            save_calculators(path, [ProgrammerCalculator()])
+        with open(path, "wb") as f:
+            f.write(b"pas un point de reprise")
+        with pytest.raises(ValueError):
+            CheckpointReader(path)
+
+    def test_failed_checkpoint_recovers(self, path):
+        calculators = make_calculators()
+        writer = CheckpointWriter(path)
+        writer.checkpoint(calculators)
+        size = os.path.getsize(path)
+        calculators[0].feed("98.76")  # Nouvelle chaîne à ajouter à la table
+        calculators.append(ProgrammerCalculator())
+        with pytest.raises(ValueError):
+            writer.checkpoint(calculators)
+        assert os.path.getsize(path) == size  # Rien d'écrit
+        calculators.pop()
+        calculators[1].feed("5")
+        assert writer.checkpoint(calculators) == 2  # La modification d'avant n'est pas perdue
+        assert states(load_calculators(path)) == states(calculators)
+        # Même chose pour une réécriture complète
+        with pytest.raises(ValueError):
+            CheckpointWriter(path).checkpoint(calculators + [ProgrammerCalculator()])
+        assert states(load_calculators(path)) == states(calculators)
+        assert not os.path.exists(path + ".tmp")
+
+    def test_calculator_from_snapshot(self):
+        calc = Calculator("decimal", 50)
+        calc.feed("2√")
+        copy = calculator_from_snapshot(calc.snapshot(), "decimal", 50)
+        assert copy.snapshot() == calc.snapshot()
+        assert copy.feed(["x²", "="]) == calc.feed(["x²", "="])
+        assert copy.registers == {}
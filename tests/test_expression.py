@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour le compilateur d'expressions
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from expression import CompiledExpression, ExpressionCache, evaluate
+
+
+class TestExpression:
+    """Tests pour la compilation et l'évaluation"""
+
+    @pytest.mark.parametrize("source, expected", [
+        ("3+4*2", 11.0),
+        ("(3+4)*2", 14.0),
+        ("10-4-3", 3.0),
+        ("8/2/2", 2.0),
+        ("-3²", -9.0),
+        ("√16+1", 5.0),
+        ("2.5 * .4", 1.0),
+        ("(1+2)²", 9.0),
+    ])
+    def test_precedence(self, source, expected):
+        """Priorités des opérateurs"""
+        assert CompiledExpression(source).evaluate() == expected
+
+    def test_errors_return_none(self):
+        """Division par zéro et racine négative donnent None, comme la calculatrice"""
+        assert evaluate("5/0") is None
+        assert evaluate("√(0-4)") is None
+        assert evaluate("1 + 5/(2-2)") is None
+
+    def test_variables(self):
+        """Une expression compilée est réévaluée avec d'autres valeurs"""
+        expr = CompiledExpression("prix * qte")
+        assert expr.variables == frozenset({"prix", "qte"})
+        assert expr.evaluate(prix=2.5, qte=4) == 10.0
+        assert expr({"prix": 1.0, "qte": 3.0}) == 3.0
+        with pytest.raises(KeyError):
+            expr.evaluate(prix=1.0)
+
+    @pytest.mark.parametrize("source", ["", "3+", "(1+2", "1 2", "3 % 2", "√"])
+    def test_syntax_errors(self, source):
+        """Les erreurs de syntaxe lèvent ValueError"""
+        with pytest.raises(ValueError):
+            CompiledExpression(source)
+
+
+class TestExpressionCache:
+    """Tests pour le cache LRU"""
+
+    def test_hits_and_misses(self):
+        cache = ExpressionCache(maxsize=2)
+        first = cache.get("a+1")
+        assert cache.get("a+1") is first
+        assert cache.info() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 2}
+
+    def test_lru_eviction(self):
+        cache = ExpressionCache(maxsize=2)
+        cache.get("1")
+        cache.get("2")
+        cache.get("1")       # "2" devient la moins récente
+        cache.get("3")
+        cache.get("1")
+        assert cache.hits == 2
+        cache.get("2")
+        assert cache.misses == 4
+        assert len(cache) == 2
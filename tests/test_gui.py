@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour la construction de CalculatorGUI (faux CustomTkinter)
+"""
+
+import sys
+import os
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from main import format_startup_profile
+
+
+class TestStartup:
+    """Tests pour le démarrage de la GUI"""
+
+    def test_one_grid_call_and_one_font(self, gui_class):
+        ctk = sys.modules["customtkinter"]
+        placements = []
+        ctk.CTkButton.grid = lambda self, **options: placements.append((self.cget("text"), options))
+        fonts = []
+        ctk.CTkFont = type("CTkFont", (), {"__init__": lambda self, **options: fonts.append(self)})
+        gui = gui_class()
+        texts = [text for text, _ in placements]
+        assert len(texts) == len(set(texts)) == 20
+        assert dict(placements)["0"]["columnspan"] == 2
+        assert dict(placements)["="]["columnspan"] == 4
+        keypad_fonts = {id(button.cget("font")) for button in gui.button_widgets.values()}
+        assert len(keypad_fonts) == 1
+        assert len(fonts) == 2  # Clavier + écran (la barre de statut est différée)
+
+    def test_status_bar_deferred(self, gui_class):
+        gui = gui_class()
+        assert gui.status_label is None
+        gui._update_status("Avant la barre")
+        gui.root.update()
+        assert gui.status_label.cget("text") == "Avant la barre"
+        assert "status_bar (différé)" in gui.startup_times
+
+    def test_startup_profile(self, gui_class):
+        gui = gui_class()
+        gui.root.update()
+        report = format_startup_profile(gui, 0.25, gui.constructed_at - 0.3)
+        for phase in ("imports", "theme", "_setup_window", "_create_widgets", "first idle", "total"):
+            assert phase in report
+        assert "250.0 ms" in report
+
+
+class TestDisplay:
+    """Tests pour le formatage de l'écran"""
+
+    def test_float_backend_keeps_float_notation(self, gui_class):
+        gui = gui_class()
+        assert gui._format_display("0.30000000000000004") == "3.0000e-01"
+        assert gui._format_display("-0.0000123456789") == "-1.2346e-05"
+        assert gui._format_display("9" * 400) == "inf"  # Au-delà des float
+        assert gui._format_display("123456789012345.0") == "1.2346e+14"
+
+    def test_exact_backends_use_decimal(self, gui_class):
+        gui = gui_class(backend="fraction")
+        assert gui._format_display("1/3000000000000") == "3.3333e-13"
+        gui = gui_class(backend="decimal", precision=50)
+        assert gui._format_display("1.2345678901234567890123456789") == "1.2346e+0"
+
+
+def drain(gui):
+    """Attend le thread de calcul et fait tourner la boucle jusqu'au dernier résultat"""
+    for _ in range(100):
+        gui._executor.submit(lambda: None).result()  # Un seul thread : les calculs d'avant sont finis
+        gui.root.update()
+        if not gui._jobs_pending and not gui._flush_scheduled and not gui.root._scheduled:
+            return
+    raise AssertionError("la boucle ne se vide pas")
+
+
+class TestEventLoop:
+    """Tests pour le thread de calcul, le tampon clavier et le regroupement des rendus"""
+
+    def test_results_in_submission_order(self, gui_class):
+        gui = gui_class()
+        shown = []
+        show = gui._show_job_result
+        gui._show_job_result = lambda future, label: (shown.append((label, future.result())), show(future, label))
+        gui._submit(list("12+3"), "a")
+        gui._submit(["="], "b")
+        gui._on_button_click("*")  # Calcul en cours : le clic passe après, dans l'ordre
+        gui._submit(list("2="), "c")
+        drain(gui)
+        assert shown == [("a", "3"), ("b", "15.0"), ("Touche : *", "15.0"), ("c", "30.0")]
+        assert gui.display_var.get() == "30.0"
+        assert gui.status_label.cget("text") == "c"
+        assert gui._polling is False
+
+    def test_buffered_keys_flushed(self, gui_class):
+        gui = gui_class()
+        submitted = []
+        submit = gui._submit
+        gui._submit = lambda keys, label: (submitted.append(keys), submit(keys, label))
+        for char in "7*6":
+            gui._on_key(SimpleNamespace(keysym=char, char=char))
+        gui._on_key(SimpleNamespace(keysym="Return", char="\r"))
+        gui._on_key(SimpleNamespace(keysym="a", char="a"))  # Pas une touche : ignorée
+        assert len(gui._key_buffer) == 4
+        drain(gui)
+        assert submitted == [["7", "*", "6", "="]]
+        assert gui._key_buffer == []
+        assert gui.display_var.get() == "42.0"
+        # Une touche seule est un clic, sans passer par le thread de calcul
+        gui._on_key(SimpleNamespace(keysym="Escape", char=""))
+        drain(gui)
+        assert len(submitted) == 1
+        assert gui.display_var.get() == "0"
+
+    def test_paste_translation(self, gui_class):
+        gui = gui_class()
+        gui.root.clipboard_get = lambda: "1,5×4÷2 ?\n"
+        assert gui._on_paste() == "break"
+        drain(gui)
+        assert gui.display_var.get() == "3.0"
+        assert gui.status_label.cget("text") == "📋 8 touches collées"
+
+    def test_one_render_per_idle(self, gui_class):
+        gui = gui_class()
+        gui.root.update()
+        renders = []
+        display_set = gui.display_var.set
+        gui.display_var.set = lambda value: (renders.append(value), display_set(value))
+        for digit in "123":
+            gui._on_button_click(digit)
+        assert renders == []
+        gui.root.update()
+        assert renders == ["123"]
+        gui._update_display("123")  # Même valeur : rien à redessiner
+        gui.root.update()
+        assert renders == ["123"]
+
+    def test_latency_probe(self, gui_class):
+        gui = gui_class()
+        probe = sys.modules[gui_class.__module__].LatencyProbe(gui.root, interval_ms=1)
+        probe.start()
+        time.sleep(0.01)
+        gui.root.update()
+        probe.stop()
+        report = probe.report()
+        assert report["samples"] == 1
+        assert report["worst_stall_ms"] >= 5
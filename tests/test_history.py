@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour l'historique annuler/rétablir
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from calculator import Calculator
+from history import UndoHistory
+
+
+def press(calc, history, keys):
+    for key in keys:
+        calc.feed(key)
+        history.checkpoint()
+
+
+class TestUndoHistory:
+    """Tests pour UndoHistory"""
+
+    def setup_method(self):
+        self.calc = Calculator()
+        self.history = UndoHistory(self.calc, capacity=10)
+
+    def test_undo_mistaken_operation(self):
+        """On revient sur une opération tapée par erreur sans tout effacer"""
+        press(self.calc, self.history, "12*")
+        assert self.history.undo() == "12"
+        assert self.calc.operation is None
+        press(self.calc, self.history, "+3=")
+        assert self.calc.get_display_value() == "15.0"
+
+    def test_redo(self):
+        press(self.calc, self.history, "5+2=")
+        self.history.undo()
+        self.history.undo()
+        assert self.calc.get_display_value() == "5"
+        assert self.history.redo() == "2"
+        assert self.history.redo() == "7.0"
+        assert self.history.redo() is None
+
+    def test_new_input_clears_redo(self):
+        press(self.calc, self.history, "12")
+        self.history.undo()
+        press(self.calc, self.history, "3")
+        assert not self.history.can_redo
+        assert self.calc.get_display_value() == "13"
+
+    def test_unchanged_state_not_recorded(self):
+        press(self.calc, self.history, "5..")
+        assert len(self.history) == 3  # "0", "5", "5."
+
+    def test_bounded_capacity(self):
+        press(self.calc, self.history, "1234567890123")
+        assert len(self.history) == 10
+        undone = 0
+        while self.history.undo() is not None:
+            undone += 1
+        assert undone == 9
+        assert self.calc.get_display_value() == "1234"
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            UndoHistory(self.calc, capacity=1)
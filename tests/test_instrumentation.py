@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour l'instrumentation
+"""
+
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import instrumentation
+from calculator import Calculator
+
+
+@pytest.fixture
+def metrics():
+    metrics = instrumentation.enable()
+    metrics.reset()
+    yield metrics
+    instrumentation.disable()
+    metrics.reset()
+
+
+class TestInstrumentation:
+    """Tests pour enable/disable et les mesures"""
+
+    def test_counts_calls_and_errors(self, metrics):
+        calc = Calculator()
+        calc.input_number("5")
+        calc.input_operation("/")
+        calc.input_number("0")
+        assert calc.calculate_result() == "Erreur"
+        calc.input_number("4")
+        calc.apply_unary("±")
+        calc.apply_unary("√")
+
+        data = metrics.snapshot()
+        assert data["calls"]["input_number"] == 3
+        assert data["calls"]["_perform_calculation"] == 3
+        assert data["errors"] == {"erreur": 2, "division_par_zero": 1, "racine_negative": 1}
+        assert data["latency"]["input_number"]["count"] == 3
+        assert sum(data["latency"]["input_number"]["buckets"].values()) == 3
+
+    def test_disable_restores_originals(self):
+        original = Calculator.__dict__["input_number"]
+        instrumentation.enable()
+        assert Calculator.__dict__["input_number"] is not original
+        instrumentation.disable()
+        assert Calculator.__dict__["input_number"] is original
+        assert not instrumentation.is_enabled()
+
+    def test_prometheus_dump(self, metrics, tmp_path):
+        Calculator().feed("6*7=")
+        path = str(tmp_path / "metrics.prom")
+        metrics.dump(path)
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+        assert 'pycalc_calls_total{method="feed"} 1' in text
+        assert 'pycalc_latency_seconds_bucket{method="feed",le="+Inf"} 1' in text
+        assert "# TYPE pycalc_latency_seconds histogram" in text
+
+    def test_periodic_dump(self, metrics, tmp_path):
+        path = str(tmp_path / "metrics.prom")
+        metrics.start_periodic_dump(path, interval=60)
+        Calculator().input_number("1")
+        metrics.stop_periodic_dump()  # Écrit une dernière fois à l'arrêt
+        assert os.path.exists(path)
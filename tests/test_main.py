@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour le mode ligne de commande
+"""
+
+import io
+import subprocess
+import sys
+import os
+
+SRC = os.path.join(os.path.dirname(__file__), '..', 'src')
+sys.path.insert(0, SRC)
+
+from batch import iter_results
+from main import run_batch
+
+
+class TestBatchMode:
+    """Tests pour le mode sans interface graphique"""
+
+    def test_expressions(self):
+        output = io.StringIO()
+        count = run_batch(io.StringIO("3+4*2\n5/0\n\nabc(\n"), output)
+        assert count == 4
+        assert output.getvalue() == "11.0\nErreur\n\nErreur\n"
+
+    def test_keys(self):
+        results = list(iter_results(["2+3*4=\n", "5/0=\n", "1?\n"], keys=True))
+        assert results == ["20.0", "Erreur", "Erreur"]
+
+    def test_is_lazy(self):
+        """Les résultats sont produits au fil de la lecture"""
+        def lines():
+            yield "1+1"
+            raise AssertionError("ligne lue trop tôt")
+        assert next(iter_results(lines())) == "2.0"
+
+    def test_stdin_does_not_import_gui(self):
+        """Le mode --stdin n'importe jamais customtkinter"""
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", os.path.join(SRC, "main.py"), "--stdin"],
+            input="6*7\n", capture_output=True, text=True, check=True,
+        )
+        assert process.stdout == "42.0\n"
+        assert "customtkinter" not in process.stderr
+        assert "tkinter" not in process.stderr
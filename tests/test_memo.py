@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour la mémoïsation des calculs
+"""
+
+import io
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from main import run_batch
+from memo import MISSING, CalculationCache, MemoizedCalculator, SharedCalculationCache
+from parallel import run_parallel
+
+
+KEY_LINES = ["100*1.2=", "5/0=", "", "9√", "100*1.2=", "3x²+1=", "5/0="] * 20
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCalculationCache:
+    """Tests pour CalculationCache"""
+
+    def test_hit_and_miss(self):
+        cache = CalculationCache()
+        assert cache.get(100.0, 1.2, "*") is MISSING
+        cache.put(100.0, 1.2, "*", 120.0)
+        assert cache.get(100.0, 1.2, "*") == 120.0
+        assert cache.info() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "size": 1, "maxsize": 65536}
+
+    def test_error_result_cached(self):
+        cache = CalculationCache()
+        cache.put(5.0, 0.0, "/", None)
+        assert cache.get(5.0, 0.0, "/") is None
+        assert cache.hits == 1
+
+    def test_lru_eviction(self):
+        cache = CalculationCache(maxsize=2)
+        cache.put(1.0, 1.0, "+", 2.0)
+        cache.put(2.0, 2.0, "+", 4.0)
+        cache.get(1.0, 1.0, "+")  # (1, 1) devient le plus récent
+        cache.put(3.0, 3.0, "+", 6.0)
+        assert len(cache) == 2
+        assert cache.get(2.0, 2.0, "+") is MISSING
+        assert cache.get(1.0, 1.0, "+") == 2.0
+
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = CalculationCache(ttl=10, clock=clock)
+        cache.put(1.0, 1.0, "+", 2.0)
+        clock.now = 9.9
+        assert cache.get(1.0, 1.0, "+") == 2.0
+        clock.now = 10.0
+        assert cache.get(1.0, 1.0, "+") is MISSING
+        assert len(cache) == 0
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            CalculationCache(maxsize=0)
+        with pytest.raises(ValueError):
+            CalculationCache(ttl=0)
+
+
+class TestSharedCalculationCache:
+    """Tests pour SharedCalculationCache"""
+
+    def test_attach_sees_parent_entries(self):
+        with SharedCalculationCache(slots=64) as cache:
+            cache.put(100.0, 1.2, "*", 120.0)
+            cache.put(5.0, 0.0, "/", None)
+            cache.put(0.0, 9.0, "x²", 81.0)
+            with SharedCalculationCache.attach(cache.name, cache.lock) as worker:
+                assert worker.slots == 64
+                assert worker.get(100.0, 1.2, "*") == 120.0
+                assert worker.get(5.0, 0.0, "/") is None
+                assert worker.get(0.0, 9.0, "x²") == 81.0
+                assert worker.get(0.0, 9.0, "√") is MISSING
+                assert worker.info()["hits"] == 3
+
+    def test_collision_replaces_entry(self):
+        with SharedCalculationCache(slots=1) as cache:
+            cache.put(1.0, 1.0, "+", 2.0)
+            cache.put(2.0, 2.0, "+", 4.0)
+            assert cache.get(1.0, 1.0, "+") is MISSING
+            assert cache.get(2.0, 2.0, "+") == 4.0
+            assert cache.info()["size"] == 1
+            cache.clear()
+            assert cache.get(2.0, 2.0, "+") is MISSING
+
+    def test_put_publishes_even_version_last(self, monkeypatch):
+        """Le contenu est écrit sous une version impaire : jamais nouvelle clé + ancien résultat"""
+        import memo
+        with SharedCalculationCache(slots=1) as cache:
+            cache.put(1.0, 1.0, "+", 2.0)
+            published = []
+            original = memo._VERSION
+
+            class Version:
+                size = original.size
+                unpack_from = original.unpack_from
+
+                @staticmethod
+                def pack_into(buf, offset, version):
+                    if not version & 1:
+                        # Juste avant la publication : contenu complet, version impaire
+                        published.append(memo.SLOT.unpack_from(buf, offset))
+                    original.pack_into(buf, offset, version)
+
+            monkeypatch.setattr(memo, "_VERSION", Version)
+            cache.put(2.0, 2.0, "+", 4.0)
+            (version, _, prev, current, result, _), = published
+            assert version & 1 and (prev, current, result) == (2.0, 2.0, 4.0)
+            assert cache.get(2.0, 2.0, "+") == 4.0
+
+    def test_float_backend_only(self):
+        with SharedCalculationCache(slots=8) as cache:
+            with pytest.raises(ValueError):
+                MemoizedCalculator(cache, backend="decimal")
+
+
+class TestMemoizedCalculator:
+    """Tests pour MemoizedCalculator"""
+
+    @pytest.mark.parametrize("backend", ["float", "fraction"])
+    def test_same_results_as_calculator(self, backend):
+        expected = io.StringIO()
+        run_batch(io.StringIO("\n".join(KEY_LINES)), expected, keys=True, backend=backend)
+        cache = CalculationCache()
+        output = io.StringIO()
+        run_batch(io.StringIO("\n".join(KEY_LINES)), output, keys=True, backend=backend, cache=cache)
+        assert output.getvalue() == expected.getvalue()
+        assert cache.info()["hit_rate"] > 0.8
+
+    def test_decimal_keeps_trailing_zeros(self):
+        calc = MemoizedCalculator(backend="decimal")
+        assert calc.feed("1.0+1=") == "2.0"
+        calc.reset()
+        assert calc.feed("1.00+1=") == "2.00"
+
+    def test_signed_zero(self):
+        calc = MemoizedCalculator()
+        assert calc.feed(["0", "±"]) == "-0.0"
+        calc.reset()
+        assert calc.feed(["0", "±", "±"]) == "0.0"
+        calc.reset()
+        assert calc.feed(["0", "±", "*", "5", "="]) == "-0.0"
+
+    def test_cache_bound_to_one_backend(self):
+        cache = CalculationCache()
+        MemoizedCalculator(cache, "int")
+        MemoizedCalculator(cache, "int")
+        with pytest.raises(ValueError):
+            MemoizedCalculator(cache, "float")
+        decimal_cache = CalculationCache()
+        MemoizedCalculator(decimal_cache, "decimal", precision=10)
+        with pytest.raises(ValueError):
+            MemoizedCalculator(decimal_cache, "decimal", precision=50)
+
+    def test_error_from_cache(self):
+        calc = MemoizedCalculator()
+        assert calc.feed(["4", "±", "√"]) == "Erreur"
+        calc.reset()
+        assert calc.feed(["4", "±", "√"]) == "Erreur"
+        assert calc.cache.hits == 2
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_parallel_shared_cache(self, tmp_path, workers):
+        path = tmp_path / "touches.txt"
+        path.write_text("\n".join(KEY_LINES) + "\n", encoding="utf-8")
+        expected = io.StringIO()
+        run_batch(io.StringIO("\n".join(KEY_LINES) + "\n"), expected, keys=True)
+
+        output = io.BytesIO()
+        run_parallel(str(path), output, workers=workers, chunk_size=32, keys=True, memo=128)
+        assert output.getvalue().decode("utf-8") == expected.getvalue()
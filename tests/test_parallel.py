@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour l'évaluation parallèle
+"""
+
+import io
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from main import run_batch
+from parallel import run_parallel, split_chunks
+
+
+LINES = ["3+4*2", "5/0", "", "√16", "(1+2)²", "2.5*4", "abc(", "10-4-3"] * 25
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    path = tmp_path / "calculs.txt"
+    path.write_text("\n".join(LINES) + "\n", encoding="utf-8")
+    return str(path)
+
+
+class TestParallel:
+    """Tests pour split_chunks et run_parallel"""
+
+    def test_chunks_cover_file_on_line_boundaries(self, input_file):
+        chunks = split_chunks(input_file, chunk_size=50)
+        assert chunks[0][0] == 0
+        assert chunks[-1][1] == os.path.getsize(input_file)
+        with open(input_file, "rb") as f:
+            data = f.read()
+        for (_, end), (start, _) in zip(chunks, chunks[1:]):
+            assert end == start
+            assert data[end - 1:end] == b"\n"
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_same_output_as_sequential(self, input_file, workers):
+        expected = io.StringIO()
+        run_batch(io.StringIO("\n".join(LINES) + "\n"), expected)
+
+        output = io.BytesIO()
+        count = run_parallel(input_file, output, workers=workers, chunk_size=64)
+        assert count == len(LINES)
+        assert output.getvalue().decode("utf-8") == expected.getvalue()
+
+    def test_unordered_keeps_every_line(self, input_file):
+        output = io.BytesIO()
+        run_parallel(input_file, output, workers=2, chunk_size=64, ordered=False)
+        assert sorted(output.getvalue().decode("utf-8").split("\n")) == \
+            sorted(("\n".join(["11.0", "Erreur", "", "4.0", "9.0", "10.0", "Erreur", "3.0"] * 25) + "\n").split("\n"))
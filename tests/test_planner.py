@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour le planificateur de lots
+"""
+
+import io
+import pytest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from calculator import Calculator
+from batch import iter_results
+from main import parse_args, run_planned
+from memo import CalculationCache
+from planner import BatchPlanner
+
+
+def random_lines(rng, count):
+    """Séquences de touches avec beaucoup de préfixes communs"""
+    prefixes = ["12+", "12+3", "7*", "1/0", "2√", "9-4*", ""]
+    keys = "0123456789+-*/.=√"
+    return [rng.choice(prefixes) + "".join(rng.choice(keys) for _ in range(rng.randrange(6)))
+            for _ in range(count)]
+
+
+class TestBatchPlanner:
+    """Tests pour BatchPlanner"""
+
+    def test_keys_match_line_by_line(self):
+        rng = random.Random(7)
+        for backend in ("float", "fraction"):
+            lines = random_lines(rng, 300)
+            planner = BatchPlanner(keys=True, backend=backend)
+            assert planner.evaluate(lines) == list(iter_results(lines, keys=True, backend=backend))
+
+    def test_shared_prefixes_saved(self):
+        lines = ["123456789+987654321*2-" + tail for tail in ("1=", "2=", "3=", "4=")] * 2
+        planner = BatchPlanner(keys=True)
+        assert planner.evaluate(lines) == list(iter_results(lines, keys=True))
+        info = planner.info()
+        assert info["lines"] == 8
+        assert info["distinct"] == 4
+        assert info["steps_evaluated"] < info["steps"] / 2
+        assert info["saved"] > 0.5
+
+    def test_blank_and_errors(self):
+        lines = ["12+3=", "", "  ", "12+x", "1/0=", "12 + 3 ="]
+        planner = BatchPlanner(keys=True)
+        assert planner.evaluate(lines) == ["15.0", "", "", "Erreur", "Erreur", "15.0"]
+        assert planner.info()["lines"] == 4
+
+    def test_key_lists_with_memory(self):
+        # Les touches mémoire ne sont pas partagées : registres remis à zéro pour chaque ligne
+        lines = [["5", "M+", "MR", "+", "MR", "="], ["5", "MR", "="], ["5", "+", "x²", "="], "5+²="]
+        expected = []
+        for line in lines:
+            calc = Calculator()
+            expected.append(calc.feed(line))
+        planner = BatchPlanner(keys=True)
+        assert planner.evaluate(lines) == expected
+        assert expected[1] == "0.0"
+
+    def test_expressions_deduplicated(self):
+        lines = ["(1+2)*3", "(1 + 2) * 3", "", "1/0", "2**10", "(1+2)*3"]
+        planner = BatchPlanner()
+        assert planner.evaluate(lines) == list(iter_results(lines))
+        info = planner.info()
+        assert (info["lines"], info["distinct"], info["steps_evaluated"]) == (5, 3, 3)
+
+    def test_cache(self):
+        cache = CalculationCache(1024)
+        lines = ["1+2=", "3+1+2=", "1+2*4="]
+        planner = BatchPlanner(keys=True, cache=cache)
+        assert planner.evaluate(lines) == list(iter_results(lines, keys=True))
+        assert "cache_hit_rate" in planner.info()
+
+    def test_empty(self):
+        planner = BatchPlanner(keys=True)
+        assert planner.evaluate([]) == []
+        assert planner.info()["saved"] == 0.0
+
+
+class TestPlanCommandLine:
+    """Tests pour --plan"""
+
+    def test_run_planned(self):
+        output = io.StringIO()
+        info = run_planned(io.StringIO("12+3=\n12+4=\n\n12+3=\n"), output, keys=True)
+        assert output.getvalue() == "15.0\n16.0\n\n15.0\n"
+        assert info["distinct"] == 2
+
+    def test_options(self):
+        assert parse_args(["--batch", "f.txt", "--keys", "--plan"]).plan
+        for argv in (["--plan"], ["--stdin", "--plan", "--stats"], ["--batch", "f.txt", "--plan", "--workers", "2"]):
+            with pytest.raises(SystemExit):
+                parse_args(argv)
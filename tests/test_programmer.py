@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour le mode programmeur
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from programmer import ProgrammerCalculator, split_keys
+
+
+class TestProgrammerCalculator:
+    """Tests pour ProgrammerCalculator"""
+
+    def test_exact_beyond_float(self):
+        """Pas de passage par float : exact au-delà de 2^53"""
+        calc = ProgrammerCalculator(word_size=None)
+        assert calc.feed("9007199254740993+2=") == "9007199254740995"
+        assert isinstance(calc.value, int)
+        calc.feed(["AC"])
+        assert calc._value == 0 and isinstance(calc._value, int)
+
+    def test_bases(self):
+        calc = ProgrammerCalculator()
+        assert calc.feed("255") == "255"
+        assert calc.set_base(16) == "FF"
+        assert calc.set_base(8) == "377"
+        assert calc.set_base(2) == "11111111"
+        assert calc.feed(["HEX", "1"]) == "FF1"  # La saisie continue la valeur convertie
+        assert calc.feed(["AC", "a", "+", "1", "="]) == "B"
+        assert calc.feed(["DEC"]) == "11"
+
+    def test_invalid_digit(self):
+        calc = ProgrammerCalculator(base=2)
+        with pytest.raises(ValueError):
+            calc.feed("102")
+        assert calc.get_display_value() == "0"  # État inchangé
+        with pytest.raises(ValueError):
+            calc.input_number("2")
+        with pytest.raises(ValueError):
+            calc.feed(["HEX", "F", "."])
+        assert calc.base == 2
+        calc.feed(["1", "M+"])
+        with pytest.raises(ValueError):
+            calc.feed(["HEX", "F", "M+", "DEC", "2", "?"])
+        assert (calc.base, calc.get_display_value(), calc.registers) == (2, "1", {"M": 1})
+
+    def test_bitwise(self):
+        calc = ProgrammerCalculator(base=16)
+        assert calc.feed("F0 OR 0F =") == "FF"
+        assert calc.feed("AC FF & 3C =") == "3C"
+        assert calc.feed("AC FF ^ 0F =") == "F0"
+        assert calc.feed("AC 1<<8=") == "100"
+        assert calc.feed("AC 100>>4=") == "10"
+        assert calc.feed(["AC", "0", "NOT"]) == "FFFFFFFFFFFFFFFF"
+
+    def test_word_size_masking(self):
+        calc = ProgrammerCalculator(word_size=8)
+        assert calc.feed("127+1=") == "-128"
+        calc.set_base(16)
+        assert calc.get_display_value() == "80"
+        unsigned = ProgrammerCalculator(word_size=16, signed=False)
+        assert unsigned.feed("0-1=") == "65535"
+        assert unsigned.feed("AC 1<<16=") == "0"
+        assert calc.set_word_size(4) == "0"  # -128 & 0xF
+        calc.set_word_size(None)
+        assert calc.feed(["AC", "1", "<<", "4", "0", "="]) == "1" + "0" * 16  # 2^64 en HEX
+
+    def test_c_division(self):
+        assert ProgrammerCalculator().feed("7/2=") == "3"
+        assert ProgrammerCalculator().feed("7±/2=") == "-3"
+        assert ProgrammerCalculator().feed("7±%2=") == "-1"
+        assert ProgrammerCalculator().feed("5/0=") == "Erreur"
+        assert ProgrammerCalculator().feed("1<9") == "9"
+        assert ProgrammerCalculator(word_size=None).feed("1<70000=") == "Erreur"
+
+    def test_memory(self):
+        calc = ProgrammerCalculator()
+        calc.feed("40 M+ AC HEX MR")
+        assert calc.get_display_value() == "28"
+        calc.feed(["AC", "1", "M-", "MR"])
+        assert calc.get_display_value() == "27"
+
+    def test_reset_registers_restores_defaults(self):
+        calc = ProgrammerCalculator(word_size=8)
+        calc.feed("HEX FF")
+        calc.set_word_size(16)
+        calc.reset()
+        assert (calc.base, calc.word_size) == (16, 16)
+        calc.reset(registers=True)
+        assert (calc.base, calc.word_size) == (10, 8)
+
+    def test_split_keys(self):
+        assert split_keys("HEX DEC+1 AND 1<<2=") == ["HEX", "D", "E", "C", "+", "1", "AND",
+                                                       "1", "<<", "2", "="]
+
+
+class TestProgrammerGUI:
+    """Tests pour le clavier du mode programmeur"""
+
+    def test_layout_and_keys(self, gui_class):
+        gui = gui_class(programmer=True, word_size=8)
+        for key in ["HEX", "F", "F", "+", "1", "=", "64 bits", "7", "F", "AND", "2", "=", "NOT"]:
+            gui._on_button_click(key)
+        gui.root.update()
+        assert gui.display_var.get() == "FFFD"
+        assert gui.calculator.word_size == 16
+        assert gui.button_widgets["64 bits"].cget("text") == "16 bits"
+
+    def test_digits_outside_base_disabled(self, gui_class):
+        gui = gui_class(programmer=True)
+        gui._on_button_click("BIN")
+        assert gui.button_widgets["2"].cget("state") == "disabled"
+        assert gui.button_widgets["1"].cget("state") == "normal"
+        gui._on_button_click("1")
+        gui._on_button_click("2")
+        gui.root.update()
+        assert gui.display_var.get() == "1"
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour l'enregistrement et le rejeu des sessions
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from replay import Event, SessionRecorder, load_events, replay_engine, replay_gui, save_events
+
+
+SESSION = [Event(0.1 * i, key) for i, key in enumerate(
+    ["1", "2", "+", "3", "=", "√", "↶", "↷", "x²", "AC", "5", "/", "0", "=", "?"])]
+
+
+class TestReplay:
+    """Tests pour replay_engine / replay_gui"""
+
+    def test_save_and_load(self, tmp_path):
+        path = str(tmp_path / "session.jsonl")
+        events = [Event(0.0, "7", "7"), Event(0.25, "√")]
+        assert save_events(path, events) == 2
+        assert load_events(path) == events
+
+    def test_invalid_file(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        path.write_text('{"t": 0, "key": "1"}\n{"key": "2"}\n', encoding="utf-8")
+        with pytest.raises(ValueError, match=":2"):
+            load_events(str(path))
+
+    def test_engine_report(self):
+        events = [Event(0.0, "9", "9"), Event(0.1, "√", "3.0"), Event(0.2, "+", "3.0"),
+                  Event(0.3, "1", "1"), Event(0.4, "=", "5.0")]
+        report = replay_engine(events)
+        assert report["events"] == 5
+        assert report["events_per_sec"] > 0
+        assert report["latency_us"]["max"] >= report["latency_us"]["p50"] > 0
+        assert report["divergence_count"] == 1
+        assert report["divergences"] == [{"index": 4, "key": "=", "recorded": "5.0", "engine": "4.0"}]
+
+    def test_paced_replay(self):
+        events = [Event(0.0, "1"), Event(0.05, "2")]
+        assert replay_engine(events, speed=1.0)["seconds"] >= 0.05
+
+    def test_gui_matches_engine(self, gui_class):
+        report = replay_gui(gui_class(), SESSION)
+        assert report["events"] == len(SESSION)
+        assert report["divergence_count"] == 0
+
+    def test_gui_divergence_detected(self, gui_class):
+        gui = gui_class()
+        # Un bouton qui calcule dans la GUI au lieu de passer par Calculator
+        gui._handlers["x²"] = lambda: gui._update_display("4")
+        report = replay_gui(gui, [Event(0.0, "3"), Event(0.1, "x²")])
+        assert report["divergences"] == [{"index": 1, "key": "x²", "gui": "4", "engine": "9.0"}]
+
+    def test_record_then_replay(self, gui_class):
+        gui = gui_class()
+        recorder = SessionRecorder(gui).start()
+        for key in ["1", "2", "*", "3", "=", "±"]:
+            gui._on_button_click(key)
+        gui._on_undo()
+        events = recorder.stop()
+        assert [event.key for event in events] == ["1", "2", "*", "3", "=", "±", "↶"]
+        assert events[4].display == "36.0"
+        assert replay_engine(events)["divergence_count"] == 0
+        assert "_on_button_click" not in vars(gui)
+
+    def test_record_button_commands(self, gui_class):
+        """Les boutons passent par l'attribut : un clic à la souris est enregistré"""
+        gui = gui_class()
+        recorder = SessionRecorder(gui).start()
+        for key in ["1", "2", "+", "3", "="]:
+            gui.button_widgets[key].cget("command")()
+        events = recorder.stop()
+        assert [event.key for event in events] == ["1", "2", "+", "3", "="]
+        assert events[-1].display == "15.0"
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour la notation polonaise inverse
+"""
+
+import io
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from history import UndoHistory
+from main import run_batch
+from rpn import RPNCalculator, RPNStack, evaluate_rpn
+
+
+class TestRPNStack:
+    """Tests pour RPNStack"""
+
+    def test_push_pop_and_growth(self):
+        stack = RPNStack(capacity=2)
+        for value in range(10):
+            stack.push(value)
+        assert len(stack) == 10 and stack.capacity >= 10
+        assert stack.pop() == 9.0
+        assert list(stack) == [float(value) for value in range(9)]
+
+    def test_manipulations(self):
+        stack = RPNStack()
+        for value in (1, 2, 3):
+            stack.push(value)
+        stack.swap()
+        assert list(stack) == [1.0, 3.0, 2.0]
+        stack.dup()
+        stack.drop()
+        stack.roll()  # Le fond monte au sommet
+        assert list(stack) == [3.0, 2.0, 1.0]
+        stack.roll(1)
+        assert list(stack) == [3.0, 1.0, 2.0]
+
+    def test_underflow(self):
+        stack = RPNStack()
+        with pytest.raises(IndexError):
+            stack.pop()
+        stack.push(1)
+        with pytest.raises(IndexError):
+            stack.swap()
+
+    def test_bytes_round_trip(self):
+        stack = RPNStack()
+        for value in (1.5, -2.0):
+            stack.push(value)
+        other = RPNStack(capacity=1)
+        other.load_bytes(stack.to_bytes())
+        assert list(other) == [1.5, -2.0]
+
+
+class TestEvaluateRPN:
+    """Tests pour evaluate_rpn"""
+
+    def test_programs(self):
+        assert evaluate_rpn("3 4 + 2 *") == 14.0
+        assert evaluate_rpn(["2", "3", "-", "4", "/"]) == -0.25
+        assert evaluate_rpn("16 √ x² ±") == -16.0
+        assert evaluate_rpn("5 dup * 3 SWAP -") == -22.0
+        assert evaluate_rpn("1 2 3 2 roll") == 1.0
+        assert evaluate_rpn("-3 2 *") == -6.0
+
+    def test_errors(self):
+        for program in ("1 0 /", "+", "1 +", "2 ± √", "1 abc +", "", "1e300 x² x²"):
+            assert evaluate_rpn(program) is None
+
+    def test_stack_kept_before_failing_token(self):
+        stack = RPNStack()
+        assert evaluate_rpn("6 0 /", stack) is None
+        assert list(stack) == [6.0, 0.0]
+
+    def test_deep_stack(self):
+        count = 100_000
+        tokens = ["1"] * count + ["+"] * (count - 1)
+        assert evaluate_rpn(tokens) == float(count)
+
+    def test_batch(self):
+        output = io.StringIO()
+        run_batch(io.StringIO("3 4 +\n\n1 0 /\n"), output, rpn=True)
+        assert output.getvalue() == "7.0\n\nErreur\n"
+
+
+class TestRPNCalculator:
+    """Tests pour RPNCalculator (touche par touche)"""
+
+    def setup_method(self):
+        self.calc = RPNCalculator()
+
+    def test_enter_and_operations(self):
+        assert self.calc.feed(["1", "2", "ENTER", "3", "+"]) == "15.0"
+        assert self.calc.feed("4*") == "60.0"
+        assert self.calc.feed("3 4+2*") == "14.0"
+        assert list(self.calc.stack) == [60.0, 14.0]
+
+    def test_enter_duplicates(self):
+        self.calc.feed(["5", "ENTER", "ENTER", "*"])
+        assert list(self.calc.stack) == [25.0]
+
+    def test_error_keeps_operands(self):
+        assert self.calc.feed(["1", "ENTER", "0", "/"]) == "Erreur"
+        assert list(self.calc.stack) == [1.0, 0.0]
+        assert self.calc.feed(["AC", "+"]) == "Erreur"
+
+    def test_stack_keys_and_display(self):
+        self.calc.feed(["1", "ENTER", "2", "ENTER", "3"])
+        assert self.calc.visible_stack() == [1.0, 2.0]
+        self.calc.feed(["SWAP"])
+        assert self.calc.get_display_value() == "2.0"
+        assert self.calc.visible_stack() == [1.0, 3.0]
+        self.calc.feed(["ROLL", "DROP"])
+        assert list(self.calc.stack) == [3.0, 2.0]
+
+    def test_undo(self):
+        history = UndoHistory(self.calc)
+        for key in ["2", "ENTER", "3", "*"]:
+            self.calc.feed([key])
+            history.checkpoint()
+        assert history.undo() == "3"
+        assert history.undo() == "2.0"
+        assert history.redo() == "3"
+
+    def test_memory_recall_pushes(self):
+        self.calc.feed(["7", "M+", "AC", "2", "MR", "*"])
+        assert self.calc.get_display_value() == "14.0"
+
+
+class TestRPNGUI:
+    """Tests pour le mode RPN de la GUI"""
+
+    def test_enter_key_and_stack_display(self, gui_class):
+        gui = gui_class(rpn=True)
+        for key in ["3", "ENTER", "4", "+", "DUP", "5"]:
+            gui._on_button_click(key)
+        gui.root.update()
+        assert gui.display_var.get() == "5"
+        assert gui.stack_label.cget("text").splitlines()[-2:] == ["3: 7.0", "2: 7.0"]
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour les statistiques au fil de l'eau
+"""
+
+import io
+import math
+import pickle
+import random
+import statistics
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from batch import collect_stats
+from main import main
+from parallel import stats_parallel
+from running_stats import RunningStats
+
+
+class TestRunningStats:
+    """Tests pour RunningStats"""
+
+    def setup_method(self):
+        rng = random.Random(7)
+        self.values = [rng.lognormvariate(3, 1) * rng.choice((1, -1, 1)) for _ in range(20000)]
+        self.stats = RunningStats()
+        self.stats.extend(self.values)
+
+    def test_empty(self):
+        stats = RunningStats()
+        assert stats.count == 0 and stats.sum == 0.0
+        assert stats.mean is None and stats.variance() is None and stats.percentile(50) is None
+
+    def test_moments(self):
+        assert self.stats.count == len(self.values)
+        assert self.stats.sum == pytest.approx(math.fsum(self.values), rel=1e-15)
+        assert self.stats.mean == pytest.approx(statistics.fmean(self.values))
+        assert self.stats.variance() == pytest.approx(statistics.variance(self.values))
+        assert self.stats.stdev(sample=False) == pytest.approx(statistics.pstdev(self.values))
+        assert (self.stats.min, self.stats.max) == (min(self.values), max(self.values))
+
+    def test_compensated_sum(self):
+        """La somme compensée ne perd pas les petits termes"""
+        stats = RunningStats()
+        stats.extend([1e16, 1.0, -1e16] * 1000)
+        stats.extend([0.1] * 10)
+        assert stats.sum == pytest.approx(1001.0, abs=1e-12)
+
+    def test_variance_with_large_offset(self):
+        """Welford : pas d'annulation catastrophique autour d'une grande moyenne"""
+        stats = RunningStats()
+        stats.extend([1e9 + 4, 1e9 + 7, 1e9 + 13, 1e9 + 16])
+        assert stats.variance() == 30.0
+
+    def test_percentiles_within_accuracy(self):
+        ordered = sorted(self.values)
+        for q in (1, 10, 25, 50, 75, 90, 99):
+            exact = ordered[round(q / 100 * (len(ordered) - 1))]
+            assert self.stats.percentile(q) == pytest.approx(exact, rel=0.03)
+        assert self.stats.percentile(0) == ordered[0]
+        assert self.stats.percentile(100) == ordered[-1]
+        with pytest.raises(ValueError):
+            self.stats.percentile(101)
+
+    def test_memory_is_bounded(self):
+        """Le nombre de cases ne dépend pas du nombre de valeurs"""
+        stats = RunningStats(max_buckets=64)
+        stats.extend(10.0 ** (i % 200 - 100) for i in range(100000))
+        assert len(stats._positive) + len(stats._negative) <= 64
+        assert stats.percentile(99) == pytest.approx(1e97, rel=0.03)
+
+    def test_merge_equals_single_pass(self):
+        parts = [RunningStats() for _ in range(4)]
+        for i, part in enumerate(parts):
+            part.extend(self.values[i::4])
+        merged = RunningStats()
+        for part in parts:
+            merged.merge(part)
+        assert merged.count == self.stats.count
+        assert merged.sum == pytest.approx(self.stats.sum, rel=1e-15)
+        assert merged.mean == pytest.approx(self.stats.mean)
+        assert merged.variance() == pytest.approx(self.stats.variance())
+        assert merged.percentile(90) == self.stats.percentile(90)
+        assert merged.merge(RunningStats()).count == self.stats.count
+        with pytest.raises(ValueError):
+            merged.merge(RunningStats(relative_accuracy=0.05))
+
+    def test_rejects_non_finite(self):
+        stats = RunningStats()
+        with pytest.raises(ValueError):
+            stats.extend([1.0, 2.0, float("nan"), 4.0])
+        assert stats.count == 2 and stats.sum == 3.0
+
+    def test_pickle(self):
+        """Les résumés partiels traversent les processus"""
+        clone = pickle.loads(pickle.dumps(self.stats))
+        assert clone.summary() == self.stats.summary()
+
+
+class TestStatsMode:
+    """Tests pour --stats (lot, entrée standard, workers)"""
+
+    def test_collect_stats(self):
+        stats, ignored = collect_stats(io.StringIO("12.5\n\n2 * 3\nabc\n1/0\n-4\n"))
+        assert (stats.count, ignored) == (3, 2)
+        assert stats.sum == 14.5
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        path = tmp_path / "montants.txt"
+        path.write_text("".join(f"{i * 0.5}\n" for i in range(3000)) + "x\n", encoding="utf-8")
+        with open(path, encoding="utf-8") as source:
+            expected, expected_ignored = collect_stats(source)
+        for workers in (1, 2):
+            stats, ignored = stats_parallel(str(path), workers=workers, chunk_size=1000)
+            assert (stats.count, ignored) == (expected.count, expected_ignored)
+            assert stats.sum == expected.sum
+            assert stats.variance() == pytest.approx(expected.variance())
+
+    def test_cli(self, tmp_path, capsys):
+        path = tmp_path / "montants.txt"
+        path.write_text("1\n2\n3\n4\n", encoding="utf-8")
+        main(["--batch", str(path), "--stats"])
+        output = capsys.readouterr().out
+        assert "count  4" in output and "mean   2.5" in output
+        assert "ignorées" not in output
+        path.write_text("1\nabc\n1/0\n", encoding="utf-8")
+        main(["--batch", str(path), "--stats"])
+        assert "⚠️ 2 lignes ignorées" in capsys.readouterr().out
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour le serveur de calcul
+"""
+
+import asyncio
+import json
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from server import CalculatorServer, SessionPool
+
+
+class TestSessionPool:
+    """Tests pour le pool de sessions"""
+
+    def test_sessions_are_isolated(self):
+        pool = SessionPool()
+        pool.get("a").feed("12")
+        pool.get("b").feed("7")
+        assert pool.get("a").get_display_value() == "12"
+        assert pool.get("b").get_display_value() == "7"
+
+    def test_lru_eviction_recycles(self):
+        pool = SessionPool(max_sessions=1)
+        first = pool.get("a")
+        first.feed("5+")
+        recycled = pool.get("b")  # "a" est évincée et sa calculatrice recyclée
+        assert len(pool) == 1
+        assert recycled is first
+        assert recycled.get_display_value() == "0"
+        assert recycled.operation is None
+        assert pool.stats()["recycled"] == 1
+
+    def test_registers_not_shared_between_sessions(self):
+        pool = SessionPool(max_sessions=1)
+        pool.get("alice").feed(["4", "2", "M+"])
+        assert pool.get("bob").feed(["MR"]) == "0.0"
+
+    def test_ttl_eviction(self):
+        pool = SessionPool(ttl=0.0)
+        pool.get("a")
+        assert pool.evict_expired() == 1
+        assert len(pool) == 0
+
+
+class TestServer:
+    """Tests du protocole JSON ligne par ligne"""
+
+    def test_pipelined_requests(self):
+        async def scenario():
+            server = CalculatorServer()
+            port = await server.start(port=0)
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            requests = [
+                {"session": "s", "keys": "2+3"},
+                {"session": "s", "keys": "*4="},
+                {"session": "t", "keys": "5/0="},
+                {"session": "s", "reset": True},
+                {"session": "s", "keys": "1?"},
+                {"keys": "1"},
+                {"session": "s", "keys": [1]},
+                [None],
+                {"session": "s", "keys": ["4", "="]},
+            ]
+            # Toutes les requêtes partent avant de lire la moindre réponse
+            writer.write(b"".join(json.dumps(r).encode() + b"\n" for r in requests)
+                         + b"pas du json\n\xff\xfe\n" + json.dumps({"session": "s"}).encode() + b"\n")
+            await writer.drain()
+            responses = [json.loads(await reader.readline()) for _ in range(len(requests) + 3)]
+            writer.close()
+            await server.stop()
+            return responses
+
+        responses = asyncio.run(scenario())
+        assert responses[0] == {"session": "s", "display": "3"}
+        assert responses[1] == {"session": "s", "display": "20.0"}
+        assert responses[2] == {"session": "t", "display": "Erreur"}
+        assert responses[3] == {"session": "s", "display": "0"}
+        assert "error" in responses[4]
+        assert "error" in responses[5]
+        assert "error" in responses[6]
+        assert responses[7] == {"error": "requête JSON attendue"}
+        assert responses[8] == {"session": "s", "display": "4"}
+        assert responses[9] == {"error": "JSON invalide"}
+        assert responses[10] == {"error": "JSON invalide"}
+        assert responses[11] == {"session": "s", "display": "4"}  # Connexion toujours ouverte
+
+    def test_oversized_and_deeply_nested_requests(self):
+        async def scenario():
+            server = CalculatorServer(max_request_bytes=1024)
+            port = await server.start(port=0)
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            lines = [
+                json.dumps({"session": "s", "keys": "1" * 5000}).encode(),  # Trop longue
+                json.dumps({"session": "s", "keys": "2+3="}).encode(),
+                b"[" * 100_000 + b"]" * 100_000,                             # Trop longue aussi
+                b"[" * 500 + b"]" * 500,
+                json.dumps({"session": "s", "keys": "*2="}).encode(),
+            ]
+            writer.write(b"".join(line + b"\n" for line in lines))
+            await writer.drain()
+            responses = [json.loads(await reader.readline()) for _ in lines]
+            writer.close()
+            await server.stop()
+            return responses
+
+        responses = asyncio.run(scenario())
+        assert "trop longue" in responses[0]["error"]
+        assert responses[1] == {"session": "s", "display": "5.0"}
+        assert "trop longue" in responses[2]["error"]
+        assert responses[3] == {"error": "requête JSON attendue"}
+        assert responses[4] == {"session": "s", "display": "10.0"}  # Connexion toujours ouverte
+
+    def test_recursion_error_is_invalid_json(self):
+        async def scenario():
+            server = CalculatorServer()
+            port = await server.start(port=0)
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"[" * 200_000 + b"]" * 200_000 + b"\n" + json.dumps({"session": "s"}).encode() + b"\n")
+            await writer.drain()
+            responses = [json.loads(await reader.readline()) for _ in range(2)]
+            writer.close()
+            await server.stop()
+            return responses
+
+        assert asyncio.run(scenario()) == [{"error": "JSON invalide"}, {"session": "s", "display": "0"}]
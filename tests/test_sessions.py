@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour la table de sessions compacte
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from calculator import Calculator
+from sessions import SessionTable
+
+
+SEQUENCES = [
+    "5+3=",
+    "2+3*4=",
+    "2.5+1.5=",
+    "0.05*3=",
+    "5/0=",
+    "5/0+1=",
+    "9-3=2",
+    "1..5*2=",
+    "8+=4.",
+    "123456789012345678901234*2=",
+    "0.0000001+1=",
+    "7*3=+1=",
+    "9√+1=",
+    "4±√2",
+    "3²5",
+]
+
+
+class TestSessionTable:
+    """Tests pour SessionTable"""
+
+    @pytest.mark.parametrize("keys", SEQUENCES)
+    def test_matches_calculator(self, keys):
+        """Même affichage et même état que Calculator.feed, touche par touche"""
+        table = SessionTable(3)
+        calc = Calculator()
+        for key in keys:
+            assert table.feed(1, key) == calc.feed(key)
+            assert table.display(1) == calc.get_display_value()
+        restored = table.to_calculator(1)
+        assert restored.previous_value == calc.previous_value
+        assert restored.operation == calc.operation
+        assert restored.wait_for_operand == calc.wait_for_operand
+        # Les autres sessions ne bougent pas
+        assert table.display(0) == table.display(2) == "0"
+
+    def test_load_round_trip(self):
+        calc = Calculator()
+        calc.feed("12.5*")
+        table = SessionTable(1)
+        table.load(0, calc)
+        assert table.feed(0, "2=") == "25.0"
+
+    def test_release_recycles_index(self):
+        table = SessionTable()
+        first = table.add()
+        table.feed(first, "42")
+        table.release(first)
+        assert table.add() == first
+        assert table.display(first) == "0"
+        assert len(table) == 1
+
+    def test_compact(self):
+        table = SessionTable(1000)
+        assert table.nbytes() == 27 * 1000
+
+    def test_calculator_has_no_dict(self):
+        assert not hasattr(Calculator(), "__dict__")
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour la bande de calcul
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import math
+from fractions import Fraction
+
+from tape import RECORD, TapeReader, TapedCalculator, TapeWriter
+
+
+@pytest.fixture
+def tape_path(tmp_path):
+    return str(tmp_path / "bande.bin")
+
+
+def write_records(path, count, block_size=4):
+    with TapeWriter(path, block_size=block_size) as writer:
+        for i in range(count):
+            writer.append(i, 1, "+", i + 1, timestamp=1000.0 + i)
+
+
+class TestTape:
+    """Tests pour TapeWriter / TapeReader"""
+
+    def test_round_trip(self, tape_path):
+        with TapeWriter(tape_path) as writer:
+            assert writer.append(5, 3, "+", 8.0, timestamp=1.5) == 0
+            writer.append(0, 4, "√", 2.0, timestamp=2.5)
+            writer.append(1, 0, "/", None, timestamp=3.5)
+        with TapeReader(tape_path) as reader:
+            assert len(reader) == 3
+            assert reader[0] == (1.5, 5.0, 3.0, "+", 8.0)
+            assert reader[1].operation == "√"
+            assert reader[-1].result is None  # "Erreur"
+
+    def test_empty_tape(self, tape_path):
+        TapeWriter(tape_path).close()
+        with TapeReader(tape_path) as reader:
+            assert len(reader) == 0
+            assert reader.page(0) == []
+            assert list(reader.find_result(1)) == []
+
+    def test_pages_newest_first(self, tape_path):
+        write_records(tape_path, 10)
+        with TapeReader(tape_path) as reader:
+            assert [r.prev for r in reader.page(0, 4)] == [9, 8, 7, 6]
+            assert [r.prev for r in reader.page(2, 4)] == [1, 0]
+            assert [r.prev for r in reader.page(1, 4, newest_first=False)] == [4, 5, 6, 7]
+            assert reader.page(5, 4) == []
+
+    def test_time_range_lookup(self, tape_path):
+        write_records(tape_path, 10)
+        with TapeReader(tape_path) as reader:
+            # Blocs indexés + bloc en cours (8, 9) non indexé
+            assert [r.prev for r in reader.find_time_range(1003, 1008.5)] == [3, 4, 5, 6, 7, 8]
+
+    def test_result_lookup(self, tape_path):
+        write_records(tape_path, 10)
+        with TapeReader(tape_path) as reader:
+            assert [r.prev for r in reader.find_result(6)] == [5]
+            assert [r.prev for r in reader.find_result(2, 4)] == [1, 2, 3]
+
+    def test_reopen_appends(self, tape_path):
+        write_records(tape_path, 6)
+        with TapeWriter(tape_path, block_size=4) as writer:
+            assert writer.count == 6
+            writer.append(0, 0, "+", 100.0, timestamp=2000.0)
+            writer.append(0, 0, "+", -5.0, timestamp=2001.0)  # Complète le 2e bloc
+        with TapeReader(tape_path) as reader:
+            assert len(reader) == 8
+            assert [r.result for r in reader.find_result(-10, 0)] == [-5.0]
+            assert [r.prev for r in reader.find_time_range(1005, 1005)] == [5]
+
+    def test_flush_from_another_thread(self, tape_path):
+        """Panneau de la bande (boucle Tk) pendant que le thread de calcul écrit"""
+        import threading
+        writer = TapeWriter(tape_path, block_size=16, buffer_size=64)
+        thread = threading.Thread(target=lambda: [writer.append(i, 1, "+", i + 1) for i in range(5000)])
+        thread.start()
+        while thread.is_alive():
+            writer.flush()
+        writer.close()
+        with TapeReader(tape_path) as reader:
+            assert [record.result for record in reader.iter_records()] == [i + 1.0 for i in range(5000)]
+
+    def test_close_with_unfinished_generators(self, tape_path):
+        write_records(tape_path, 10)
+        with TapeReader(tape_path) as reader:
+            found = reader.find_result(3.0, 100)
+            assert next(found).prev == 2
+            times = reader.find_time_range(0, 5000)
+            records = reader.iter_records()
+            next(records)
+        # close() a réussi malgré les générateurs en cours (pas de BufferError)
+        assert reader._mmap is None
+
+    @pytest.mark.parametrize("damage", ["missing", "duplicate", "stale", "removed"])
+    def test_index_repaired_on_reopen(self, tape_path, damage):
+        write_records(tape_path, 10)  # Blocs [0, 4) et [4, 8) indexés
+        index_path = tape_path + ".idx"
+        with open(index_path, "rb") as f:
+            entries = f.read()
+        entry_size = len(entries) // 2
+        if damage == "missing":  # Arrêt avant l'écriture de la 2e entrée
+            entries = entries[:entry_size]
+        elif damage == "duplicate":
+            entries += entries[entry_size:]
+        elif damage == "stale":  # Données tronquées après l'écriture de l'index
+            with open(tape_path, "r+b") as f:
+                f.truncate(6 * RECORD.size)
+        with open(index_path, "wb") as f:
+            if damage != "removed":
+                f.write(entries)
+        with TapeWriter(tape_path, block_size=4) as writer:
+            for i in range(writer.count, 12):
+                writer.append(i, 1, "+", i + 1, timestamp=1000.0 + i)
+        with TapeReader(tape_path) as reader:
+            assert os.path.getsize(index_path) == 3 * entry_size
+            assert [r.prev for r in reader.find_result(1, 100)] == list(range(12))
+            assert [r.prev for r in reader.find_time_range(1004, 1009)] == [4, 5, 6, 7, 8, 9]
+
+    def test_truncated_record_dropped(self, tape_path):
+        write_records(tape_path, 3)
+        with open(tape_path, "ab") as f:
+            f.write(b"\x00" * (RECORD.size // 2))
+        with TapeWriter(tape_path) as writer:
+            assert writer.count == 3
+        assert os.path.getsize(tape_path) == 3 * RECORD.size
+
+
+class TestTapedCalculator:
+    """Tests pour TapedCalculator"""
+
+    def test_every_calculation_recorded(self, tape_path):
+        with TapeWriter(tape_path) as writer:
+            calc = TapedCalculator(writer)
+            calc.feed("12+3=")
+            calc.feed("√")
+            assert calc.feed("/0=") == "Erreur"
+        with TapeReader(tape_path) as reader:
+            records = list(reader.iter_records())
+        assert [(r.prev, r.operation, r.current) for r in records] == [
+            (12.0, "+", 3.0), (0.0, "√", 15.0), (15 ** 0.5, "/", 0.0)]
+        assert records[0].result == 15.0
+        assert records[-1].result is None
+
+    @pytest.mark.parametrize("backend", ["int", "fraction"])
+    def test_numbers_beyond_float_range(self, tape_path, backend):
+        with TapeWriter(tape_path) as writer:
+            calc = TapedCalculator(writer, backend)
+            assert calc.feed("9" * 400 + "+1=") == "1" + "0" * 400
+            calc.feed(["AC", "1", "/", "3", "="])
+        with TapeReader(tape_path) as reader:
+            big, third = list(reader.iter_records())
+        assert (big.prev, big.current, big.result) == (math.inf, 1.0, math.inf)
+        assert third.result == pytest.approx(float(Fraction(1, 3)))
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour les calculs vectorisés
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+np = pytest.importorskip("numpy")
+
+from calculator import Calculator
+from vectorized import perform_calculation_array, to_display
+
+
+class TestVectorized:
+    """Tests pour perform_calculation_array"""
+
+    @pytest.mark.parametrize("operation", ["+", "-", "*", "/", "√", "x²"])
+    def test_matches_scalar(self, operation):
+        """Même résultat que la version scalaire, erreurs comprises"""
+        prev = [5.0, -3.0, 0.0, 1e300, 2.5]
+        current = [3.0, 0.0, -4.0, 1e300, 0.5]
+        result = perform_calculation_array(prev, current, operation)
+
+        calc = Calculator()
+        for i, (p, c) in enumerate(zip(prev, current)):
+            expected = calc._perform_calculation(p, c, operation)
+            if expected is None:
+                assert result.mask[i]
+            else:
+                assert not np.ma.getmaskarray(result)[i]
+                assert result[i] == expected
+
+    def test_errors_as_nan(self):
+        """Les lignes en erreur deviennent NaN une fois remplies"""
+        result = perform_calculation_array([1.0, 4.0], [0.0, 2.0], "/")
+        filled = result.filled(np.nan)
+        assert np.isnan(filled[0])
+        assert filled[1] == 2.0
+
+    def test_to_display(self):
+        """Conversion en chaînes d'affichage"""
+        result = perform_calculation_array([5.0, 5.0], [3.0, 0.0], "/")
+        assert to_display(result) == [str(5.0 / 3.0), "Erreur"]
+
+    def test_unknown_operation(self):
+        """Une opération inconnue lève ValueError"""
+        with pytest.raises(ValueError):
+            perform_calculation_array([1.0], [1.0], "%")
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour les registres et la feuille de formules
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from calculator import Calculator
+from worksheet import Worksheet
+
+
+class TestRegisters:
+    """Tests pour les registres de Calculator"""
+
+    def setup_method(self):
+        self.calc = Calculator()
+
+    def test_memory_keys(self):
+        assert self.calc.feed(["1", "2", "M+", "AC", "3", "M+", "M+", "4", "M-"]) == "4"
+        assert self.calc.registers == {"M": 14.0}
+        assert self.calc.feed(["AC", "MR"]) == "14.0"
+        self.calc.feed(["MC", "MR"])
+        assert self.calc.get_display_value() == "0.0"
+
+    def test_recall_inside_calculation(self):
+        self.calc.feed(["7", "M+", "AC", "2", "*", "MR", "="])
+        assert self.calc.get_display_value() == "14.0"
+
+    def test_digit_after_recall_starts_new_number(self):
+        self.calc.feed(["5", "M+", "MR"])
+        assert self.calc.feed("3") == "3"
+
+    def test_named_registers(self):
+        self.calc.feed("19.6")
+        self.calc.store("taux")
+        self.calc.feed(["AC"])
+        assert self.calc.recall("taux") == "19.6"
+        assert self.calc.recall("inconnu") == "0.0"
+
+    def test_registers_survive_reset(self):
+        self.calc.feed(["8", "M+"])
+        self.calc.reset()
+        assert self.calc.registers == {"M": 8.0}
+
+    def test_full_reset_clears_registers(self):
+        self.calc.feed(["4", "2", "M+"])
+        self.calc.reset(registers=True)
+        assert self.calc.registers == {}
+        assert self.calc.feed(["MR"]) == "0.0"
+
+    def test_exact_backend(self):
+        calc = Calculator("fraction")
+        calc.feed(["0", ".", "1", "M+", "M+", "M+", "AC", "MR"])
+        assert calc.registers["M"] == calc.registers["M"].__class__(3, 10)
+
+
+class TestWorksheet:
+    """Tests pour Worksheet"""
+
+    def setup_method(self):
+        self.sheet = Worksheet()
+        self.sheet.set("sous_total", 100.0)
+        self.sheet.define("tva", "sous_total * 0.2")
+        self.sheet.define("total", "sous_total + tva")
+
+    def test_chain_recomputed(self):
+        assert self.sheet["total"] == 120.0
+        assert self.sheet.set("sous_total", 50.0) == 2
+        assert self.sheet["tva"] == 10.0
+        assert self.sheet["total"] == 60.0
+
+    def test_only_dependents_recomputed(self):
+        self.sheet.define("remise", "client * 0.1")
+        assert self.sheet.set("client", 10.0) == 1
+        assert self.sheet["total"] == 120.0
+
+    def test_unchanged_value_stops_propagation(self):
+        self.sheet.define("signe", "sous_total / sous_total")
+        self.sheet.define("double", "signe * 2")
+        assert self.sheet.set("sous_total", 30.0) == 3  # tva, signe, total ; pas double
+
+    def test_topological_order_on_diamond(self):
+        self.sheet.set("a", 1.0)
+        self.sheet.define("b", "a + 1")
+        self.sheet.define("c", "b * a")
+        self.sheet.define("d", "c + b")
+        self.sheet.set("a", 3.0)
+        assert (self.sheet["b"], self.sheet["c"], self.sheet["d"]) == (4.0, 12.0, 16.0)
+
+    def test_cycle_rejected(self):
+        with pytest.raises(ValueError):
+            self.sheet.define("sous_total", "total - tva")
+        with pytest.raises(ValueError):
+            self.sheet.define("x", "x + 1")
+        assert self.sheet.formulas == {"tva": "sous_total * 0.2", "total": "sous_total + tva"}
+
+    def test_errors_propagate(self):
+        self.sheet.define("ratio", "total / vide")
+        assert self.sheet["ratio"] is None  # Registre jamais rempli
+        self.sheet.set("vide", 0.0)
+        assert self.sheet["ratio"] is None  # Division par zéro
+        self.sheet.define("suite", "ratio + 1")
+        assert self.sheet["suite"] is None
+        self.sheet.set("vide", 2.0)
+        assert self.sheet["suite"] == 61.0
+
+    def test_redefine_and_remove(self):
+        self.sheet.define("tva", "sous_total * 0.055")
+        assert self.sheet["total"] == pytest.approx(105.5)
+        self.sheet.remove("tva")
+        self.sheet.set("tva", 0.0)
+        assert self.sheet["total"] == 100.0
+
+    def test_set_formula_rejected(self):
+        with pytest.raises(ValueError):
+            self.sheet.set("total", 1.0)
+
+    def test_recompute_all_matches(self):
+        self.sheet.values["sous_total"] = 10.0  # Modifié sans propagation
+        self.sheet.recompute_all()
+        assert self.sheet["total"] == 12.0
+
+    def test_shares_calculator_registers(self):
+        self.sheet.calculator.feed(["AC"])
+        assert self.sheet.calculator.recall("total") == "120.0"
+
+    def test_store_recomputes_dependents(self):
+        calc = self.sheet.calculator
+        self.sheet.define("t", "a + 1")
+        assert self.sheet["t"] is None
+        calc.feed(["AC", "4"])
+        calc.store("a")
+        assert self.sheet["t"] == 5.0
+        calc.feed(["AC", "2", "M+"])
+        self.sheet.define("m2", "M * 2")
+        calc.feed(["AC", "3", "M+"])
+        assert self.sheet["m2"] == 10.0
+        calc.clear_register()
+        assert self.sheet["m2"] is None
+
+    def test_store_to_formula_rejected(self):
+        with pytest.raises(ValueError):
+            self.sheet.calculator.store("total")
+        assert self.sheet["total"] == 120.0
+
+    def test_memory_key_to_formula_rolls_back(self):
+        sheet = Worksheet()
+        sheet.define("M", "a * 2")
+        sheet.set("a", 1.0)
+        calc = sheet.calculator
+        calc.feed("3")
+        with pytest.raises(ValueError):
+            calc.feed(["+", "4", "M+"])  # M est une formule
+        assert calc.get_display_value() == "3"
+        assert sheet["M"] == 2.0
+
+    def test_long_chain_is_linear(self):
+        sheet = Worksheet()
+        sheet.set("x0", 1.0)
+        for i in range(1, 20001):
+            sheet.define(f"x{i}", f"x{i - 1} + 1")
+        assert sheet["x20000"] == 20001.0
+        assert sheet.set("x0", 2.0) == 20000
+
+    def test_float_backend_only(self):
+        with pytest.raises(ValueError):
+            Worksheet(Calculator("decimal"))
+
+    def test_one_sheet_per_calculator(self):
+        with pytest.raises(ValueError):
+            Worksheet(self.sheet.calculator)